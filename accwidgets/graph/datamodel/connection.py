@@ -1,10 +1,20 @@
 """Module for signal based updates for the graph and implementation"""
 
-from typing import Optional, Callable, cast, Type, Sequence, Union, Any
+import abc
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from enum import IntEnum
+from typing import Optional, Callable, cast, Type, Sequence, Union, Any, List, Tuple, Deque, AsyncIterable
 from datetime import datetime
+from functools import partial
 import numpy as np
 
-from qtpy.QtCore import QObject, Signal
+from qtpy.QtCore import QObject, Signal, QTimer
 from accwidgets.graph.datamodel.datastructures import (
     DEFAULT_COLOR,
     BarCollectionData,
@@ -15,7 +25,18 @@ from accwidgets.graph.datamodel.datastructures import (
     InjectionBarCollectionData,
     InjectionBarData,
     PointData,
+    PointBatchData,
+    UniformCurveData,
+    BarBatchData,
+    InjectionBarBatchData,
+    TimestampMarkerBatchData,
+    AbstractQObjectMeta,
     PlottingItemData,
+    PlottingItemValue,
+    PointValue,
+    BarValue,
+    InjectionBarValue,
+    TimestampMarkerValue,
 )
 
 
@@ -32,6 +53,9 @@ class UpdateSource(QObject):
 
     Additionally the update source can be used to publish other updates to a
     plot, f.e. timestamps that are used by the plot as the current time.
+
+    Lightweight value types (f.e. PointValue) are all emitted through the
+    same overload sig_new_data[PlottingItemValue].
     """
 
     # TODO: Range Change Signal not used yet.
@@ -47,6 +71,12 @@ class UpdateSource(QObject):
         [InjectionBarCollectionData],
         [TimestampMarkerData],
         [TimestampMarkerCollectionData],
+        [PointBatchData],
+        [BarBatchData],
+        [InjectionBarBatchData],
+        [TimestampMarkerBatchData],
+        [UniformCurveData],
+        [PlottingItemValue],
     )
 
 
@@ -55,10 +85,12 @@ class SignalBoundDataSource(UpdateSource):
     def __init__(
             self,
             sig: Signal,
-            data_type: Optional[Type[PlottingItemData]] = None,
+            data_type: Optional[Type[Union[PlottingItemData, PlottingItemValue]]] = None,
             transformation: Optional[
-                Callable[[Sequence[Union[float, str]]], PlottingItemData]
+                Callable[[Sequence[Union[float, str]]], Union[PlottingItemData, PlottingItemValue]]
             ] = None,
+            coalesce_interval: Optional[float] = None,
+            coalesce_count: Optional[int] = None,
     ):
         """
         Convenience class for creating Update Sources for a signal
@@ -71,12 +103,22 @@ class SignalBoundDataSource(UpdateSource):
         More details about the default transformation functions can be seen
         in this classes _to_xyz() functions.
 
+        If a coalesce interval or count is passed, transformed single entries
+        (points, bars, injection bars and timestamp markers) are not emitted
+        right away, but collected and emitted together as one batch (f.e.
+        PointBatchData), as soon as the interval has passed since the first
+        collected entry or the count of collected entries is reached. Invalid
+        entries are dropped on collection. Collections are emitted right away,
+        after emitting the collected entries.
+
         Args:
             sig: Signal where the new value is coming from
             data_type: Data Type, which should be emitted by this data source
                        The data type can be None only if a transformation
                        function is given
             transformation: Optional Transformation function, which translates
+            coalesce_interval: Time in seconds, single entries are collected for
+            coalesce_count: Count of single entries that are collected at max
         """
         super().__init__(parent=None)
         data_type_specified = data_type is not None
@@ -84,14 +126,672 @@ class SignalBoundDataSource(UpdateSource):
 
         if data_type_specified == transform_specified:
             raise ValueError("You must specify either data_type or transformation")
+        if coalesce_interval is not None and coalesce_interval <= 0:
+            raise ValueError(f"The coalesce interval has to be positive, but was {coalesce_interval}.")
+        if coalesce_count is not None and coalesce_count < 1:
+            raise ValueError(f"The coalesce count has to be at least 1, but was {coalesce_count}.")
         self.transform: Callable = (transformation
                                     or PlottingItemDataFactory.get_transformation(data_type))
+        self._coalesce_count: Optional[int] = coalesce_count
+        self._coalesced_entries: List[Union[PlottingItemData, PlottingItemValue]] = []
+        self._coalesce_timer: Optional[QTimer] = None
+        if coalesce_interval is not None:
+            self._coalesce_timer = QTimer(self)
+            self._coalesce_timer.setSingleShot(True)
+            self._coalesce_timer.setInterval(int(coalesce_interval * 1000))
+            self._coalesce_timer.timeout.connect(self.flush)
         sig.connect(self._emit_point)
 
+    @property
+    def coalescing(self) -> bool:
+        """Are single entries collected and emitted together as one batch?"""
+        return self._coalesce_timer is not None or self._coalesce_count is not None
+
+    def flush(self) -> None:
+        """Emit all collected single entries right away as one batch."""
+        if self._coalesce_timer is not None:
+            self._coalesce_timer.stop()
+        entries = self._coalesced_entries
+        self._coalesced_entries = []
+        while entries:
+            # Consecutive entries of the same kind are combined to one batch
+            batch_type = _batch_type_for(entries[0])
+            count = 1
+            while count < len(entries) and _batch_type_for(entries[count]) == batch_type:
+                count += 1
+            batch = _to_batch(batch_type, entries[:count])
+            self.sig_new_data[type(batch)].emit(batch)
+            entries = entries[count:]
+
     def _emit_point(self,
                     *args: Union[float, str, Sequence[float], Sequence[str]]):
         transformed_data = self.transform(*args)
-        self.sig_new_data[type(transformed_data)].emit(transformed_data)
+        if self.coalescing and _batch_type_for(transformed_data) is not None:
+            if transformed_data.is_valid():
+                self._coalesce(transformed_data)
+            return
+        if self._coalesced_entries:
+            self.flush()
+        if isinstance(transformed_data, PlottingItemValue):
+            self.sig_new_data[PlottingItemValue].emit(transformed_data)
+        else:
+            self.sig_new_data[type(transformed_data)].emit(transformed_data)
+
+    def _coalesce(self, entry: Union[PlottingItemData, PlottingItemValue]) -> None:
+        """Collect an entry and emit all collected ones, if enough were collected."""
+        self._coalesced_entries.append(entry)
+        if self._coalesce_count is not None and len(self._coalesced_entries) >= self._coalesce_count:
+            self.flush()
+        elif self._coalesce_timer is not None and not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+
+
+class QueueOverflowPolicy(IntEnum):
+    """
+    Strategies of a ThreadedUpdateSource for new data arriving while its
+    queue is full.
+    """
+
+    BLOCK = 0
+    """The worker thread waits until the GUI thread has taken the queued data."""
+    DROP_OLDEST = 1
+    """The oldest queued samples are dropped to make room for the new ones."""
+    DECIMATE = 2
+    """Every second queued sample is dropped until the new samples fit."""
+
+
+class ThreadedUpdateSource(UpdateSource, metaclass=AbstractQObjectMeta):
+
+    def __init__(
+            self,
+            data_type: Type[PlottingItemData] = PointBatchData,
+            max_queued_samples: int = 100000,
+            overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.DROP_OLDEST,
+            frame_interval: float = 1 / 30,
+    ):
+        """
+        Base class for update sources, that acquire their data in a worker thread,
+        so acquisition and transformation do not compete with painting.
+
+        Derived classes implement :meth:`acquire`, which is called repeatedly in the
+        worker thread and returns chunks of samples as a tuple of arrays in the order
+        of the data type's constructor parameters, f.e. (x, y) for PointBatchData.
+        The chunks are put into a bounded queue, which the GUI thread drains once per
+        frame. All samples taken from the queue in one frame are emitted as one object
+        of the passed data type.
+
+        Args:
+            data_type: Collection or batch type the samples are emitted as
+            max_queued_samples: Count of samples the queue can hold, before the
+                                overflow policy is applied
+            overflow_policy: What should happen to new samples, if the queue is full
+            frame_interval: Time in seconds between two drains of the queue
+        """
+        super().__init__(parent=None)
+        if not issubclass(data_type, (CurveData, BarCollectionData, InjectionBarCollectionData,
+                                      TimestampMarkerCollectionData, PointBatchData, BarBatchData,
+                                      InjectionBarBatchData, TimestampMarkerBatchData)):
+            raise TypeError(f"Samples can not be emitted as {data_type.__name__}, since it is "
+                            f"no collection or batch type.")
+        if max_queued_samples < 1:
+            raise ValueError(f"The queue has to hold at least one sample, but max_queued_samples "
+                             f"was {max_queued_samples}.")
+        self._data_type: Type[PlottingItemData] = data_type
+        self._max_queued_samples: int = max_queued_samples
+        self._overflow_policy: QueueOverflowPolicy = overflow_policy
+        self._queue: Deque[Tuple[np.ndarray, ...]] = deque()
+        self._queued_samples: int = 0
+        self._dropped_samples: int = 0
+        # Guards the queue and its counters, which both threads access
+        self._queue_condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(int(frame_interval * 1000))
+        self._drain_timer.timeout.connect(self.drain)
+
+    @abc.abstractmethod
+    def acquire(self) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Acquire the next chunk of samples. This function is called repeatedly in
+        the worker thread and is allowed to block until new samples are available.
+
+        Returns:
+            Chunk of samples as a tuple of arrays or None, if no samples were acquired
+        """
+        pass
+
+    def start(self) -> None:
+        """Start acquiring in the worker thread and draining the queue in the GUI thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._worker.start()
+        self._drain_timer.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop acquiring and wait for the worker thread to finish.
+
+        Args:
+            timeout: Time in seconds to wait for the worker thread at max
+        """
+        self._stop_event.set()
+        with self._queue_condition:
+            self._queue_condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+        self._drain_timer.stop()
+
+    @property
+    def running(self) -> bool:
+        """Is the worker thread acquiring new samples?"""
+        return self._worker is not None and self._worker.is_alive()
+
+    @property
+    def queued_samples(self) -> int:
+        """Count of samples, that are waiting to be emitted in the GUI thread."""
+        return self._queued_samples
+
+    @property
+    def dropped_samples(self) -> int:
+        """Count of samples, that were dropped because the queue was full."""
+        return self._dropped_samples
+
+    def drain(self) -> None:
+        """Take all queued samples and emit them at once. Called by the GUI thread once per frame."""
+        with self._queue_condition:
+            chunks = list(self._queue)
+            self._queue.clear()
+            self._queued_samples = 0
+            self._queue_condition.notify_all()
+        if not chunks:
+            return
+        data = self._data_type(*_concatenated_chunks(chunks))
+        self.sig_new_data[self._data_type].emit(data)
+
+    def _run(self) -> None:
+        """Loop of the worker thread, which acquires samples until the source is stopped."""
+        while not self._stop_event.is_set():
+            chunk = self.acquire()
+            if chunk is not None:
+                self._put(tuple(np.asarray(values) for values in chunk))
+
+    def _put(self, chunk: Tuple[np.ndarray, ...]) -> None:
+        """Put a chunk into the queue and apply the overflow policy, if the queue is full."""
+        size = chunk[0].size
+        if size == 0:
+            return
+        with self._queue_condition:
+            if self._overflow_policy == QueueOverflowPolicy.BLOCK:
+                # Chunks bigger than the queue are accepted as soon as the queue is empty
+                self._queue_condition.wait_for(
+                    lambda: (self._stop_event.is_set()
+                             or self._queued_samples == 0
+                             or self._queued_samples + size <= self._max_queued_samples),
+                )
+                if self._stop_event.is_set():
+                    return
+            elif self._queued_samples + size > self._max_queued_samples:
+                if self._overflow_policy == QueueOverflowPolicy.DROP_OLDEST:
+                    self._drop_oldest(count=self._queued_samples + size - self._max_queued_samples)
+                    if size > self._max_queued_samples:
+                        self._dropped_samples += size - self._max_queued_samples
+                        chunk = tuple(values[-self._max_queued_samples:] for values in chunk)
+                        size = self._max_queued_samples
+                else:
+                    chunk = self._decimate(chunk)
+                    size = chunk[0].size
+            self._queue.append(chunk)
+            self._queued_samples += size
+
+    def _drop_oldest(self, count: int) -> None:
+        """Remove the given count of the oldest samples from the queue."""
+        while count > 0 and self._queue:
+            oldest = self._queue[0]
+            if oldest[0].size <= count:
+                self._queue.popleft()
+                removed = oldest[0].size
+            else:
+                self._queue[0] = tuple(values[count:] for values in oldest)
+                removed = count
+            count -= removed
+            self._queued_samples -= removed
+            self._dropped_samples += removed
+
+    def _decimate(self, chunk: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, ...]:
+        """
+        Combine the queued samples with the new chunk and drop every second
+        sample until all of them fit into the queue. The combined samples
+        are returned, the queue is empty afterwards.
+        """
+        combined = _concatenated_chunks([*self._queue, chunk])
+        self._queue.clear()
+        total = combined[0].size
+        while combined[0].size > self._max_queued_samples:
+            # The newest sample is always kept
+            first = (combined[0].size - 1) % 2
+            combined = tuple(values[first::2] for values in combined)
+        self._dropped_samples += total - combined[0].size
+        self._queued_samples = 0
+        return combined
+
+
+class AsyncUpdateSource(ThreadedUpdateSource):
+
+    def __init__(
+            self,
+            iterable: AsyncIterable[Any],
+            data_type: Type[PlottingItemData] = PointBatchData,
+            max_queued_samples: int = 100000,
+            frame_interval: float = 1 / 30,
+    ):
+        """
+        Update source, that consumes an async iterator in an event loop running in
+        a background thread. Everything the iterator produces until the next frame
+        is emitted as one object of the passed data type.
+
+        The iterator can produce chunks of samples as tuples of arrays in the order
+        of the data type's constructor parameters (f.e. (x, y) for PointBatchData),
+        as well as single entries or collections of the fitting kind (f.e. PointData,
+        PointValue or CurveData). If the queue is full, the iterator is not advanced
+        until the GUI thread has taken the queued samples, so a slow GUI throttles
+        the producer instead of piling up samples.
+
+        Args:
+            iterable: Async iterable producing the data
+            data_type: Collection or batch type the samples are emitted as
+            max_queued_samples: Count of samples the queue can hold, before the
+                                iterator is not advanced anymore
+            frame_interval: Time in seconds between two drains of the queue
+        """
+        super().__init__(
+            data_type=data_type,
+            max_queued_samples=max_queued_samples,
+            overflow_policy=QueueOverflowPolicy.BLOCK,
+            frame_interval=frame_interval,
+        )
+        self._iterable: AsyncIterable[Any] = iterable
+        self._field_names: Tuple[Tuple[str, ...], Tuple[str, ...]] = _field_names_for(data_type)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._consumer: Optional[asyncio.Future] = None
+
+    def acquire(self) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Not used, the iterator is consumed by the event loop in the background
+        thread, which puts the samples into the queue itself.
+        """
+        return None
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop consuming the iterator and wait for the background thread to finish.
+
+        Args:
+            timeout: Time in seconds to wait for the background thread at max
+        """
+        self._stop_event.set()
+        loop, consumer = self._loop, self._consumer
+        if loop is not None and consumer is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(consumer.cancel)
+            except RuntimeError:
+                # The loop was closed in the meantime
+                pass
+        super().stop(timeout=timeout)
+
+    def _run(self) -> None:
+        """Run an event loop in the background thread until the iterator is exhausted or the source is stopped."""
+        loop = asyncio.new_event_loop()
+        # Chunks are put into the queue one after another, so one thread is enough
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{type(self).__name__}Executor")
+        self._loop = loop
+        try:
+            self._consumer = asyncio.ensure_future(self._consume(executor), loop=loop)
+            loop.run_until_complete(self._consumer)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._consumer = None
+            self._loop = None
+            executor.shutdown(wait=True)
+            loop.close()
+
+    async def _consume(self, executor: Executor) -> None:
+        """Put everything the iterator produces into the queue."""
+        loop = asyncio.get_event_loop()
+        async for item in self._iterable:
+            if self._stop_event.is_set():
+                break
+            chunk = self._to_chunk(item)
+            # Waiting for space in the queue happens outside the loop, so other
+            # tasks on the loop keep running while the producer is throttled
+            await loop.run_in_executor(executor, self._put, chunk)
+
+    def _to_chunk(self, item: Any) -> Tuple[np.ndarray, ...]:
+        """Turn an item produced by the iterator into a chunk of samples."""
+        if isinstance(item, tuple):
+            return tuple(np.asarray(values) for values in item)
+        collection_fields, entry_fields = self._field_names
+        # Points and curves share their attribute names, so single values are made 1D
+        if all(hasattr(item, name) for name in collection_fields):
+            return tuple(np.atleast_1d(getattr(item, name)) for name in collection_fields)
+        if all(hasattr(item, name) for name in entry_fields):
+            return tuple(np.array([getattr(item, name)]) for name in entry_fields)
+        raise TypeError(f"{type(item).__name__} can not be emitted as {self._data_type.__name__}.")
+
+
+_RING_HEADER_FIELDS: int = 3
+"""Header of a shared memory ring: capacity, claimed and written sequence number as int64."""
+
+
+class SharedMemoryRingWriter:
+
+    def __init__(self, name: Optional[str] = None, capacity: int = 100000):
+        """
+        Producer side of a ring buffer in shared memory, which can be read by a
+        :class:`SharedMemoryRingSource` in another local process without
+        serializing the samples.
+
+        The shared memory starts with a header holding the capacity and two
+        sequence numbers, followed by the x and the y values of the ring. The
+        claimed sequence number (count of all samples, whose writing has started)
+        is updated before the samples are written, the written sequence number
+        (count of all samples written completely) afterwards. So a reader never
+        sees samples, that are not written completely, and can detect samples
+        being overwritten while it copies them.
+
+        Args:
+            name: Name of the shared memory, a unique name is generated if None
+            capacity: Count of samples the ring can hold, it should hold the
+                      samples of several frames of the reading side
+        """
+        try:
+            from multiprocessing import shared_memory  # type: ignore
+        except ImportError:  # Python < 3.8
+            raise ImportError("Shared memory rings require multiprocessing.shared_memory (Python 3.8 or newer).")
+        if capacity < 1:
+            raise ValueError(f"The ring has to hold at least one sample, but capacity was {capacity}.")
+        self._shm = shared_memory.SharedMemory(
+            name=name,
+            create=True,
+            size=(_RING_HEADER_FIELDS + 2 * capacity) * np.dtype(np.int64).itemsize,
+        )
+        self._header, self._values = _ring_views(cast(memoryview, self._shm.buf), capacity)
+        self._header[:] = (capacity, 0, 0)
+        self._capacity: int = capacity
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory, which the reading side attaches to."""
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """Count of samples the ring can hold."""
+        return self._capacity
+
+    @property
+    def sequence(self) -> int:
+        """Count of all samples written so far."""
+        return int(self._header[2])
+
+    def write(self, x: Sequence[float], y: Sequence[float]) -> None:
+        """
+        Write samples into the ring. If more samples are passed than the ring can
+        hold, only the newest ones are written.
+
+        Args:
+            x: X values of the samples
+            y: Y values of the samples
+        """
+        x_values = np.asarray(x, dtype=np.float64).ravel()
+        y_values = np.asarray(y, dtype=np.float64).ravel()
+        if x_values.size != y_values.size:
+            raise ValueError(f"The count of x values ({x_values.size}) and y values ({y_values.size}) "
+                             f"are not equal.")
+        count = x_values.size
+        if count == 0:
+            return
+        sequence = int(self._header[2])
+        samples = np.vstack((x_values, y_values))[:, -self._capacity:]
+        start = (sequence + count - samples.shape[1]) % self._capacity
+        first = min(samples.shape[1], self._capacity - start)
+        self._header[1] = sequence + count
+        self._values[:, start:start + first] = samples[:, :first]
+        self._values[:, :samples.shape[1] - first] = samples[:, first:]
+        self._header[2] = sequence + count
+
+    def close(self, unlink: bool = True) -> None:
+        """
+        Detach from the shared memory.
+
+        Args:
+            unlink: Free the shared memory, readers can not attach to it anymore
+        """
+        # Views on the buffer have to be released before it can be closed
+        del self._header
+        del self._values
+        self._shm.close()
+        if unlink:
+            if _attaching_registers_shared_memory():
+                # A source attached in this process has removed the memory from this
+                # process' resource tracker, which expects it when it is unlinked
+                from multiprocessing import resource_tracker  # type: ignore
+                resource_tracker.register(_tracked_name(self._shm.name), "shared_memory")
+            self._shm.unlink()
+
+
+class SharedMemoryRingSource(UpdateSource):
+
+    def __init__(self, name: str, frame_interval: float = 1 / 30):
+        """
+        Update source, that reads the samples a :class:`SharedMemoryRingWriter`
+        writes into shared memory, f.e. from an acquisition running in another
+        process. The ring is polled once per frame and new samples are copied
+        out of the ring in one go and emitted as PointBatchData.
+
+        If the writer wrote more samples between two polls than the ring can hold,
+        or overwrote samples while they were copied, the overwritten ones are
+        dropped and counted in :attr:`dropped_samples`.
+
+        Args:
+            name: Name of the shared memory the writer created
+            frame_interval: Time in seconds between two polls of the ring
+        """
+        super().__init__(parent=None)
+        try:
+            from multiprocessing import shared_memory  # type: ignore
+        except ImportError:  # Python < 3.8
+            raise ImportError("Shared memory rings require multiprocessing.shared_memory (Python 3.8 or newer).")
+        if sys.version_info >= (3, 13):
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        if _attaching_registers_shared_memory():
+            # Attaching registers the memory with the resource tracker as if this process
+            # had created it, which would unlink it when this process exits (bpo-38119)
+            from multiprocessing import resource_tracker  # type: ignore
+            resource_tracker.unregister(_tracked_name(self._shm.name), "shared_memory")
+        buffer = cast(memoryview, self._shm.buf)
+        capacity = int(np.ndarray((1,), dtype=np.int64, buffer=buffer)[0])
+        self._header, self._values = _ring_views(buffer, capacity)
+        self._capacity: int = capacity
+        # Samples, that are still in the ring, are delivered on the first poll
+        self._read_sequence: int = max(0, int(self._header[2]) - capacity)
+        self._dropped_samples: int = 0
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(int(frame_interval * 1000))
+        self._poll_timer.timeout.connect(self.poll)
+
+    def start(self) -> None:
+        """Start polling the ring once per frame."""
+        self._poll_timer.start()
+
+    def stop(self) -> None:
+        """Stop polling the ring."""
+        self._poll_timer.stop()
+
+    @property
+    def running(self) -> bool:
+        """Is the ring polled once per frame?"""
+        return self._poll_timer.isActive()
+
+    @property
+    def dropped_samples(self) -> int:
+        """Count of samples, that were overwritten before they were read."""
+        return self._dropped_samples
+
+    def poll(self) -> None:
+        """Emit all samples written since the last poll. Called by the GUI thread once per frame."""
+        sequence = int(self._header[2])
+        count = sequence - self._read_sequence
+        if count <= 0:
+            return
+        if count > self._capacity:
+            self._dropped_samples += count - self._capacity
+            count = self._capacity
+        start = (sequence - count) % self._capacity
+        self._read_sequence = sequence
+        first = min(count, self._capacity - start)
+        samples = np.concatenate((self._values[:, start:start + first], self._values[:, :count - first]), axis=1)
+        # Samples, whose slots the writer has started to write in the meantime, might be torn
+        overwritten = min(max(int(self._header[1]) - self._capacity - (sequence - count), 0), count)
+        self._dropped_samples += overwritten
+        if overwritten < count:
+            data = PointBatchData(x=samples[0, overwritten:], y=samples[1, overwritten:])
+            self.sig_new_data[PointBatchData].emit(data)
+
+    def close(self) -> None:
+        """Stop polling and detach from the shared memory."""
+        self.stop()
+        del self._header
+        del self._values
+        self._shm.close()
+
+
+class ReplaySource(UpdateSource):
+
+    def __init__(
+            self,
+            path: str,
+            data_type: Type[PlottingItemData] = PointBatchData,
+            speed: Optional[float] = 1.0,
+            frame_interval: float = 1 / 30,
+            samples_per_frame: int = 1000,
+    ):
+        """
+        Update source, that replays a recorded stream of a single channel, f.e. to
+        reproduce the load of a real device on a machine without access to it.
+        Samples are emitted once per frame as an object of the passed data type,
+        after them the timestamp the replay has reached is emitted. The sequence
+        of emitted samples does only depend on the recording, not on the timing.
+
+        A recording is either a .npy file with a two dimensional numeric array,
+        whose rows are the data type's constructor parameters (f.e. x and y for
+        PointBatchData), which is memory mapped instead of loaded completely, or
+        a .npz archive with one array per constructor parameter, named after it
+        (f.e. x, y and heights for BarBatchData). The x values are the timestamps
+        of the samples and have to be ascending.
+
+        Args:
+            path: Path to the .npy or .npz file holding the recording
+            data_type: Collection or batch type the samples are emitted as
+            speed: Factor the recording is replayed faster than it was recorded,
+                   1.0 replays in real time, None replays as fast as possible
+            frame_interval: Time in seconds between two emissions
+            samples_per_frame: Count of samples emitted per frame, if the
+                               recording is replayed as fast as possible
+        """
+        super().__init__(parent=None)
+        if speed is not None and speed <= 0:
+            raise ValueError(f"The replay speed has to be positive, but was {speed}.")
+        if samples_per_frame < 1:
+            raise ValueError(f"At least one sample has to be emitted per frame, but samples_per_frame "
+                             f"was {samples_per_frame}.")
+        self._data_type: Type[PlottingItemData] = data_type
+        self._fields: Tuple[np.ndarray, ...] = _load_recording(path, _field_names_for(data_type)[0])
+        timestamps = self._fields[0]
+        if timestamps.size > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+            raise ValueError(f"The timestamps in {path} are not ascending.")
+        self._speed: Optional[float] = speed
+        self._samples_per_frame: int = samples_per_frame
+        self._position: int = 0
+        self._replayed_time: float = 0.0
+        self._started_at: Optional[float] = None
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(0 if speed is None else int(frame_interval * 1000))
+        self._frame_timer.timeout.connect(self._replay_frame)
+
+    def start(self) -> None:
+        """Start or continue the replay."""
+        if self.running or self.finished:
+            return
+        self._started_at = time.monotonic()
+        self._frame_timer.start()
+
+    def stop(self) -> None:
+        """Pause the replay, it continues at the same position when it is started again."""
+        if self._started_at is not None:
+            self._replayed_time = self._replay_time()
+            self._started_at = None
+        self._frame_timer.stop()
+
+    @property
+    def running(self) -> bool:
+        """Is the recording replayed right now?"""
+        return self._frame_timer.isActive()
+
+    @property
+    def finished(self) -> bool:
+        """Were all samples of the recording emitted?"""
+        return self._position >= self._fields[0].size
+
+    @property
+    def position(self) -> int:
+        """Index of the next sample of the recording, that will be emitted."""
+        return self._position
+
+    def step(self, until: Optional[float] = None) -> None:
+        """
+        Emit the next samples of the recording. Called once per frame while the
+        replay is running, but can also be called directly to replay frame by frame.
+
+        Args:
+            until: Emit all samples with timestamps up to this one, if None,
+                   the next samples_per_frame samples are emitted
+        """
+        timestamps = self._fields[0]
+        if until is None:
+            end = min(self._position + self._samples_per_frame, timestamps.size)
+        else:
+            end = max(int(np.searchsorted(timestamps, until, side="right")), self._position)
+        if end > self._position:
+            data = self._data_type(*(values[self._position:end] for values in self._fields))
+            self._position = end
+            self.sig_new_data[self._data_type].emit(data)
+        if until is None:
+            if end == 0:
+                return
+            until = float(timestamps[end - 1])
+        self.sig_new_timestamp.emit(until)
+
+    def _replay_frame(self) -> None:
+        """Emit the samples of one frame and stop the replay, if the recording is finished."""
+        if self._speed is None:
+            self.step()
+        else:
+            self.step(until=float(self._fields[0][0]) + self._replay_time())
+        if self.finished:
+            self.stop()
+
+    def _replay_time(self) -> float:
+        """Time in seconds of the recording, that was replayed until now."""
+        if self._started_at is None or self._speed is None:
+            return self._replayed_time
+        return self._replayed_time + (time.monotonic() - self._started_at) * self._speed
 
 
 class PlottingItemDataFactory:
@@ -104,18 +804,37 @@ class PlottingItemDataFactory:
 
     @staticmethod
     def get_transformation(
-            data_type: Optional[Type[PlottingItemData]],
-    ) -> Callable[[], PlottingItemData]:
+            data_type: Optional[Type[Union[PlottingItemData, PlottingItemValue]]],
+    ) -> Callable[..., Union[PlottingItemData, PlottingItemValue]]:
         """
         Try to transform the given *args to the desired data structure.
         This allows easier transformation between raw values coming from
         the signal and a data structure which can be interpreted by the
-        graphs.
+        graphs. Lightweight value types are created with the same argument
+        conventions as their QObject based counterparts.
 
         Raises:
             IndexError: Not enough arguments were passed for the data type.
         """
         if data_type is not None:
+            if issubclass(data_type, PointValue):
+                return partial(PlottingItemDataFactory._to_point, data_type=data_type)
+            if issubclass(data_type, BarValue):
+                return partial(PlottingItemDataFactory._to_bar, data_type=data_type)
+            if issubclass(data_type, InjectionBarValue):
+                return partial(PlottingItemDataFactory._to_injection_bar, data_type=data_type)
+            if issubclass(data_type, TimestampMarkerValue):
+                return partial(PlottingItemDataFactory._to_ts_marker, data_type=data_type)
+            if issubclass(data_type, UniformCurveData):
+                return partial(PlottingItemDataFactory._to_uniform_curve, data_type=data_type)
+            if issubclass(data_type, PointBatchData):
+                return partial(PlottingItemDataFactory._to_curve, data_type=data_type)
+            if issubclass(data_type, BarBatchData):
+                return partial(PlottingItemDataFactory._to_bar_collection, data_type=data_type)
+            if issubclass(data_type, InjectionBarBatchData):
+                return partial(PlottingItemDataFactory._to_injection_bar_collection, data_type=data_type)
+            if issubclass(data_type, TimestampMarkerBatchData):
+                return partial(PlottingItemDataFactory._to_ts_marker_collection, data_type=data_type)
             if issubclass(data_type, PointData):
                 return PlottingItemDataFactory._to_point
             if issubclass(data_type, BarData):
@@ -136,28 +855,37 @@ class PlottingItemDataFactory:
                         f"for data type '{data_type}'")
 
     @staticmethod
-    def _to_point(*args: float) -> PointData:
-        args = PlottingItemDataFactory._unwrapped(*args)
-        return PointData(
+    def _to_point(
+            *args: float,
+            data_type: Type[Union[PointData, PointValue]] = PointData,
+    ) -> Union[PointData, PointValue]:
+        arguments = PlottingItemDataFactory._unwrapped(*args)
+        return data_type(
             x=PlottingItemDataFactory._or_now(index=1,
-                                              args=args),
-            y=args[0],  # mandatory
+                                              args=arguments),
+            y=arguments[0],  # mandatory
         )
 
     @staticmethod
-    def _to_bar(*args: float) -> BarData:
-        args = PlottingItemDataFactory._unwrapped(*args)
-        return BarData(
+    def _to_bar(
+            *args: float,
+            data_type: Type[Union[BarData, BarValue]] = BarData,
+    ) -> Union[BarData, BarValue]:
+        arguments = PlottingItemDataFactory._unwrapped(*args)
+        return data_type(
             x=PlottingItemDataFactory._or_now(index=2,
-                                              args=args),
+                                              args=arguments),
             y=PlottingItemDataFactory._or(index=1,
-                                          args=args,
+                                          args=arguments,
                                           default=0),
-            height=args[0],  # mandatory
+            height=arguments[0],  # mandatory
         )
 
     @staticmethod
-    def _to_injection_bar(*args: Union[float, str]) -> InjectionBarData:
+    def _to_injection_bar(
+            *args: Union[float, str],
+            data_type: Type[Union[InjectionBarData, InjectionBarValue]] = InjectionBarData,
+    ) -> Union[InjectionBarData, InjectionBarValue]:
         """
         **Attention**: String parameters will automatically set as label,
         no matter where they are positioned.
@@ -168,7 +896,7 @@ class PlottingItemDataFactory:
         if str_param:
             label = str_param[0]
             arguments.remove(label)
-        return InjectionBarData(
+        return data_type(
             x=PlottingItemDataFactory._or_now(index=3,
                                               args=arguments),
             y=PlottingItemDataFactory._or(index=1,
@@ -182,52 +910,81 @@ class PlottingItemDataFactory:
         )
 
     @staticmethod
-    def _to_ts_marker(*args: Union[float, str]) -> TimestampMarkerData:
-        args = PlottingItemDataFactory._unwrapped(*args)
-        return TimestampMarkerData(
+    def _to_ts_marker(
+            *args: Union[float, str],
+            data_type: Type[Union[TimestampMarkerData, TimestampMarkerValue]] = TimestampMarkerData,
+    ) -> Union[TimestampMarkerData, TimestampMarkerValue]:
+        arguments = PlottingItemDataFactory._unwrapped(*args)
+        return data_type(
             x=PlottingItemDataFactory._or_now(index=0,
-                                              args=args),
+                                              args=arguments),
             color=PlottingItemDataFactory._or(index=2,
-                                              args=args,
+                                              args=arguments,
                                               default=DEFAULT_COLOR),
             label=PlottingItemDataFactory._or(index=1,
-                                              args=args,
+                                              args=arguments,
                                               default=""),
         )
 
     @staticmethod
-    def _to_curve(*args: Sequence[float]) -> CurveData:
-        args = PlottingItemDataFactory._collection_unwrapped(*args)
-        return CurveData(
+    def _to_curve(
+            *args: Sequence[float],
+            data_type: Type[Union[CurveData, PointBatchData]] = CurveData,
+    ) -> Union[CurveData, PointBatchData]:
+        arguments = PlottingItemDataFactory._collection_unwrapped(*args)
+        return data_type(
             x=PlottingItemDataFactory._or_num_range(index=1,
-                                                    args=args),
-            y=args[0],
+                                                    args=arguments),
+            y=arguments[0],
+        )
+
+    @staticmethod
+    def _to_uniform_curve(
+            *args: Union[Sequence[float], float],
+            data_type: Type[UniformCurveData] = UniformCurveData,
+    ) -> UniformCurveData:
+        """
+        Arguments are the y values, the x value of the first point
+        (default 0) and the distance between the points (default 1).
+        """
+        arguments = PlottingItemDataFactory._collection_unwrapped(*args)
+        return data_type(
+            y=cast(Sequence[float], arguments[0]),  # mandatory
+            x0=float(PlottingItemDataFactory._or(index=1,
+                                                 args=arguments,
+                                                 default=0.0)),
+            dx=float(PlottingItemDataFactory._or(index=2,
+                                                 args=arguments,
+                                                 default=1.0)),
         )
 
     @staticmethod
-    def _to_bar_collection(*args: Sequence[float]) -> BarCollectionData:
-        args = PlottingItemDataFactory._collection_unwrapped(*args)
-        return BarCollectionData(
+    def _to_bar_collection(
+            *args: Sequence[float],
+            data_type: Type[Union[BarCollectionData, BarBatchData]] = BarCollectionData,
+    ) -> Union[BarCollectionData, BarBatchData]:
+        arguments = PlottingItemDataFactory._collection_unwrapped(*args)
+        return data_type(
             x=PlottingItemDataFactory._or_num_range(index=2,
-                                                    args=args),
+                                                    args=arguments),
             y=PlottingItemDataFactory._or_array(index=1,
-                                                args=args,
+                                                args=arguments,
                                                 default=0),
-            heights=args[0],
+            heights=arguments[0],
         )
 
     @staticmethod
     def _to_injection_bar_collection(
             *args: Sequence[Union[float, str]],
-    ) -> InjectionBarCollectionData:
+            data_type: Type[Union[InjectionBarCollectionData, InjectionBarBatchData]] = InjectionBarCollectionData,
+    ) -> Union[InjectionBarCollectionData, InjectionBarBatchData]:
         arguments = PlottingItemDataFactory._collection_unwrapped(*args)
-        label = np.zeros(len(arguments[0]), str)
-        string_params = [i for i in arguments
-                         if not any((not isinstance(j, str) for j in i))]
-        if string_params:
-            label = string_params[0]
-            arguments.remove(label)
-        return InjectionBarCollectionData(
+        label_index = next((index for index, column in enumerate(arguments) if _is_string_column(column)), None)
+        if label_index is None:
+            label = np.full(arguments[0].shape, "")
+        else:
+            label = arguments.pop(label_index)
+        return data_type(
             x=PlottingItemDataFactory._or_num_range(index=3,
                                                     args=arguments),
             y=PlottingItemDataFactory._or_array(index=1,
@@ -243,15 +1000,16 @@ class PlottingItemDataFactory:
     @staticmethod
     def _to_ts_marker_collection(
             *args: Sequence[Union[float, str]],
-    ) -> TimestampMarkerCollectionData:
-        args = PlottingItemDataFactory._collection_unwrapped(*args)
-        return TimestampMarkerCollectionData(
-            x=cast(Sequence[float], args[0]),  # mandatory
+            data_type: Type[Union[TimestampMarkerCollectionData, TimestampMarkerBatchData]] = TimestampMarkerCollectionData,
+    ) -> Union[TimestampMarkerCollectionData, TimestampMarkerBatchData]:
+        arguments = PlottingItemDataFactory._collection_unwrapped(*args)
+        return data_type(
+            x=cast(Sequence[float], arguments[0]),  # mandatory
             colors=PlottingItemDataFactory._or_array(index=2,
-                                                     args=args,
+                                                     args=arguments,
                                                      default=DEFAULT_COLOR),
             labels=PlottingItemDataFactory._or_array(index=1,
-                                                     args=args,
+                                                     args=arguments,
                                                      default=""),
         )
 
@@ -268,7 +1026,7 @@ class PlottingItemDataFactory:
 
     @staticmethod
     def _or_num_range(index: int,
-                      args: Sequence[Sequence[float]]) -> Sequence[float]:
+                      args: Sequence[np.ndarray]) -> Sequence[float]:
         """Either the value at the given index or a range from 0 to the length
         as one of the entries in args."""
         return PlottingItemDataFactory._or(index,
@@ -276,13 +1034,14 @@ class PlottingItemDataFactory:
                                            np.arange(0, len(args[0])))
 
     @staticmethod
-    def _or_array(index: int, args: Sequence[Any], default: Any) -> Any:
-        """Return either the value in args at the given index or and array made
-        from the passed default value (same length as other args entries)."""
+    def _or_array(index: int, args: Sequence[np.ndarray], default: Any) -> np.ndarray:
+        """Return either the value in args at the given index or an array
+        filled with the passed default value (same length as other args
+        entries)."""
         try:
             return args[index]
         except IndexError:
-            return np.array([default for _ in range(len(args[0]))])
+            return np.full(args[0].shape, default)
 
     @staticmethod
     def _or(index: int, args: Sequence[Any], default: Any) -> Any:
@@ -291,24 +1050,144 @@ class PlottingItemDataFactory:
         try:
             return args[index]
         except IndexError:
-            if isinstance(default, float) and np.isnan(default):
-                print(index)
-                print(args)
-                print(default)
             return default
 
     @staticmethod
-    def _unwrapped(*args):
-        if len(args) == 1 and isinstance(args[0], (Sequence, np.ndarray)):
+    def _unwrapped(*args) -> List[Any]:
+        if len(args) == 1 and isinstance(args[0], np.ndarray):
+            return args[0].tolist()
+        if len(args) == 1 and isinstance(args[0], Sequence):
             return list(args[0])
         return list(args)
 
     @staticmethod
-    def _collection_unwrapped(*args):
+    def _collection_unwrapped(*args) -> List[np.ndarray]:
+        """Columns of the passed collection as arrays. Columns, which
+        already are arrays, are not copied (f.e. rows of a 2D array)."""
+        columns: Union[Sequence[Any], np.ndarray] = args
         if (
                 len(args) == 1
                 and isinstance(args[0], (Sequence, np.ndarray))
                 and isinstance(args[0][0], (Sequence, np.ndarray))
         ):
-            return list(args[0])
-        return list(args)
+            columns = args[0]
+        return [np.asarray(column) for column in columns]
+
+
+def _batch_type_for(entry: Any) -> Optional[Type[PlottingItemData]]:
+    """Batch type single entries of the type of the passed one can be combined to."""
+    if isinstance(entry, (PointData, PointValue)):
+        return PointBatchData
+    if isinstance(entry, (BarData, BarValue)):
+        return BarBatchData
+    if isinstance(entry, (InjectionBarData, InjectionBarValue)):
+        return InjectionBarBatchData
+    if isinstance(entry, (TimestampMarkerData, TimestampMarkerValue)):
+        return TimestampMarkerBatchData
+    return None
+
+
+def _to_batch(batch_type: Optional[Type[PlottingItemData]], entries: List[Any]) -> PlottingItemData:
+    """Combine single entries of the same kind to a batch of the given type."""
+    if batch_type is PointBatchData:
+        return PointBatchData(
+            x=np.fromiter((entry.x for entry in entries), dtype=float, count=len(entries)),
+            y=np.fromiter((entry.y for entry in entries), dtype=float, count=len(entries)),
+        )
+    if batch_type is BarBatchData:
+        return BarBatchData(
+            x=np.fromiter((entry.x for entry in entries), dtype=float, count=len(entries)),
+            y=np.fromiter((entry.y for entry in entries), dtype=float, count=len(entries)),
+            heights=np.fromiter((entry.height for entry in entries), dtype=float, count=len(entries)),
+        )
+    if batch_type is InjectionBarBatchData:
+        return InjectionBarBatchData(
+            x=np.fromiter((entry.x for entry in entries), dtype=float, count=len(entries)),
+            y=np.fromiter((entry.y for entry in entries), dtype=float, count=len(entries)),
+            heights=np.fromiter((entry.height for entry in entries), dtype=float, count=len(entries)),
+            widths=np.fromiter((entry.width for entry in entries), dtype=float, count=len(entries)),
+            labels=np.array([entry.label for entry in entries]),
+        )
+    if batch_type is TimestampMarkerBatchData:
+        return TimestampMarkerBatchData(
+            x=np.fromiter((entry.x for entry in entries), dtype=float, count=len(entries)),
+            colors=np.array([entry.color for entry in entries]),
+            labels=np.array([entry.label for entry in entries]),
+        )
+    raise TypeError(f"Entries can not be combined to a batch of type {batch_type}.")
+
+
+def _concatenated_chunks(chunks: Sequence[Tuple[np.ndarray, ...]]) -> Tuple[np.ndarray, ...]:
+    """Concatenate each array of the passed chunks with the same arrays of the other chunks."""
+    if len(chunks) == 1:
+        return chunks[0]
+    return tuple(np.concatenate(values) for values in zip(*chunks))
+
+
+def _field_names_for(data_type: Type[PlottingItemData]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Attributes of collections and single entries of the passed collection
+    or batch type, in the order of the type's constructor parameters.
+    """
+    if issubclass(data_type, (CurveData, PointBatchData)):
+        return ("x", "y"), ("x", "y")
+    if issubclass(data_type, (BarCollectionData, BarBatchData)):
+        return ("x", "y", "heights"), ("x", "y", "height")
+    if issubclass(data_type, (InjectionBarCollectionData, InjectionBarBatchData)):
+        return ("x", "y", "heights", "widths", "labels"), ("x", "y", "height", "width", "label")
+    if issubclass(data_type, (TimestampMarkerCollectionData, TimestampMarkerBatchData)):
+        return ("x", "colors", "labels"), ("x", "color", "label")
+    raise TypeError(f"{data_type.__name__} is no collection or batch type.")
+
+
+def _attaching_registers_shared_memory() -> bool:
+    """Does attaching to shared memory register it with the resource tracker of this process?"""
+    return os.name == "posix" and sys.version_info < (3, 13)
+
+
+def _tracked_name(name: str) -> str:
+    """Name the resource tracker knows the shared memory with the passed public name by."""
+    return "/" + name
+
+
+def _ring_views(buffer: memoryview, capacity: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Header and values of a shared memory ring as arrays, that share the passed buffer."""
+    header: np.ndarray = np.ndarray((_RING_HEADER_FIELDS,), dtype=np.int64, buffer=buffer)
+    values: np.ndarray = np.ndarray(
+        (2, capacity),
+        dtype=np.float64,
+        buffer=buffer,
+        offset=_RING_HEADER_FIELDS * np.dtype(np.int64).itemsize,
+    )
+    return header, values
+
+
+def _load_recording(path: str, field_names: Tuple[str, ...]) -> Tuple[np.ndarray, ...]:
+    """Values of the passed fields of a recording stored as .npy or .npz file."""
+    if path.endswith(".npz"):
+        with np.load(path) as archive:
+            missing = [name for name in field_names if name not in archive.files]
+            if missing:
+                raise ValueError(f"The recording {path} has no arrays named {', '.join(missing)}.")
+            fields = tuple(archive[name] for name in field_names)
+    else:
+        recording = np.load(path, mmap_mode="r")
+        if recording.ndim != 2 or recording.shape[0] != len(field_names):
+            raise ValueError(f"The recording {path} has to hold {len(field_names)} rows "
+                             f"({', '.join(field_names)}), but its shape is {recording.shape}.")
+        fields = tuple(recording)
+    if any(values.shape != fields[0].shape for values in fields):
+        raise ValueError(f"The arrays of the recording {path} do not have the same length.")
+    return fields
+
+
+def _is_string_column(values: np.ndarray) -> bool:
+    """
+    Does the passed column hold strings? Columns of object arrays
+    are strings, if each of their entries is one.
+    """
+    if values.dtype.kind in ("U", "S"):
+        return True
+    if values.dtype.kind == "O":
+        return all(isinstance(value, str) for value in values.flat)
+    return False
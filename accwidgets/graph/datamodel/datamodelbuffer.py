@@ -15,11 +15,15 @@ from accwidgets.graph.datamodel.datastructures import PointData
 from accwidgets.graph.util import deprecated_param_alias
 
 DEFAULT_BUFFER_SIZE: int = 100000
+# Count of chunks of one level of detail that are combined to one chunk of the next level
+LEVEL_OF_DETAIL_FACTOR: int = 4
+# Share of a step an x value may be away from a step of a uniform grid
+_GRID_TOLERANCE: float = 1e-6
 
 
 class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
 
-    def __init__(self, size: int = DEFAULT_BUFFER_SIZE):
+    def __init__(self, size: int = DEFAULT_BUFFER_SIZE, circular: bool = False):
         """
         Base class for different data buffers.
 
@@ -44,8 +48,22 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
         implement the preparation of primary and secondary values in the
         clear() function.
 
+        By default a full buffer makes room for new entries by moving all
+        entries to the front of its arrays and dropping the oldest ones.
+        In circular mode, the buffer is used as a ring instead: the oldest
+        entries are overwritten in place and no data is moved when the
+        buffer is full. In both modes the entries are addressed by their
+        logical index, which is 0 for the oldest entry in the buffer.
+
+        Since all primary values that are not NaN are sorted, the buffer
+        only keeps track of the positions of the NaN entries. This way the
+        position of any value can be found with a binary search without
+        sorting the buffer's content again.
+
         Args:
             size: Amount of entries fitting in the buffer
+            circular: Overwrite the oldest entries in place instead of
+                      shifting the whole buffer if it is full
         """
         size = size or DEFAULT_BUFFER_SIZE
         if size < 3:
@@ -53,12 +71,22 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
             warnings.warn(f"The requested data-buffer size is too small. As size the default "
                           f"{DEFAULT_BUFFER_SIZE} entries will be used")
         self._size = size
+        self._circular = circular
         self._primary_values: np.ndarray = np.array([])
         self._secondary_values_lists: List[np.ndarray] = []
         self._space_left: int
         self._min_primary_value_delta: float
         self._next_free_slot: int
+        self._head: int
         self._is_empty: bool
+        # Positions of NaN primary values, counted from the first entry ever added
+        self._nan_positions: np.ndarray
+        # Count of valid entries in front of each NaN entry, also counted from the first entry
+        self._nan_valid_counts: np.ndarray
+        self._dropped_entry_count: int
+        self._dropped_nan_count: int
+        # Logical index of the newest entry whose primary value is not NaN, -1 if there is none
+        self._last_valid_index: int
         # This is needed for initialization
         self.reset()
 
@@ -96,31 +124,40 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
         ]:
             self._sort_in_point(primary_value=primary_value, secondary_values=secondary_values)
 
-    def add_entries_to_buffer(self, primary_values: np.ndarray, secondary_values_list: List[np.ndarray]) -> None:
+    def add_entries_to_buffer(
+            self,
+            primary_values: np.ndarray,
+            secondary_values_list: List[np.ndarray],
+            keep_order: bool = False,
+    ) -> None:
         """Append a list of entries
 
         Entries that are passed will be ordered according to their primary value.
         NaN values are sorted according to numpy.sort, which means they will
         be moved to the end of the array. To make sure NaN is appended at the
-        right position, it should be passed as a single point (add_point()).
+        right position, it should be passed as a single point (add_point()) or
+        the entries have to be added with keep_order.
         Before calling make sure the passed data is valid.
 
         Args:
             primary_values: List of primary values that should be added to the buffer
             secondary_values_list: List of secondary values arrays that should be added
                                    to the buffer at the position of their primary value
+            keep_order: Add the entries with the same result as adding them one after
+                        another as single entries, which keeps NaN entries as gaps at
+                        the position they were passed at
         """
         if primary_values is None or secondary_values_list is None:
             raise ValueError("Passed keyword arguments do not match the expected ones.")
+        if keep_order:
+            self._append_entries_in_order(primary_values=primary_values, secondary_values_list=secondary_values_list)
+            return
         primary_values, secondary_values_list = self._prepare_buffer_and_values(
             primary_values=primary_values,
             secondary_values_list=secondary_values_list,
         )
-        for index, p_val in enumerate(primary_values):
-            sec_values = []
-            for secondary_values_entry in secondary_values_list:
-                sec_values.append(secondary_values_entry[index])
-            self._sort_in_point(primary_value=p_val, secondary_values=sec_values)
+        if primary_values.size > 0:
+            self._merge_in_points(primary_values=primary_values, secondary_values_list=secondary_values_list)
 
     def reset(self) -> None:
         """ Clear all saved fields and intialize them again
@@ -135,7 +172,13 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
         self._space_left = self._size
         self._min_primary_value_delta = np.inf
         self._next_free_slot = 0
+        self._head = 0
         self._is_empty = True
+        self._nan_positions = np.array([], dtype=int)
+        self._nan_valid_counts = np.array([], dtype=int)
+        self._dropped_entry_count = 0
+        self._dropped_nan_count = 0
+        self._last_valid_index = -1
 
     def as_np_array(self) -> Tuple[np.ndarray, ...]:
         """ Return Buffer as Tuple of Numpy arrays
@@ -144,12 +187,10 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
         arrays packaged in a tuple with the first one being the primary values
         and the followings being the secondary values in the same order as they
         are saved in the Buffer's secondary values list.
+        If the buffer is circular and its content wraps around the end
+        of the arrays, the returned arrays are copies, otherwise views.
         """
-        i = self.occupied_size
-        values: List[np.ndarray] = [self._primary_values[:i]]
-        for secondary_values in self._secondary_values_lists:
-            values.append(secondary_values[:i])
-        return tuple(values)
+        return self._logical_slices(start=0, end=self.occupied_size)
 
     @staticmethod
     def sorted_data_arrays(
@@ -215,12 +256,26 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
 
     @property
     def index_of_last_valid(self) -> int:
+        """
+        Index of the newest primary value (f.e. x value) that is a number and not NaN.
+        If the buffer does not contain any valid value, 0 is returned, for an empty
+        buffer -1.
+        """
+        if self._last_valid_index < 0:
+            return min(self.occupied_size - 1, 0)
+        return self._last_valid_index
+
+    @property
+    def last_valid_primary_value(self) -> Optional[float]:
         """The newest primary value (f.e. x value) that is a number and not NaN."""
-        next_free_index = self.occupied_size
-        last_non_free_and_not_none_index = next_free_index - 1
-        while last_non_free_and_not_none_index > 0 and np.isnan(self._primary_values[last_non_free_and_not_none_index]):
-            last_non_free_and_not_none_index -= 1
-        return last_non_free_and_not_none_index
+        if self._last_valid_index < 0:
+            return None
+        return self._primary_values[self._physical_index(self._last_valid_index)]
+
+    @property
+    def is_circular(self) -> bool:
+        """Are the oldest entries overwritten in place, if the buffer is full"""
+        return self._circular
 
     @property
     def min_dx(self) -> float:
@@ -258,45 +313,200 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
         """
         next_free_index = self.occupied_size
         last_non_free_and_not_none_index = self.index_of_last_valid
-        if self._is_new_value_greater_than_all_others(primary_value, last_non_free_and_not_none_index):
-            self._primary_values[next_free_index] = primary_value
-            for index, entry in enumerate(self._secondary_values_lists):
-                entry[next_free_index] = secondary_values[index]
-                self._secondary_values_lists[index] = entry
-            try:
-                distance = primary_value - self._primary_values[next_free_index - 1]
-            except IndexError:
-                distance = np.inf
+        is_appended = self._is_new_value_greater_than_all_others(primary_value, last_non_free_and_not_none_index)
+        if is_appended:
+            if self._circular and next_free_index == self._size:
+                self._drop_oldest_entries(count=1)
+                next_free_index -= 1
+            write_index = next_free_index
         else:
-            i = self.occupied_size
-            write_index = self._searchsorted_with_nans(
-                array=self._primary_values[:i],
-                value=primary_value,
-                side="right",
-            )
-            self._primary_values = np.insert(self._primary_values, write_index, primary_value)
-            # inserting lengthens the array -> cut last value
-            self._primary_values = self._primary_values[:-1]
-            for index, entry in enumerate(self._secondary_values_lists):
-                entry = np.insert(entry, write_index, secondary_values[index])
-                # inserting lengthens the array -> cut last value
-                entry = entry[:-1]
-                self._secondary_values_lists[index] = entry
-            try:
-                distance_front = primary_value - self._primary_values[write_index - 1]
-                distance_after = self._primary_values[write_index + 1] - primary_value
-                distance = (
-                    distance_front
-                    if distance_front < distance_after
-                    else distance_after
-                )
-            except IndexError:
-                distance = np.inf
+            write_index = self._searchsorted_in_buffer(value=primary_value, side="right")
+            if self._circular and next_free_index == self._size:
+                # The new entry would be the oldest one -> it is overwritten right away
+                if write_index == 0:
+                    return
+                self._drop_oldest_entries(count=1)
+                write_index -= 1
+            self._shift_entries_to_the_right(start=write_index)
+        physical_index = self._physical_index(write_index)
+        self._primary_values[physical_index] = primary_value
+        for index, entry in enumerate(self._secondary_values_lists):
+            entry[physical_index] = secondary_values[index]
+        if np.isnan(primary_value):
+            self._track_nan_entries(start=write_index, primary_values=np.array([primary_value]))
+        elif is_appended:
+            self._last_valid_index = write_index
         self._next_free_slot += 1
         self._is_empty = False
+        distance = primary_value - self._primary_value_at(write_index - 1)
+        if not is_appended:
+            distance_after = self._primary_value_at(write_index + 1) - primary_value
+            if not distance < distance_after:
+                distance = distance_after
         if self._min_primary_value_delta > distance:
             self._min_primary_value_delta = distance
 
+    def _merge_in_points(self, primary_values: np.ndarray, secondary_values_list: List[np.ndarray]) -> None:
+        """ Sort in a sorted list of entries in one go
+
+        The result is the same as sorting in the entries one after another with
+        _sort_in_point(). All entries that are not smaller than the newest valid
+        primary value in the buffer as well as all NaN entries are appended. All
+        other entries are placed in front of the first entry in the buffer with
+        a bigger primary value. Instead of shifting the buffer for each of these
+        entries, the part of the buffer behind the first affected position is
+        merged with the new entries once. If a circular buffer is full, entries
+        smaller than all others are dropped, since they would be the oldest ones.
+        Like _sort_in_point(), this function expects the buffer to be prepared
+        for the new entries.
+
+        Args:
+            primary_values: Sorted primary values of the new entries, NaNs at the end
+            secondary_values_list: Secondary values of the new entries
+        """
+        next_free_index = self.occupied_size
+        last_valid_value = self.last_valid_primary_value
+        if last_valid_value is None:
+            insert_count = 0
+        else:
+            insert_count = int(np.searchsorted(primary_values, last_valid_value, side="left"))
+        if insert_count > 0:
+            buffer_values = self._logical_slices(start=0, end=next_free_index)
+            valid_indices = np.flatnonzero(~np.isnan(buffer_values[0]))
+            count_smaller_or_equal = np.searchsorted(
+                buffer_values[0][valid_indices],
+                primary_values[:insert_count],
+                side="right",
+            )
+            if self._circular and next_free_index == self._size:
+                # In a full buffer, entries smaller than all others would be the oldest
+                # ones and are overwritten right away, like in _sort_in_point()
+                dropped_count = np.count_nonzero(count_smaller_or_equal == 0)
+                primary_values = primary_values[dropped_count:]
+                secondary_values_list = [secondary_values[dropped_count:] for secondary_values in secondary_values_list]
+                count_smaller_or_equal = count_smaller_or_equal[dropped_count:]
+                insert_count -= dropped_count
+                if primary_values.size == 0:
+                    return
+        if insert_count == 0:
+            write_index = next_free_index
+            new_values = [primary_values, *secondary_values_list]
+        else:
+            insert_indices = valid_indices[count_smaller_or_equal]
+            # Only the first entry smaller than all others is placed in front of leading NaNs
+            if count_smaller_or_equal[0] == 0:
+                insert_indices[0] = 0
+            write_index = insert_indices[0]
+            insert_indices -= write_index
+            new_values = [
+                np.concatenate((
+                    np.insert(values[write_index:], insert_indices, entries[:insert_count]),
+                    entries[insert_count:],
+                ))
+                for values, entries in zip(buffer_values, [primary_values, *secondary_values_list])
+            ]
+        self._update_min_primary_value_delta(start=write_index, primary_values=new_values[0])
+        self._write_entries(start=write_index, values_list=new_values)
+        self._is_empty = False
+
+    def _append_entries_in_order(self, primary_values: np.ndarray, secondary_values_list: List[np.ndarray]) -> None:
+        """ Add entries with the same result as adding them one after another
+
+        If the valid primary values are ascending and none of them is smaller than
+        the newest valid primary value in the buffer, all entries are written
+        behind the last entry in the buffer in one go. Otherwise each entry is
+        sorted in on its own.
+
+        Args:
+            primary_values: Primary values of the new entries in the order they arrived
+            secondary_values_list: Secondary values of the new entries
+        """
+        if not self.data_arrays_are_compatible(primary_values, secondary_values_list):
+            raise ValueError("The passed arrays must have the same length.")
+        if primary_values.size == 0:
+            return
+        valid_values = primary_values[~np.isnan(primary_values)]
+        last_valid_value = self.last_valid_primary_value
+        if valid_values.size > 0 and (
+            (last_valid_value is not None and valid_values[0] < last_valid_value)
+            or np.any(np.diff(valid_values) < 0)
+        ):
+            for index, primary_value in enumerate(primary_values):
+                self.add_entry_to_buffer(
+                    primary_value=primary_value,
+                    secondary_values=[secondary_values[index] for secondary_values in secondary_values_list],
+                )
+            return
+        if self._circular:
+            if primary_values.size > self._size:
+                primary_values = primary_values[-self._size:]
+                secondary_values_list = [secondary_values[-self._size:] for secondary_values in secondary_values_list]
+        elif primary_values.size > self.space_left:
+            primary_values, secondary_values_list = self._shift_buffer_and_cut_input(
+                primary_values=primary_values,
+                secondary_values_list=list(secondary_values_list),
+            )
+            if primary_values.size == 0:
+                return
+        write_index = self.occupied_size
+        self._update_min_primary_value_delta(start=write_index, primary_values=primary_values)
+        self._write_entries(start=write_index, values_list=[primary_values, *secondary_values_list])
+        self._is_empty = False
+
+    def _update_min_primary_value_delta(self, start: int, primary_values: np.ndarray) -> None:
+        """
+        Update the smallest distance between primary values with the entries that are
+        about to be written from the given index on. Distances between entries which
+        are dropped right away from a circular buffer are taken into account as well,
+        like when adding the entries one after another.
+        """
+        preceding = self._logical_slice(values=self._primary_values, start=max(start - 1, 0), end=start)
+        distances = np.diff(np.concatenate((preceding, primary_values)))
+        distances = distances[~np.isnan(distances)]
+        if distances.size > 0 and self._min_primary_value_delta > distances.min():
+            self._min_primary_value_delta = distances.min()
+
+    def _write_entries(self, start: int, values_list: List[np.ndarray]) -> int:
+        """
+        Replace all entries from the given logical index on with the passed ones.
+        If the entries do not fit into a circular buffer, the oldest ones in the
+        buffer and from the passed ones are dropped.
+
+        Args:
+            start: Logical index of the first entry that is replaced
+            values_list: Primary values followed by all secondary values
+
+        Returns:
+            Logical index of the first written entry
+        """
+        count = values_list[0].size
+        overflow = start + count - self._size
+        if overflow > 0:
+            # Only possible for circular buffers, which drop their oldest entries
+            if overflow > start:
+                values_list = [values[overflow - start:] for values in values_list]
+                count -= overflow - start
+                overflow = start
+            self._drop_oldest_entries(count=overflow)
+            start -= overflow
+        physical_start = self._physical_index(start)
+        first_part = min(count, self._size - physical_start)
+        for buffer_values, values in zip([self._primary_values, *self._secondary_values_lists], values_list):
+            buffer_values[physical_start:physical_start + first_part] = values[:first_part]
+            buffer_values[:count - first_part] = values[first_part:]
+        self._track_nan_entries(start=start, primary_values=values_list[0])
+        self._handle_entries_changed(start=start)
+        valid_indices = np.flatnonzero(~np.isnan(values_list[0]))
+        if valid_indices.size > 0:
+            self._last_valid_index = start + valid_indices[-1]
+        elif self._last_valid_index >= start:
+            # The last valid entry has been overwritten with NaN entries
+            preceding = self._logical_slice(values=self._primary_values, start=0, end=start)
+            valid_indices = np.flatnonzero(~np.isnan(preceding))
+            self._last_valid_index = valid_indices[-1] if valid_indices.size > 0 else -1
+        self._next_free_slot = start + count
+        return start
+
     def _prepare_buffer_and_values(
             self,
             primary_values: np.ndarray,
@@ -325,7 +535,13 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
         ):
             return primary_values, secondary_values_list
         primary_values, secondary_values_list = self.sorted_data_arrays(primary_values, secondary_values_list)
-        if primary_values.size > self.space_left:
+        if self._circular:
+            # Entries which would be overwritten by the input itself are not needed
+            if primary_values.size > self._size:
+                input_cut = primary_values.size - self._size
+                primary_values = primary_values[input_cut:]
+                secondary_values_list = [secondary_values[input_cut:] for secondary_values in secondary_values_list]
+        elif primary_values.size > self.space_left:
             primary_values, secondary_values_list = self._shift_buffer_and_cut_input(
                 primary_values=primary_values,
                 secondary_values_list=secondary_values_list,
@@ -425,6 +641,166 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
             )
             self._secondary_values_lists[index] = secondary_values
         self._next_free_slot -= spaces_to_shift
+        self._track_dropped_entries(count=spaces_to_shift)
+
+    def _drop_oldest_entries(self, count: int) -> None:
+        """Release the oldest entries of a circular buffer by moving its head."""
+        self._head = (self._head + count) % self._size
+        self._next_free_slot -= count
+        self._track_dropped_entries(count=count)
+
+    def _shift_entries_to_the_right(self, start: int) -> None:
+        """
+        Move all entries from the given logical index on by one place to
+        the right to make room for a new entry. The buffer has to have at
+        least one free place left.
+        """
+        self._track_inserted_entry(index=start)
+        self._handle_entries_changed(start=start)
+        end = self.occupied_size
+        physical_start = self._head + start
+        physical_end = self._head + end
+        if physical_end < self._size:
+            for values in [self._primary_values, *self._secondary_values_lists]:
+                values[physical_start + 1:physical_end + 1] = values[physical_start:physical_end]
+        else:
+            source = np.arange(physical_start, physical_end) % self._size
+            target = (source + 1) % self._size
+            for values in [self._primary_values, *self._secondary_values_lists]:
+                values[target] = values[source]
+
+    def _physical_index(self, index: int) -> int:
+        """Position in the buffer's arrays of the entry with the given logical index."""
+        return (self._head + index) % self._size
+
+    def _primary_value_at(self, index: int) -> float:
+        """Primary value at the given logical index, NaN if there is no entry at this index."""
+        if 0 <= index < self.occupied_size:
+            return self._primary_values[self._physical_index(index)]
+        return np.nan
+
+    def _logical_slice(self, values: np.ndarray, start: int, end: int) -> np.ndarray:
+        """
+        Entries with the logical indices start to end (exclusive) from one of
+        the buffer's arrays. As long as the range does not wrap around the end
+        of the array, the returned array is a view, otherwise a copy.
+        """
+        physical_start = self._head + start
+        physical_end = self._head + end
+        if physical_end <= self._size:
+            return values[physical_start:physical_end]
+        if physical_start >= self._size:
+            return values[physical_start - self._size:physical_end - self._size]
+        return np.concatenate((values[physical_start:], values[:physical_end - self._size]))
+
+    def _logical_slices(self, start: int, end: int) -> Tuple[np.ndarray, ...]:
+        """Primary and secondary values for the logical indices start to end (exclusive)."""
+        return tuple(
+            self._logical_slice(values=values, start=start, end=end)
+            for values in [self._primary_values, *self._secondary_values_lists]
+        )
+
+    def _handle_entries_changed(self, start: int) -> None:
+        """
+        Hook for subclasses, which is called when all entries from the given
+        logical index on might have been moved or replaced. Appending entries
+        behind the last one does not count as a change.
+        """
+        pass
+
+    def _track_nan_entries(self, start: int, primary_values: np.ndarray) -> None:
+        """
+        Update the tracked NaN positions after all entries from the given
+        logical index on have been replaced by the passed ones.
+        """
+        start_position = start + self._dropped_entry_count
+        kept = np.searchsorted(self._nan_positions, start_position, side="left")
+        new_positions: np.ndarray = np.flatnonzero(np.isnan(primary_values)) + start_position
+        new_ordinals = np.arange(new_positions.size) + kept + self._dropped_nan_count
+        self._nan_positions = np.concatenate((self._nan_positions[:kept], new_positions))
+        self._nan_valid_counts = np.concatenate((self._nan_valid_counts[:kept], new_positions - new_ordinals))
+
+    def _track_inserted_entry(self, index: int) -> None:
+        """Update the tracked NaN positions for a valid entry inserted at the given logical index."""
+        moved = np.searchsorted(self._nan_positions, index + self._dropped_entry_count, side="left")
+        self._nan_positions[moved:] += 1
+        self._nan_valid_counts[moved:] += 1
+        # Inserted entries are always placed in front of the newest valid one
+        self._last_valid_index += 1
+
+    def _track_dropped_entries(self, count: int) -> None:
+        """Update the tracked NaN positions after the given count of oldest entries was removed."""
+        self._dropped_entry_count += count
+        self._last_valid_index = max(self._last_valid_index - count, -1)
+        dropped = np.searchsorted(self._nan_positions, self._dropped_entry_count, side="left")
+        if dropped > 0:
+            self._nan_positions = self._nan_positions[dropped:]
+            self._nan_valid_counts = self._nan_valid_counts[dropped:]
+            self._dropped_nan_count += dropped
+
+    def _index_of_valid_entry(self, number: int) -> int:
+        """Logical index of the n-th entry (starting with 0) whose primary value is not NaN."""
+        dropped_valid_count = self._dropped_entry_count - self._dropped_nan_count
+        nans_in_front = np.searchsorted(self._nan_valid_counts, number + dropped_valid_count, side="right")
+        return number + nans_in_front
+
+    def _searchsorted_in_buffer(self, value: float, side: str) -> int:
+        """ np.searchsorted for the primary values in the buffer with NaN support
+
+        Since NaN values are ignored while searching, the valid primary values
+        are sorted and can be searched in with a binary search. If the position
+        is behind all valid entries, the next free index is returned, if it is in
+        front of all valid entries, 0 is returned. Otherwise the index of the
+        first valid entry whose value is bigger (or equal for side="left") is
+        returned.
+
+        Args:
+            value: primary value that should be searched for
+            side: "left" or "right", see np.searchsorted
+
+        Returns:
+            Logical index where the value would be sorted in
+        """
+        next_free_index = self.occupied_size
+        if self._nan_positions.size == 0:
+            physical_start = self._head
+            physical_end = self._head + next_free_index
+            if physical_end <= self._size:
+                return np.searchsorted(self._primary_values[physical_start:physical_end], value, side=side)
+            index = np.searchsorted(self._primary_values[physical_start:], value, side=side)
+            if index < self._size - physical_start:
+                return index
+            return index + np.searchsorted(self._primary_values[:physical_end - self._size], value, side=side)
+        if np.isnan(value):
+            return next_free_index
+        valid_count = next_free_index - self._nan_positions.size
+        lower = 0
+        upper = valid_count
+        while lower < upper:
+            middle = (lower + upper) // 2
+            middle_value = self._primary_value_at(self._index_of_valid_entry(middle))
+            if middle_value < value or (side == "right" and middle_value == value):
+                lower = middle + 1
+            else:
+                upper = middle
+        if lower <= 0:
+            return 0
+        if lower >= valid_count:
+            return next_free_index
+        return self._index_of_valid_entry(lower)
+
+    def _indices_for_primary_val_range(self, start: float, end: float) -> Tuple[int, int]:
+        """
+        Logical start and end index of the entries whose primary values are
+        in between the given boundaries without leading and trailing NaNs.
+        """
+        start_index = self._searchsorted_in_buffer(value=start, side="left")
+        end_index = self._searchsorted_in_buffer(value=end, side="right")
+        if 0 < end_index and np.isnan(self._primary_value_at(end_index - 1)) and end_index > start_index:
+            end_index -= 1
+        if np.isnan(self._primary_value_at(start_index)) and start_index < end_index:
+            start_index += 1
+        return start_index, end_index
 
     def _is_new_value_greater_than_all_others(
             self,
@@ -435,8 +811,8 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
         return (
             last_non_free_and_not_none_index < 0
             or np.isnan(primary_value)
-            or primary_value >= self._primary_values[last_non_free_and_not_none_index]
-            or np.isnan(self._primary_values[last_non_free_and_not_none_index])
+            or primary_value >= self._primary_value_at(last_non_free_and_not_none_index)
+            or np.isnan(self._primary_value_at(last_non_free_and_not_none_index))
         )
 
     def _update_space_left(self) -> None:
@@ -478,18 +854,6 @@ class BaseSortedDataBuffer(metaclass=abc.ABCMeta):
             return False
         return any(secondary_values.size for secondary_values in secondary_values_list)
 
-    @staticmethod
-    def _searchsorted_with_nans(array: np.ndarray, value: float, side: str) -> int:
-        """np.searchsorted with nan support"""
-        sorting_indices = np.argsort(array)
-        index = np.searchsorted(array, value, side=side, sorter=sorting_indices)
-        if index <= 0:
-            return index
-        count_nan_values = np.count_nonzero(~np.isnan(array))
-        if index >= count_nan_values:
-            return array.size
-        return sorting_indices[index]
-
 
 class SortedCurveDataBuffer(BaseSortedDataBuffer):
 
@@ -502,6 +866,39 @@ class SortedCurveDataBuffer(BaseSortedDataBuffer):
         Secondary Values =  Y Value
     """
 
+    def __init__(
+            self,
+            size: int = DEFAULT_BUFFER_SIZE,
+            circular: bool = False,
+            level_of_detail: bool = False,
+    ):
+        """
+        Sorted buffer for a line graph, which can optionally maintain a
+        min/max pyramid for creating decimated subsets.
+
+        Each level of the pyramid splits the entries into chunks of the same
+        size and saves the entries with the smallest and biggest y value as
+        well as if the chunk contains a NaN entry. The chunks of the first
+        level contain LEVEL_OF_DETAIL_FACTOR entries, the chunks of each
+        following level LEVEL_OF_DETAIL_FACTOR chunks of the one before.
+        Chunks are only recalculated, if their entries have changed since
+        they have been requested the last time.
+
+        Args:
+            size: Amount of entries fitting in the buffer
+            circular: Overwrite the oldest entries in place instead of
+                      shifting the whole buffer if it is full
+            level_of_detail: Maintain a min/max pyramid for fast decimated subsets
+        """
+        self._level_of_detail = level_of_detail
+        # For each level: Positions of the entries with the smallest and biggest y value
+        # in each chunk, counted from the first entry ever added, the smallest and biggest
+        # y values and if the chunk contains NaN entries.
+        self._lod_levels: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+        # For each level: Number of the first chunk that has not been calculated yet
+        self._lod_computed_until: List[int] = []
+        super().__init__(size=size, circular=circular)
+
     def reset(self) -> None:
         """ Reset the buffer"""
         super().reset()
@@ -511,6 +908,28 @@ class SortedCurveDataBuffer(BaseSortedDataBuffer):
         # Y Value
         self._secondary_values_lists.append(np.empty(self._size))
         self._secondary_values_lists[0].fill(np.nan)
+        # Level of detail pyramid
+        self._lod_levels = []
+        self._lod_computed_until = []
+        if self._level_of_detail:
+            chunk_size = LEVEL_OF_DETAIL_FACTOR
+            while chunk_size <= self._size:
+                # Chunks are saved in a ring with space for all chunks inside the buffer
+                capacity = self._size // chunk_size + 2
+                self._lod_levels.append((
+                    np.zeros(capacity, dtype=int),
+                    np.zeros(capacity, dtype=int),
+                    np.empty(capacity),
+                    np.empty(capacity),
+                    np.zeros(capacity, dtype=bool),
+                ))
+                self._lod_computed_until.append(0)
+                chunk_size *= LEVEL_OF_DETAIL_FACTOR
+
+    @property
+    def has_level_of_detail(self) -> bool:
+        """Does the buffer maintain a min/max pyramid for decimated subsets"""
+        return self._level_of_detail
 
     @deprecated_param_alias(x_value="x", y_value="y")
     def add_entry(self, x: float, y: float) -> None:
@@ -526,7 +945,7 @@ class SortedCurveDataBuffer(BaseSortedDataBuffer):
         super().add_entry_to_buffer(primary_value=x, secondary_values=[y])
 
     @deprecated_param_alias(x_values="x", y_values="y")
-    def add_list_of_entries(self, x: np.ndarray, y: np.ndarray) -> None:
+    def add_list_of_entries(self, x: np.ndarray, y: np.ndarray, keep_order: bool = False) -> None:
         """Append a list of points to the buffer
 
         It is expected, that the passed data is valid. Make sure before calling,
@@ -535,14 +954,17 @@ class SortedCurveDataBuffer(BaseSortedDataBuffer):
         Args:
             x: Array of x values that should be added to the buffer
             y: Array of y values that should be added to the buffer.
+            keep_order: Add the points as if they were added one after another,
+                        which keeps NaN gaps at their position
         """
-        super().add_entries_to_buffer(primary_values=x, secondary_values_list=[y])
+        super().add_entries_to_buffer(primary_values=x, secondary_values_list=[y], keep_order=keep_order)
 
     def subset_for_primary_val_range(
             self,
             start: float,
             end: float,
             interpolated: bool = False,
+            max_points: Optional[int] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Get Subset of the data
 
@@ -553,35 +975,235 @@ class SortedCurveDataBuffer(BaseSortedDataBuffer):
         The interpolated points will not be added permanently to the data-buffer
         and are only included in the returned subset.
 
+        If the subset would contain more than max_points points, a decimated
+        subset is returned instead. The range is split into chunks and for each
+        chunk only the points with the smallest and biggest y value are kept,
+        so peaks are still visible. Chunks containing NaN values are followed
+        by a NaN point. If the buffer maintains a level of detail pyramid, the
+        chunks are taken from the finest level that still fits into max_points,
+        otherwise they are calculated from all points in the range.
+
         Args:
             start: start boundary for primary values of elements that should be included in the subset
             end: end boundary for primary values of elements that should be included in the subset
             interpolated: If true the curve will be interpolated at the edges and the two
                           new points at the edge will be contained in the subset
+            max_points: Count of points the subset should contain at max
 
         Returns:
             X and Y Values of the subset in a tuple of the form (x, y)
         """
-        i = self.occupied_size
-        x: np.ndarray = self._primary_values[:i]
-        y: np.ndarray = self._secondary_values_lists[0][:i]
-        start_index = self._searchsorted_with_nans(array=x, value=start, side="left")
-        end_index = self._searchsorted_with_nans(array=x, value=end, side="right")
+        if max_points is not None:
+            start_index, end_index = self._indices_for_primary_val_range(start=start, end=end)
+            if end_index - start_index > max_points:
+                return self._decimated_subset(
+                    start_index=start_index,
+                    end_index=end_index,
+                    max_points=max_points,
+                    start_boundary=start if interpolated else None,
+                    end_boundary=end if interpolated else None,
+                )
         if interpolated:
+            start_index = self._searchsorted_in_buffer(value=start, side="left")
+            end_index = self._searchsorted_in_buffer(value=end, side="right")
+            # Only the neighbours of the subset are needed for the intersections
+            window_start = max(start_index - 1, 0)
+            window_end = min(end_index + 1, self.occupied_size)
+            x, y = self._logical_slices(start=window_start, end=window_end)
             return self._clip_at_boundaries_if_possible(
                 x=x,
                 y=y,
-                start_index=start_index,
-                end_index=end_index,
+                start_index=start_index - window_start,
+                end_index=end_index - window_start,
                 start_boundary=start,
                 end_boundary=end,
             )
-        start_index, end_index = super()._get_indices_for_cutting_leading_and_trailing_nans(
-            primary_values=x,
-            start_index=start_index,
-            end_index=end_index,
+        start_index, end_index = self._indices_for_primary_val_range(start=start, end=end)
+        x, y = self._logical_slices(start=start_index, end=end_index)
+        return x, y
+
+    def _handle_entries_changed(self, start: int) -> None:
+        """Mark all chunks of the pyramid containing the changed entries as outdated"""
+        position = start + self._dropped_entry_count
+        chunk_size = LEVEL_OF_DETAIL_FACTOR
+        for level, computed_until in enumerate(self._lod_computed_until):
+            self._lod_computed_until[level] = min(computed_until, position // chunk_size)
+            chunk_size *= LEVEL_OF_DETAIL_FACTOR
+
+    def _decimated_subset(
+            self,
+            start_index: int,
+            end_index: int,
+            max_points: int,
+            start_boundary: Optional[float] = None,
+            end_boundary: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """ Create a peak preserving decimated subset
+
+        Args:
+            start_index: Logical index of the first entry in the subset
+            end_index: Logical index behind the last entry in the subset
+            max_points: Count of points the subset should contain at max
+            start_boundary: If passed, the curve is interpolated at this x value
+            end_boundary: If passed, the curve is interpolated at this x value
+
+        Returns:
+            X and Y values of the decimated subset
+        """
+        chunk_count = _min_max_chunk_count(max_points)
+        level = self._lod_level_for_range(start_index=start_index, end_index=end_index, chunk_count=chunk_count)
+        if level is None:
+            chunk_size = math.ceil((end_index - start_index) / chunk_count)
+            chunks = [self._min_max_of_range(start=start_index, end=end_index, chunk_size=chunk_size)]
+        else:
+            dropped = self._dropped_entry_count
+            chunk_size = LEVEL_OF_DETAIL_FACTOR ** (level + 1)
+            first_chunk = -(-(start_index + dropped) // chunk_size)
+            end_chunk = max((end_index + dropped) // chunk_size, first_chunk)
+            # A range inside a single chunk has no complete chunks
+            chunks_start = min(first_chunk * chunk_size - dropped, end_index)
+            chunks_end = max(end_chunk * chunk_size - dropped, chunks_start)
+            chunks = [self._min_max_of_range(start=start_index, end=chunks_start)]
+            if end_chunk > first_chunk:
+                self._update_lod_level(level=level)
+                min_positions, max_positions, min_values, max_values, gaps = self._lod_levels[level]
+                indices = np.arange(first_chunk, end_chunk) % min_positions.size
+                chunks.append((
+                    min_positions[indices] - dropped,
+                    max_positions[indices] - dropped,
+                    min_values[indices],
+                    max_values[indices],
+                    gaps[indices],
+                ))
+            chunks.append(self._min_max_of_range(start=chunks_end, end=end_index))
+        extremes = (np.concatenate(values) for values in zip(*chunks))
+        # The first and last entry are always kept, so the curve does not get shorter
+        indices = np.concatenate(([start_index], _min_max_indices(*extremes), [end_index - 1]))
+        physical_indices = (self._head + indices) % self._size
+        x = self._primary_values[physical_indices]
+        y = self._secondary_values_lists[0][physical_indices]
+        x[indices < 0] = np.nan
+        y[indices < 0] = np.nan
+        start_clipping_point = self._intersection_with_boundary(
+            boundary=start_boundary,
+            before=start_index - 1,
+            after=start_index,
+        )
+        end_clipping_point = self._intersection_with_boundary(
+            boundary=end_boundary,
+            before=end_index - 1,
+            after=end_index,
+        )
+        if start_clipping_point:
+            x = np.concatenate((np.array([start_clipping_point.x]), x))
+            y = np.concatenate((np.array([start_clipping_point.y]), y))
+        if end_clipping_point:
+            x = np.concatenate((x, np.array([end_clipping_point.x])))
+            y = np.concatenate((y, np.array([end_clipping_point.y])))
+        return x, y
+
+    def _lod_level_for_range(self, start_index: int, end_index: int, chunk_count: int) -> Optional[int]:
+        """
+        Finest level of the pyramid, whose chunks overlapping the given range
+        are at most chunk_count. None, if the buffer has no such level.
+        """
+        dropped = self._dropped_entry_count
+        chunk_size = LEVEL_OF_DETAIL_FACTOR
+        for level in range(len(self._lod_levels)):
+            overlapping = -(-(end_index + dropped) // chunk_size) - (start_index + dropped) // chunk_size
+            if overlapping <= chunk_count:
+                return level
+            chunk_size *= LEVEL_OF_DETAIL_FACTOR
+        return None
+
+    def _update_lod_level(self, level: int) -> None:
+        """Calculate all outdated chunks of the level of detail pyramid that are inside the buffer"""
+        chunk_size = LEVEL_OF_DETAIL_FACTOR ** (level + 1)
+        dropped = self._dropped_entry_count
+        first_chunk = max(self._lod_computed_until[level], -(-dropped // chunk_size))
+        end_chunk = (dropped + self.occupied_size) // chunk_size
+        if first_chunk >= end_chunk:
+            return
+        if level == 0:
+            min_indices, max_indices, min_values, max_values, gaps = self._min_max_of_range(
+                start=first_chunk * chunk_size - dropped,
+                end=end_chunk * chunk_size - dropped,
+                chunk_size=chunk_size,
+            )
+            min_positions: np.ndarray = min_indices + dropped
+            max_positions: np.ndarray = max_indices + dropped
+        else:
+            self._update_lod_level(level=level - 1)
+            children = self._lod_levels[level - 1]
+            child_indices = (
+                np.arange(first_chunk * LEVEL_OF_DETAIL_FACTOR, end_chunk * LEVEL_OF_DETAIL_FACTOR)
+                % children[0].size
+            )
+            min_columns, max_columns, min_values, max_values, _ = _chunk_min_max(
+                min_candidates=children[2][child_indices],
+                max_candidates=children[3][child_indices],
+                chunk_size=LEVEL_OF_DETAIL_FACTOR,
+            )
+            min_positions = children[0][child_indices[min_columns]]
+            max_positions = children[1][child_indices[max_columns]]
+            gaps = children[4][child_indices].reshape(-1, LEVEL_OF_DETAIL_FACTOR).any(axis=1)
+        indices = np.arange(first_chunk, end_chunk) % self._lod_levels[level][0].size
+        for target, values in zip(self._lod_levels[level], (min_positions, max_positions, min_values, max_values, gaps)):
+            target[indices] = values
+        self._lod_computed_until[level] = end_chunk
+
+    def _min_max_of_range(
+            self,
+            start: int,
+            end: int,
+            chunk_size: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the entries with the smallest and biggest y value in each chunk
+        of the given range. If no chunk size is passed, the whole range is
+        one chunk, otherwise the last chunk may be shorter. Chunks without
+        any valid entry have inf as smallest and -inf as biggest value.
+
+        Args:
+            start: Logical index of the first entry of the first chunk
+            end: Logical index behind the last entry of the last chunk
+            chunk_size: Count of entries in each chunk
+
+        Returns:
+            Logical indices of the smallest and biggest entries, their values and
+            if the chunks contain entries with NaN values
+        """
+        x, y = self._logical_slices(start=start, end=end)
+        y = np.where(np.isnan(x), np.nan, y)
+        min_indices, max_indices, min_values, max_values, gaps = _chunk_min_max(
+            min_candidates=y,
+            max_candidates=y,
+            chunk_size=chunk_size or max(y.size, 1),
+        )
+        return start + min_indices, start + max_indices, min_values, max_values, gaps
+
+    def _intersection_with_boundary(self, boundary: Optional[float], before: int, after: int) -> Optional[PointData]:
+        """
+        Interpolate the curve between the two entries with the given logical
+        indices at the boundary, if the boundary is between them.
+        """
+        if boundary is None or not 0 < after < self.occupied_size:
+            return None
+        point_in_front_of_boundary = PointData(
+            x=self._primary_values[self._physical_index(before)],
+            y=self._secondary_values_lists[0][self._physical_index(before)],
+        )
+        point_after_boundary = PointData(
+            x=self._primary_values[self._physical_index(after)],
+            y=self._secondary_values_lists[0][self._physical_index(after)],
         )
-        return x[start_index:end_index], y[start_index:end_index]
+        if (
+            point_in_front_of_boundary.is_nan
+            or point_after_boundary.is_nan
+            or not point_in_front_of_boundary.x < boundary < point_after_boundary.x
+        ):
+            return None
+        return calc_intersection(point_in_front_of_boundary, point_after_boundary, boundary)
 
     @staticmethod
     @deprecated_param_alias(x_values="x", y_values="y")
@@ -667,6 +1289,400 @@ class SortedCurveDataBuffer(BaseSortedDataBuffer):
         return return_x, return_y
 
 
+class UniformCurveDataBuffer:
+
+    """
+    Buffer for a Line Graph with uniformly sampled points.
+
+    Content
+        X Values =  x0 + dx * step
+
+        Y Values =  Y Value at each step
+    """
+
+    def __init__(self, size: int = DEFAULT_BUFFER_SIZE, dx: Optional[float] = None):
+        """
+        Buffer for a line graph, whose points have the same distance to each
+        other. Instead of saving an x value for each point, only the x value of
+        the first point ever added and the distance between the points are
+        saved. Each point is saved in the slot of its step on this grid.
+
+        Points have to be added in the order of their x values and their x
+        values have to be on the grid. Steps that are skipped are filled with
+        NaN, so they appear as gaps in the curve. If the buffer is full, the
+        oldest points are overwritten in place.
+
+        Since the x value of each point can be calculated from its position,
+        the points in a range of x values can be found without searching, and
+        x values are only created for the points in the requested subset.
+
+        Args:
+            size: Amount of entries fitting in the buffer
+            dx: Distance between the x values of two neighbouring points, if not
+                passed, it is taken from the first points that are added
+        """
+        size = size or DEFAULT_BUFFER_SIZE
+        if size < 3:
+            size = DEFAULT_BUFFER_SIZE
+            warnings.warn(f"The requested data-buffer size is too small. As size the default "
+                          f"{DEFAULT_BUFFER_SIZE} entries will be used")
+        if dx is not None and not dx > 0:
+            raise ValueError(f"The distance between the points has to be positive, not {dx}.")
+        self._size = size
+        self._initial_dx = dx
+        self._y_values: np.ndarray = np.array([])
+        self._x0: Optional[float]
+        self._dx: Optional[float]
+        # Physical index of the oldest entry
+        self._head: int
+        self._count: int
+        # Step of the oldest entry on the grid, counted from x0
+        self._first_step: int
+        self.reset()
+
+    def reset(self) -> None:
+        """ Reset the buffer"""
+        self._y_values = np.empty(self._size)
+        self._y_values.fill(np.nan)
+        self._x0 = None
+        self._dx = self._initial_dx
+        self._head = 0
+        self._count = 0
+        self._first_step = 0
+
+    @deprecated_param_alias(x_value="x", y_value="y")
+    def add_entry(self, x: float, y: float) -> None:
+        """Append a single point to the buffer
+
+        Args:
+            x: x value that should be added to the buffer
+            y: y value that should be added to the buffer
+
+        Raises:
+            ValueError: The x value is not on the grid or not bigger than the
+                        x value of the newest point
+        """
+        self.add_list_of_entries(x=np.array([x]), y=np.array([y]))
+
+    @deprecated_param_alias(x_values="x", y_values="y")
+    def add_list_of_entries(self, x: np.ndarray, y: np.ndarray, keep_order: bool = False) -> None:
+        """Append a list of points to the buffer
+
+        Points with NaN as x value are ignored, since skipped steps are
+        already shown as gaps.
+
+        Args:
+            x: Array of ascending x values that should be added to the buffer
+            y: Array of y values that should be added to the buffer
+            keep_order: Only for compatibility with the sorted curve buffer,
+                        the points are always added in the passed order
+
+        Raises:
+            ValueError: The x values are not on the grid, not ascending or
+                        not bigger than the x value of the newest point
+        """
+        if x.size != y.size:
+            raise ValueError("The passed arrays must have the same length.")
+        valid = ~np.isnan(x)
+        x = x[valid]
+        y = y[valid]
+        if x.size == 0:
+            return
+        if self._x0 is None:
+            self._x0 = float(x[0])
+        if self._dx is None:
+            previous = [self.last_valid_primary_value] if self._count > 0 else []
+            distances = np.diff(np.concatenate((previous, x)))
+            if distances.size > 0:
+                self._set_dx(distances[0])
+        steps = self._steps_on_grid(x)
+        if np.any(np.diff(steps) <= 0):
+            raise ValueError("The x values of the points have to be ascending.")
+        if steps[-1] - steps[0] + 1 == steps.size:
+            self._write_steps(first_step=int(steps[0]), y=y)
+        else:
+            # Fill skipped steps with NaN
+            filled = np.empty(steps[-1] - steps[0] + 1)
+            filled.fill(np.nan)
+            filled[steps - steps[0]] = y
+            self._write_steps(first_step=int(steps[0]), y=filled)
+
+    def add_uniform_entries(self, x0: float, dx: float, y: np.ndarray) -> None:
+        """Append uniformly sampled points to the buffer
+
+        Compared to add_list_of_entries(), no x values have to be created and
+        checked for the passed points.
+
+        Args:
+            x0: x value of the first point
+            dx: distance between the x values of two neighbouring points
+            y: Array of y values that should be added to the buffer
+
+        Raises:
+            ValueError: The points do not fit on the grid of the buffer or
+                        are not newer than the newest point
+        """
+        if y.size == 0:
+            return
+        if self._dx is None:
+            self._set_dx(dx)
+        elif not math.isclose(dx, self._dx, rel_tol=_GRID_TOLERANCE):
+            raise ValueError(f"The distance between the points ({dx}) does not "
+                             f"fit the buffer's distance ({self._dx}).")
+        if self._x0 is None:
+            self._x0 = float(x0)
+        first_step = int(self._steps_on_grid(np.array([x0]))[0])
+        self._write_steps(first_step=first_step, y=y)
+
+    def subset_for_primary_val_range(
+            self,
+            start: float,
+            end: float,
+            interpolated: bool = False,
+            max_points: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get Subset of the data
+
+        The indices of the subset are calculated from the boundaries, so
+        no search is necessary. The same options as for
+        :func:`SortedCurveDataBuffer.subset_for_primary_val_range` are
+        available.
+
+        Args:
+            start: start boundary for x values of points that should be included in the subset
+            end: end boundary for x values of points that should be included in the subset
+            interpolated: If true the curve will be interpolated at the edges and the two
+                          new points at the edge will be contained in the subset
+            max_points: Count of points the subset should contain at max
+
+        Returns:
+            X and Y Values of the subset in a tuple of the form (x, y)
+        """
+        start_index, end_index = self._indices_for_primary_val_range(start=start, end=end)
+        if max_points is not None and end_index - start_index > max_points:
+            indices = self._decimated_indices(start_index=start_index, end_index=end_index, max_points=max_points)
+            y = self._y_values[(self._head + indices) % self._size]
+            x = self._x_at(indices)
+            # Negative indices mark gaps
+            gaps: np.ndarray = indices < 0
+            x[gaps] = np.nan
+            y[gaps] = np.nan
+        else:
+            y = self._logical_slice(start=start_index, end=end_index)
+            x = self._x_at(np.arange(start_index, end_index))
+        if interpolated:
+            start_clipping_point = self._intersection_with_boundary(boundary=start, after=start_index)
+            end_clipping_point = self._intersection_with_boundary(boundary=end, after=end_index)
+            if start_clipping_point:
+                x = np.concatenate((np.array([start_clipping_point.x]), x))
+                y = np.concatenate((np.array([start_clipping_point.y]), y))
+            if end_clipping_point:
+                x = np.concatenate((x, np.array([end_clipping_point.x])))
+                y = np.concatenate((y, np.array([end_clipping_point.y])))
+        return x, y
+
+    def uniform_subset_for_primary_val_range(self, start: float, end: float) -> Tuple[float, float, np.ndarray]:
+        """Get Subset of the data without creating its x values
+
+        Args:
+            start: start boundary for x values of points that should be included in the subset
+            end: end boundary for x values of points that should be included in the subset
+
+        Returns:
+            X value of the first point, distance between the points and the Y Values
+            of the subset in a tuple of the form (x0, dx, y)
+        """
+        start_index, end_index = self._indices_for_primary_val_range(start=start, end=end)
+        return (
+            float(self._x_at(np.array([start_index]))[0]),
+            self._step_width,
+            self._logical_slice(start=start_index, end=end_index),
+        )
+
+    def as_np_array(self) -> Tuple[np.ndarray, np.ndarray]:
+        """ Return Buffer as Tuple of Numpy arrays
+
+        The x values are created from the grid, the y values are a view, as
+        long as they do not wrap around the end of the buffer's array.
+        """
+        return self._x_at(np.arange(self._count)), self._logical_slice(start=0, end=self._count)
+
+    # ~~~~~~~~~~ Properties ~~~~~~~~~~
+
+    @property
+    def x0(self) -> Optional[float]:
+        """X value of the first point ever added to the buffer"""
+        return self._x0
+
+    @property
+    def dx(self) -> Optional[float]:
+        """Distance between the x values of two neighbouring points"""
+        return self._dx
+
+    @property
+    def space_left(self) -> int:
+        """Free spaces left in the buffer"""
+        return self._size - self._count
+
+    @property
+    def occupied_size(self) -> int:
+        """Amount of occupied indices"""
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """Maximum entry count the buffer can hold."""
+        return self._y_values.size
+
+    @property
+    def index_of_last_valid(self) -> int:
+        """Index of the newest point, -1 for an empty buffer"""
+        return self._count - 1
+
+    @property
+    def last_valid_primary_value(self) -> Optional[float]:
+        """The x value of the newest point"""
+        if self._count == 0:
+            return None
+        return float(self._x_at(np.array([self._count - 1]))[0])
+
+    @property
+    def is_circular(self) -> bool:
+        """Are the oldest entries overwritten in place, if the buffer is full"""
+        return True
+
+    @property
+    def min_dx(self) -> float:
+        """Smallest distance between two x values in the buffer"""
+        if self._dx is None or self._count < 2:
+            return np.inf
+        return self._dx
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the buffer is still empty"""
+        return self._count == 0
+
+    # ~~~~~~~~~~ Private ~~~~~~~~~~
+
+    @property
+    def _step_width(self) -> float:
+        """Distance between two points, as long as it is not known, each step is 1 wide."""
+        return self._dx if self._dx is not None else 1.0
+
+    def _set_dx(self, dx: float) -> None:
+        if not dx > 0:
+            raise ValueError(f"The distance between the points has to be positive, not {dx}.")
+        self._dx = float(dx)
+
+    def _x_at(self, indices: np.ndarray) -> np.ndarray:
+        """X values of the entries with the given logical indices."""
+        return np.add(np.multiply(indices + self._first_step, self._step_width), self._x0 or 0.0)
+
+    def _steps_on_grid(self, x: np.ndarray) -> np.ndarray:
+        """
+        Steps on the grid for the passed x values.
+
+        Raises:
+            ValueError: A value is not on the grid or its step is already in the buffer
+        """
+        steps = (x - self._x0) / self._step_width
+        rounded = np.round(steps)
+        if np.any(np.abs(steps - rounded) > _GRID_TOLERANCE):
+            raise ValueError(f"The x values {x} are not on the grid of the buffer "
+                             f"(x0={self._x0}, dx={self._dx}).")
+        rounded = rounded.astype(int)
+        if self._count > 0 and rounded[0] < self._first_step + self._count:
+            raise ValueError(f"The x values {x} are not bigger than the newest "
+                             f"x value {self.last_valid_primary_value} in the buffer.")
+        return rounded
+
+    def _write_steps(self, first_step: int, y: np.ndarray) -> None:
+        """
+        Write the passed y values to the steps from first_step on. Skipped
+        steps between the newest entry and the new ones are filled with NaN.
+        """
+        gap = first_step - (self._first_step + self._count) if self._count > 0 else 0
+        if gap >= self._size or self._count == 0:
+            self._head = 0
+            self._count = 0
+            self._first_step = first_step
+        elif gap > 0:
+            filler = np.empty(gap)
+            filler.fill(np.nan)
+            y = np.concatenate((filler, y))
+        if y.size > self._size:
+            self._drop(self._count)
+            self._first_step += y.size - self._size
+            y = y[-self._size:]
+        overflow = self._count + y.size - self._size
+        if overflow > 0:
+            self._drop(overflow)
+        start = (self._head + self._count) % self._size
+        first_part = min(y.size, self._size - start)
+        self._y_values[start:start + first_part] = y[:first_part]
+        self._y_values[:y.size - first_part] = y[first_part:]
+        self._count += y.size
+
+    def _drop(self, count: int) -> None:
+        """Remove the given count of oldest entries."""
+        self._head = (self._head + count) % self._size
+        self._first_step += count
+        self._count -= count
+
+    def _logical_slice(self, start: int, end: int) -> np.ndarray:
+        """
+        Y values with the logical indices start to end (exclusive). As long as
+        the range does not wrap around the end of the array, the returned array
+        is a view, otherwise a copy.
+        """
+        physical_start = self._head + start
+        physical_end = self._head + end
+        if physical_end <= self._size:
+            return self._y_values[physical_start:physical_end]
+        if physical_start >= self._size:
+            return self._y_values[physical_start - self._size:physical_end - self._size]
+        return np.concatenate((self._y_values[physical_start:], self._y_values[:physical_end - self._size]))
+
+    def _indices_for_primary_val_range(self, start: float, end: float) -> Tuple[int, int]:
+        """Logical indices of the first point with x >= start and behind the last one with x <= end."""
+        if self._count == 0:
+            return 0, 0
+        x0 = self._x0 or 0.0
+        start_step = np.ceil((start - x0) / self._step_width - _GRID_TOLERANCE)
+        end_step = np.floor((end - x0) / self._step_width + _GRID_TOLERANCE) + 1
+        start_index = int(np.clip(start_step - self._first_step, 0, self._count))
+        end_index = int(np.clip(end_step - self._first_step, start_index, self._count))
+        return start_index, end_index
+
+    def _decimated_indices(self, start_index: int, end_index: int, max_points: int) -> np.ndarray:
+        """
+        Logical indices of a peak preserving decimated subset of the given range,
+        see :func:`min_max_decimation_indices`.
+        """
+        indices = min_max_decimation_indices(
+            y=self._logical_slice(start=start_index, end=end_index),
+            max_points=max_points,
+        )
+        return np.where(indices < 0, -1, indices + start_index)
+
+    def _intersection_with_boundary(self, boundary: float, after: int) -> Optional[PointData]:
+        """
+        Interpolate the curve between the entries with the logical indices
+        after - 1 and after at the boundary, if the boundary is between them.
+        """
+        if not 0 < after < self._count:
+            return None
+        before_x, after_x = self._x_at(np.array([after - 1, after]))
+        if not before_x < boundary < after_x:
+            return None
+        point_in_front_of_boundary = PointData(x=before_x, y=self._y_values[(self._head + after - 1) % self._size])
+        point_after_boundary = PointData(x=after_x, y=self._y_values[(self._head + after) % self._size])
+        if point_in_front_of_boundary.is_nan or point_after_boundary.is_nan:
+            return None
+        return calc_intersection(point_in_front_of_boundary, point_after_boundary, boundary)
+
+
 class SortedBarGraphDataBuffer(BaseSortedDataBuffer):
 
     """
@@ -706,7 +1722,13 @@ class SortedBarGraphDataBuffer(BaseSortedDataBuffer):
         super().add_entry_to_buffer(primary_value=x, secondary_values=[y, height])
 
     @deprecated_param_alias(x_values="x", y_values="y")
-    def add_list_of_entries(self, x: np.ndarray, y: np.ndarray, heights: np.ndarray) -> None:
+    def add_list_of_entries(
+            self,
+            x: np.ndarray,
+            y: np.ndarray,
+            heights: np.ndarray,
+            keep_order: bool = False,
+    ) -> None:
         """Append a list of bars to the buffer
 
         It is expected, that the passed data is valid. Make sure before calling,
@@ -716,8 +1738,9 @@ class SortedBarGraphDataBuffer(BaseSortedDataBuffer):
             x: Array of x values that should be added to the buffer
             y: Array of y values that should be added to the buffer
             heights: Array of bar-heights that should be added to the buffer
+            keep_order: Add the bars as if they were added one after another
         """
-        super().add_entries_to_buffer(primary_values=x, secondary_values_list=[y, heights])
+        super().add_entries_to_buffer(primary_values=x, secondary_values_list=[y, heights], keep_order=keep_order)
 
     def subset_for_primary_val_range(self, start: float, end: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """ Get Subset of a specific start and end point
@@ -729,22 +1752,9 @@ class SortedBarGraphDataBuffer(BaseSortedDataBuffer):
         Returns:
             Primary and Secondary Values of the subset in a tuple of the form (x, y, height_values)
         """
-        i = self.occupied_size
-        x: np.ndarray = self._primary_values[:i]
-        y: np.ndarray = self._secondary_values_lists[0][:i]
-        height: np.ndarray = self._secondary_values_lists[1][:i]
-        start_index = self._searchsorted_with_nans(array=x, value=start, side="left")
-        end_index = self._searchsorted_with_nans(array=x, value=end, side="right")
-        start_index, end_index = super()._get_indices_for_cutting_leading_and_trailing_nans(
-            primary_values=x,
-            start_index=start_index,
-            end_index=end_index,
-        )
-        return (
-            x[start_index:end_index],
-            y[start_index:end_index],
-            height[start_index:end_index],
-        )
+        start_index, end_index = self._indices_for_primary_val_range(start=start, end=end)
+        x, y, height = self._logical_slices(start=start_index, end=end_index)
+        return x, y, height
 
 
 class SortedInjectionBarsDataBuffer(BaseSortedDataBuffer):
@@ -810,6 +1820,7 @@ class SortedInjectionBarsDataBuffer(BaseSortedDataBuffer):
         heights: np.ndarray,
         widths: np.ndarray,
         labels: np.ndarray,
+        keep_order: bool = False,
     ) -> None:
         """Append a list of injection bars to the buffer
 
@@ -822,10 +1833,12 @@ class SortedInjectionBarsDataBuffer(BaseSortedDataBuffer):
             heights: Array of heights that should be added to the buffer
             widths: Array of widths that should be added to the buffer
             labels: Array of label texts that should be added to the buffer
+            keep_order: Add the injection bars as if they were added one after another
         """
         super().add_entries_to_buffer(
             primary_values=x,
             secondary_values_list=[y, heights, widths, labels],
+            keep_order=keep_order,
         )
 
     def subset_for_primary_val_range(self, start: float, end: float) -> Tuple[
@@ -845,26 +1858,9 @@ class SortedInjectionBarsDataBuffer(BaseSortedDataBuffer):
             Primary and Secondary Values of the subset in a tuple of the form
             (x_values, y_values, height_values, width_values, labels)
         """
-        i = self.occupied_size
-        x: np.ndarray = self._primary_values[:i]
-        y: np.ndarray = self._secondary_values_lists[0][:i]
-        heights: np.ndarray = self._secondary_values_lists[1][:i]
-        widths: np.ndarray = self._secondary_values_lists[2][:i]
-        labels: np.ndarray = self._secondary_values_lists[3][:i]
-        start_index = self._searchsorted_with_nans(array=x, value=start, side="left")
-        end_index = self._searchsorted_with_nans(array=x, value=end, side="right")
-        start_index, end_index = super()._get_indices_for_cutting_leading_and_trailing_nans(
-            primary_values=x,
-            start_index=start_index,
-            end_index=end_index,
-        )
-        return (
-            x[start_index:end_index],
-            y[start_index:end_index],
-            heights[start_index:end_index],
-            widths[start_index:end_index],
-            labels[start_index:end_index],
-        )
+        start_index, end_index = self._indices_for_primary_val_range(start=start, end=end)
+        x, y, heights, widths, labels = self._logical_slices(start=start_index, end=end_index)
+        return x, y, heights, widths, labels
 
 
 class SortedTimestampMarkerDataBuffer(BaseSortedDataBuffer):
@@ -904,7 +1900,13 @@ class SortedTimestampMarkerDataBuffer(BaseSortedDataBuffer):
         super().add_entry_to_buffer(primary_value=x, secondary_values=[color, label])
 
     @deprecated_param_alias(x_values="x")
-    def add_list_of_entries(self, x: np.ndarray, colors: np.ndarray, labels: np.ndarray) -> None:
+    def add_list_of_entries(
+            self,
+            x: np.ndarray,
+            colors: np.ndarray,
+            labels: np.ndarray,
+            keep_order: bool = False,
+    ) -> None:
         """Append a list of infinite lines
 
         It is expected, that the passed data is valid. Make sure before calling,
@@ -914,8 +1916,9 @@ class SortedTimestampMarkerDataBuffer(BaseSortedDataBuffer):
             x: Array of x values that should be added to the buffer
             colors: Array of colors that should be added to the buffer
             labels: Array of label texts that should be added to the buffer
+            keep_order: Add the lines as if they were added one after another
         """
-        super().add_entries_to_buffer(primary_values=x, secondary_values_list=[colors, labels])
+        super().add_entries_to_buffer(primary_values=x, secondary_values_list=[colors, labels], keep_order=keep_order)
 
     def subset_for_primary_val_range(self, start: float, end: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """ Get Subset of a specific start and end point
@@ -928,20 +1931,96 @@ class SortedTimestampMarkerDataBuffer(BaseSortedDataBuffer):
             Primary and Secondary Values of the subset in a tuple of the form
             (x_values, colors, labels)
         """
-        i = self.occupied_size
-        x: np.ndarray = self._primary_values[:i]
-        color: np.ndarray = self._secondary_values_lists[0][:i]
-        label: np.ndarray = self._secondary_values_lists[1][:i]
-        start_index = self._searchsorted_with_nans(array=x, value=start, side="left")
-        end_index = self._searchsorted_with_nans(array=x, value=end, side="right")
-        # indices for removing leading/trailing entries that have NaN as their primary value
-        start_index, end_index = super()._get_indices_for_cutting_leading_and_trailing_nans(
-            primary_values=x,
-            start_index=start_index,
-            end_index=end_index,
-        )
-        return (
-            x[start_index:end_index],
-            color[start_index:end_index],
-            label[start_index:end_index],
-        )
+        start_index, end_index = self._indices_for_primary_val_range(start=start, end=end)
+        x, color, label = self._logical_slices(start=start_index, end=end_index)
+        return x, color, label
+
+
+def min_max_decimation_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Indices of a peak preserving decimated subset of the passed values.
+
+    The values are split into chunks and the values with the smallest and
+    biggest value of each chunk are kept in their original order. Chunks
+    containing NaN values are followed by -1, which marks a gap. The first
+    and last value are always kept, so the curve does not get shorter.
+
+    Args:
+        y: Values to decimate
+        max_points: Count of indices the subset should contain at max
+
+    Returns:
+        Indices of the kept values, -1 for gaps
+    """
+    if y.size <= max_points:
+        return np.arange(y.size)
+    chunk_size = math.ceil(y.size / _min_max_chunk_count(max_points))
+    extremes = _chunk_min_max(min_candidates=y, max_candidates=y, chunk_size=chunk_size)
+    return np.concatenate(([0], _min_max_indices(*extremes), [y.size - 1]))
+
+
+def _min_max_chunk_count(max_points: int) -> int:
+    """
+    Count of chunks a peak preserving decimated subset with at max max_points
+    points can consist of. Each chunk results in up to two extremes and a gap,
+    additionally the first and last point are kept.
+    """
+    return max((max_points - 2) // 3, 1)
+
+
+def _chunk_min_max(
+        min_candidates: np.ndarray,
+        max_candidates: np.ndarray,
+        chunk_size: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split the values into chunks of the given size, of which the last one may
+    be shorter, and find the smallest and biggest value in each chunk. NaN
+    values are skipped, chunks without any number have inf as smallest and
+    -inf as biggest value.
+
+    Args:
+        min_candidates: Values the smallest values are searched in
+        max_candidates: Values the biggest values are searched in
+        chunk_size: Count of values in each chunk
+
+    Returns:
+        Indices of the smallest and biggest values, the values themselves and
+        if the chunks contain NaN values
+    """
+    chunk_count = -(-min_candidates.size // chunk_size)
+    padding = chunk_count * chunk_size - min_candidates.size
+    nans = np.isnan(min_candidates) | np.isnan(max_candidates)
+    mins = np.pad(np.where(nans, np.inf, min_candidates), (0, padding), constant_values=np.inf)
+    maxs = np.pad(np.where(nans, -np.inf, max_candidates), (0, padding), constant_values=-np.inf)
+    mins = mins.reshape(chunk_count, chunk_size)
+    maxs = maxs.reshape(chunk_count, chunk_size)
+    rows = np.arange(chunk_count)
+    min_columns = mins.argmin(axis=1)
+    max_columns = maxs.argmax(axis=1)
+    return (
+        rows * chunk_size + min_columns,
+        rows * chunk_size + max_columns,
+        mins[rows, min_columns],
+        maxs[rows, max_columns],
+        np.pad(nans, (0, padding), constant_values=False).reshape(chunk_count, chunk_size).any(axis=1),
+    )
+
+
+def _min_max_indices(
+        min_indices: np.ndarray,
+        max_indices: np.ndarray,
+        min_values: np.ndarray,
+        max_values: np.ndarray,
+        gaps: np.ndarray,
+) -> np.ndarray:
+    """
+    Indices of the extremes of each chunk in their original order, chunks
+    containing NaN values are followed by -1, which marks a gap.
+    """
+    empty: np.ndarray = np.greater(min_values, max_values)
+    first_indices = np.minimum(min_indices, max_indices)
+    second_indices = np.maximum(min_indices, max_indices)
+    indices = np.stack((first_indices, second_indices, np.full(first_indices.size, -1)), axis=1)
+    kept = np.stack((~empty, ~empty & (second_indices != first_indices), gaps), axis=1)
+    return indices[kept]
@@ -121,14 +121,7 @@ class PointData(PlottingItemData):
         Returns:
             True if the point is valid
         """
-        if np.isnan(self.x) and not np.isnan(self.y):
-            if warn:
-                msg = "A point with NaN as the x value and a value other than NaN as a y-value " \
-                      f"is not valid. If you emit {self} to an curve, " \
-                      f"it won't be represented as a point in the curve."
-                warnings.warn(msg, InvalidDataStructureWarning)
-            return False
-        return True
+        return _validate_point(point=self, warn=warn)
 
     @property
     def is_nan(self) -> bool:
@@ -136,38 +129,21 @@ class PointData(PlottingItemData):
         return np.isnan(self.x) or np.isnan(self.y)
 
 
-class CurveData(PlottingItemData):
+class _CurveDataMixin:
 
-    @deprecated_param_alias(x_values="x", y_values="y")
-    def __init__(
-            self,
-            x: Sequence[float],
-            y: Sequence[float],
-            parent=None,
-    ):
-        """Collection of data for points representing a curve.
+    """Values and checks shared by CurveData, UniformCurveData and PointBatchData"""
 
-        Emitting invalid points to a curve will result in the invalid points **being
-        dropped.** See :func:`CurveData.is_valid` to see in which cases a point
-        can be invalid.
+    x: np.ndarray
+    y: np.ndarray
 
-        Args:
-            x: list of x values of the points
-            y: list of y values of the points
-            parent: Parent object for the base class
-        """
-        super().__init__(parent)
-        if not isinstance(x, np.ndarray):
-            x = np.array(x)
-        if not isinstance(y, np.ndarray):
-            y = np.array(y)
-        if x.size != y.size:
+    def _set_values(self, x: Union[Sequence[float], np.ndarray], y: Union[Sequence[float], np.ndarray]) -> None:
+        x_values: np.ndarray = np.asarray(x)
+        y_values: np.ndarray = np.asarray(y)
+        if x_values.size != y_values.size:
             raise ValueError(f"The curve cannot be created with different count of x"
-                             f" ({x.size}) and y values ({y.size}).")
-        self.x: np.ndarray = x
-        self.y: np.ndarray = y
-        # Check validity on creation to warn user in case some points are invalid
-        self.is_valid(warn=True)
+                             f" ({x_values.size}) and y values ({y_values.size}).")
+        self.x = x_values
+        self.y = y_values
 
     def __eq__(self, other: Any) -> bool:
         if self.__class__ != other.__class__:
@@ -195,13 +171,10 @@ class CurveData(PlottingItemData):
         Returns:
             Bool array which contains True, if the point at that index is valid
         """
-        problems: List[str] = []
-        valid_indices = np.ones(self.x.size, dtype=bool)
-        for index, (x_data, y_data) in enumerate(zip(self.x, self.y)):
-            if (x_data is None or np.isnan(x_data)) and (y_data is not None and not np.isnan(y_data)):
-                problems.append(f"Point {index}: (x={x_data}, y={y_data})")
-                valid_indices[index] = False
-        if problems and warn:
+        valid_indices = ~(_nan_mask(self.x) & ~_nan_mask(self.y))
+        if warn and not valid_indices.all():
+            problems = [f"Point {index}: (x={self.x[index]}, y={self.y[index]})"
+                        for index in np.flatnonzero(~valid_indices)]
             msg = "Points in CurveData with NaN as the x value and a value other than NaN " \
                   "as a y-value is not valid. This applies to the following points: " \
                   "(" + ", ".join(problems) + ") " + \
@@ -210,6 +183,102 @@ class CurveData(PlottingItemData):
         return valid_indices
 
 
+class CurveData(_CurveDataMixin, PlottingItemData):
+
+    @deprecated_param_alias(x_values="x", y_values="y")
+    def __init__(
+            self,
+            x: Sequence[float],
+            y: Sequence[float],
+            parent=None,
+    ):
+        """Collection of data for points representing a curve.
+
+        Emitting invalid points to a curve will result in the invalid points **being
+        dropped.** See :func:`CurveData.is_valid` to see in which cases a point
+        can be invalid.
+
+        Args:
+            x: list of x values of the points
+            y: list of y values of the points
+            parent: Parent object for the base class
+        """
+        super().__init__(parent)
+        self._set_values(x=x, y=y)
+        # Check validity on creation to warn user in case some points are invalid
+        self.is_valid(warn=True)
+
+
+class UniformCurveData(_CurveDataMixin, PlottingItemData):
+
+    def __init__(
+            self,
+            y: Sequence[float],
+            x0: float = 0.0,
+            dx: float = 1.0,
+            parent=None,
+    ):
+        """Collection of uniformly sampled points representing a curve.
+
+        Instead of one x value per point, only the x value of the first point
+        and the distance between two neighbouring points are saved. The x
+        values are only calculated, when they are accessed the first time.
+
+        Args:
+            y: list of y values of the points
+            x0: x value of the first point
+            dx: distance between the x values of two neighbouring points
+            parent: Parent object for the base class
+
+        Raises:
+            ValueError: The distance between two points is not positive
+        """
+        super().__init__(parent)
+        x0 = x0 if x0 is not None else np.nan
+        dx = dx if dx is not None else np.nan
+        if dx <= 0:
+            raise ValueError(f"The curve cannot be created with a distance between "
+                             f"its points of {dx}, which is not positive.")
+        self.x0: float = x0
+        self.dx: float = dx
+        self.y: np.ndarray = np.asarray(y)
+        self._x: Optional[np.ndarray] = None
+        # Check validity on creation to warn user in case some points are invalid
+        self.is_valid(warn=True)
+
+    @property
+    def x(self) -> np.ndarray:
+        """X values of the points, calculated when they are accessed the first time."""
+        if self._x is None:
+            self._x = self.x0 + self.dx * np.arange(self.y.size)
+        return self._x
+
+    @x.setter
+    def x(self, x: np.ndarray) -> None:
+        self._x = x
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}: (x0={self.x0}, dx={self.dx}, y={self.y})"
+
+    def is_valid(self, warn: bool = False) -> np.ndarray:
+        """Check if all points in the collection are valid
+
+        As long as the first x value and the distance between the points
+        are numbers, all points are valid. Otherwise the same cases as in
+        :func:`CurveData.is_valid` apply.
+
+        Args:
+            warn: Should a warning be emitted if the data structure is invalid
+
+        Returns:
+            Bool array which contains True, if the point at that index is valid
+        """
+        if np.isnan(self.x0) or np.isnan(self.dx):
+            return super().is_valid(warn=warn)
+        # Read-only view, which does not allocate memory for each point
+        return np.broadcast_to(True, self.y.shape)
+
+
 class BarData(PlottingItemData):
 
     @deprecated_param_alias(x_value="x", y_value="y")
@@ -269,58 +338,32 @@ class BarData(PlottingItemData):
         Returns:
             True if the bar is valid
         """
-        problems: List[str] = []
-        if np.isnan(self.x):
-            problems.append("NaN as the x value is not valid")
-        if np.isnan(self.height):
-            problems.append("NaN as the height is not valid")
-        if problems:
-            if warn:
-                warning_message = f"{self} is invalid for the following reasons: " \
-                                  "(" + ", ".join(problems) + ") " + \
-                                  "If you emit this bar to bar-graph, it won't be drawn."
-                warnings.warn(warning_message, InvalidDataStructureWarning)
-            return False
-        return True
+        return _validate_bar(bar=self, warn=warn)
 
 
-class BarCollectionData(PlottingItemData):
+class _BarCollectionDataMixin:
 
-    @deprecated_param_alias(x_values="x", y_values="y")
-    def __init__(
-            self,
-            x: Sequence[float],
-            y: Sequence[float],
-            heights: Sequence[float],
-            parent=None,
-    ):
-        """Collection of data for multiple bars
+    """Values and checks shared by BarCollectionData and BarBatchData"""
 
-        Emitting invalid bars to a bar graph will result in the invalid bars **being
-        dropped.** See :func:`BarCollectionData.is_valid` to see in which cases a point
-        can be invalid.
+    x: np.ndarray
+    y: np.ndarray
+    heights: np.ndarray
 
-        Args:
-            x: list of x positions that represent the center of the bar
-            y: list of y positions that represent the center of the bar
-            heights: list of bar heights
-            parent: Parent object for the base class
-        """
-        super().__init__(parent)
-        if not isinstance(x, np.ndarray):
-            x = np.array(x)
-        if not isinstance(y, np.ndarray):
-            y = np.array(y)
-        if not isinstance(heights, np.ndarray):
-            heights = np.array(heights)
-        if not x.size == y.size == heights.size:
+    def _set_values(
+            self,
+            x: Union[Sequence[float], np.ndarray],
+            y: Union[Sequence[float], np.ndarray],
+            heights: Union[Sequence[float], np.ndarray],
+    ) -> None:
+        x_values: np.ndarray = np.asarray(x)
+        y_values: np.ndarray = np.asarray(y)
+        height_values: np.ndarray = np.asarray(heights)
+        if not x_values.size == y_values.size == height_values.size:
             raise ValueError(f"The bar collection cannot be created with different length "
-                             f"parameters: ({x.size}, {y.size}, {heights.size}).")
-        self.x: np.ndarray = x
-        self.y: np.ndarray = np.nan_to_num(y, copy=True)
-        self.heights: np.ndarray = heights
-        # Check validity on creation to warn user in case some bars are invalid
-        self.is_valid(warn=True)
+                             f"parameters: ({x_values.size}, {y_values.size}, {height_values.size}).")
+        self.x = x_values
+        self.y = np.nan_to_num(y_values, copy=True)
+        self.heights = height_values
 
     def __eq__(self, other: Any) -> bool:
         if self.__class__ != other.__class__:
@@ -336,7 +379,7 @@ class BarCollectionData(PlottingItemData):
         return f"{type(self).__name__}: (x={self.x}, " \
             f"y={self.y}, height={self.heights})"
 
-    def is_valid(self, warn: bool = False) -> bool:
+    def is_valid(self, warn: bool = False) -> np.ndarray:
         """Check if all bars are valid
 
         A bar is invalid, if missing values can not be replaced with a
@@ -354,13 +397,11 @@ class BarCollectionData(PlottingItemData):
         Returns:
             Bool array which contains True, if the bar at that index is valid
         """
-        problems: List[str] = []
-        valid_indices = np.ones(self.x.size, dtype=bool)
-        for index, (x_data, y_data, height) in enumerate(zip(self.x, self.y, self.heights)):
-            if (x_data is None or np.isnan(x_data)) or (height is None or np.isnan(height)):
-                problems.append(f"Bar {index}: (x={x_data}, y={y_data}, height={height})")
-                valid_indices[index] = False
-        if problems and warn:
+        invalid_indices: np.ndarray = _nan_mask(self.x) | _nan_mask(self.heights)
+        valid_indices = ~invalid_indices
+        if warn and not valid_indices.all():
+            problems = [f"Bar {index}: (x={self.x[index]}, y={self.y[index]}, height={self.heights[index]})"
+                        for index in np.flatnonzero(~valid_indices)]
             msg = "Bars with NaN as x value or height are invalid." \
                   "This applies to the following bars: " \
                   "(" + ", ".join(problems) + ") " + \
@@ -369,6 +410,34 @@ class BarCollectionData(PlottingItemData):
         return valid_indices
 
 
+class BarCollectionData(_BarCollectionDataMixin, PlottingItemData):
+
+    @deprecated_param_alias(x_values="x", y_values="y")
+    def __init__(
+            self,
+            x: Sequence[float],
+            y: Sequence[float],
+            heights: Sequence[float],
+            parent=None,
+    ):
+        """Collection of data for multiple bars
+
+        Emitting invalid bars to a bar graph will result in the invalid bars **being
+        dropped.** See :func:`BarCollectionData.is_valid` to see in which cases a point
+        can be invalid.
+
+        Args:
+            x: list of x positions that represent the center of the bar
+            y: list of y positions that represent the center of the bar
+            heights: list of bar heights
+            parent: Parent object for the base class
+        """
+        super().__init__(parent)
+        self._set_values(x=x, y=y, heights=heights)
+        # Check validity on creation to warn user in case some bars are invalid
+        self.is_valid(warn=True)
+
+
 class InjectionBarData(PlottingItemData):
 
     @deprecated_param_alias(x_value="x", y_value="y")
@@ -436,69 +505,41 @@ class InjectionBarData(PlottingItemData):
         Returns:
             True if the injection bar is valid
         """
-        problems: List[str] = []
-        if np.isnan(self.x):
-            problems.append("NaN as the x value is not valid")
-        if np.isnan(self.y):
-            problems.append("NaN as the y value is not valid")
-        if problems:
-            if warn:
-                warning_message = f"{self} is invalid for the following reasons: " \
-                                  "(" + ", ".join(problems) + ") " + \
-                                  "If you emit this injection bar to an graph, it won't be drawn."
-                warnings.warn(warning_message, InvalidDataStructureWarning)
-            return False
-        return True
+        return _validate_injection_bar(injection_bar=self, warn=warn)
 
 
-class InjectionBarCollectionData(PlottingItemData):
+class _InjectionBarCollectionDataMixin:
 
-    @deprecated_param_alias(x_values="x", y_values="y")
-    def __init__(
-        self,
-        x: Sequence[float],
-        y: Sequence[float],
-        heights: Sequence[float],
-        widths: Sequence[float],
-        labels: Sequence[str],
-        parent: Optional[QObject] = None,
-    ):
-        """Collection of data for multiple injection bars.
+    """Values and checks shared by InjectionBarCollectionData and InjectionBarBatchData"""
 
-        Emitting invalid injection bars to a graph will result in the invalid bars **being
-        dropped.** See :func:`InjectionBarData.is_valid` to see in which cases a bar
-        can be invalid.
+    x: np.ndarray
+    y: np.ndarray
+    heights: np.ndarray
+    widths: np.ndarray
+    labels: np.ndarray
 
-        Args:
-            x: list of x positions of the center of each bar
-            y: list of y positions of the center of each bar
-            heights: list of lengths of the vertical lines of a bar
-            widths: list of lengths of the horizontal lines of a bar
-            labels: list of texts displayed at the top of each bar
-            parent: parent item of the base class
-        """
-        super().__init__(parent)
-        if not isinstance(x, np.ndarray):
-            x = np.array(x)
-        if not isinstance(y, np.ndarray):
-            y = np.array(y)
-        if not isinstance(heights, np.ndarray):
-            heights = np.array(heights)
-        if not isinstance(widths, np.ndarray):
-            widths = np.array(widths)
-        if not isinstance(labels, np.ndarray):
-            labels = np.array(labels)
-        if not x.size == y.size == heights.size == widths.size == labels.size:
+    def _set_values(
+        self,
+        x: Union[Sequence[float], np.ndarray],
+        y: Union[Sequence[float], np.ndarray],
+        heights: Union[Sequence[float], np.ndarray],
+        widths: Union[Sequence[float], np.ndarray],
+        labels: Union[Sequence[str], np.ndarray],
+    ) -> None:
+        x_values: np.ndarray = np.asarray(x)
+        y_values: np.ndarray = np.asarray(y)
+        height_values: np.ndarray = np.asarray(heights)
+        width_values: np.ndarray = np.asarray(widths)
+        label_values: np.ndarray = np.asarray(labels)
+        if not x_values.size == y_values.size == height_values.size == width_values.size == label_values.size:
             raise ValueError(f"The injection bar collection cannot be created with different length "
-                             f"parameters: ({x.size}, {y.size}, {heights.size},"
-                             f"{widths.size}, {labels.size}).")
-        self.x: np.ndarray = x
-        self.y: np.ndarray = y
-        self.heights: np.ndarray = np.nan_to_num(heights)
-        self.widths: np.ndarray = np.nan_to_num(widths)
-        self.labels: np.ndarray = labels
-        # Check validity on creation to warn user in case some injection bars are invalid
-        self.is_valid(warn=True)
+                             f"parameters: ({x_values.size}, {y_values.size}, {height_values.size},"
+                             f"{width_values.size}, {label_values.size}).")
+        self.x = x_values
+        self.y = y_values
+        self.heights = np.nan_to_num(height_values)
+        self.widths = np.nan_to_num(width_values)
+        self.labels = label_values
 
     def __eq__(self, other: Any) -> bool:
         if self.__class__ != other.__class__:
@@ -518,7 +559,7 @@ class InjectionBarCollectionData(PlottingItemData):
         return f"{type(self).__name__}: (x={self.x}, y={self.y}, " \
             f"heights={self.heights}, widths={self.widths}, labels={self.labels})"
 
-    def is_valid(self, warn: bool = False) -> bool:
+    def is_valid(self, warn: bool = False) -> np.ndarray:
         """Check if the injection bars are valid
 
         An injection bar is invalid, if missing values can not be replaced with a default
@@ -536,13 +577,12 @@ class InjectionBarCollectionData(PlottingItemData):
         Returns:
             Bool array, with true if the injection bar at this index is valid
         """
-        problems: List[str] = []
-        valid_indices = np.ones(self.x.size, dtype=bool)
-        for index, (x_data, y_data, height, width, label) in enumerate(zip(self.x, self.y, self.heights, self.widths, self.labels)):
-            if x_data is None or np.isnan(x_data) or y_data is None or np.isnan(y_data):
-                problems.append(f"InjectionBarData {index}: (x={x_data}, y={y_data}, height={height}, width={width}, labels={label})")
-                valid_indices[index] = False
-        if problems and warn:
+        invalid_indices: np.ndarray = _nan_mask(self.x) | _nan_mask(self.y)
+        valid_indices = ~invalid_indices
+        if warn and not valid_indices.all():
+            problems = [f"InjectionBarData {index}: (x={self.x[index]}, y={self.y[index]}, height={self.heights[index]}, "
+                        f"width={self.widths[index]}, labels={self.labels[index]})"
+                        for index in np.flatnonzero(~valid_indices)]
             msg = "InjectionBars in InjectionBarData with NaN as x or y value are invalid." \
                   "This applies to the following bars: " \
                   "(" + ", ".join(problems) + ") " + \
@@ -551,6 +591,38 @@ class InjectionBarCollectionData(PlottingItemData):
         return valid_indices
 
 
+class InjectionBarCollectionData(_InjectionBarCollectionDataMixin, PlottingItemData):
+
+    @deprecated_param_alias(x_values="x", y_values="y")
+    def __init__(
+        self,
+        x: Sequence[float],
+        y: Sequence[float],
+        heights: Sequence[float],
+        widths: Sequence[float],
+        labels: Sequence[str],
+        parent: Optional[QObject] = None,
+    ):
+        """Collection of data for multiple injection bars.
+
+        Emitting invalid injection bars to a graph will result in the invalid bars **being
+        dropped.** See :func:`InjectionBarData.is_valid` to see in which cases a bar
+        can be invalid.
+
+        Args:
+            x: list of x positions of the center of each bar
+            y: list of y positions of the center of each bar
+            heights: list of lengths of the vertical lines of a bar
+            widths: list of lengths of the horizontal lines of a bar
+            labels: list of texts displayed at the top of each bar
+            parent: parent item of the base class
+        """
+        super().__init__(parent)
+        self._set_values(x=x, y=y, heights=heights, widths=widths, labels=labels)
+        # Check validity on creation to warn user in case some injection bars are invalid
+        self.is_valid(warn=True)
+
+
 class TimestampMarkerData(PlottingItemData):
 
     @deprecated_param_alias(x_value="x")
@@ -575,16 +647,7 @@ class TimestampMarkerData(PlottingItemData):
         """
         super().__init__(parent)
         self.x: float = x if x is not None else np.nan
-        # Catch invalid colors and replace with the default color to prevent exceptions
-        try:
-            pg.mkColor(color)
-        except Exception:  # pylint: disable=broad-except
-            # mkColor() raises Exception every time it can not interpret the passed color
-            # In these cases we want to fall back to our default color
-            warnings.warn(f"Timestamp Marker color '{color}' is replaced with {DEFAULT_COLOR} "
-                          f"since '{color}' can not be used as a color.", WrongValueWarning)
-            color = DEFAULT_COLOR
-        self.color: str = color if color is not None else DEFAULT_COLOR
+        self.color: str = _usable_color(color)
         self.label: str = label if label is not None else ""
         # Check validity on creation to warn user in case the timestamp marker is invalid
         self.is_valid(warn=True)
@@ -619,68 +682,38 @@ class TimestampMarkerData(PlottingItemData):
         Returns:
             True if the timestamp marker is valid
         """
-        if np.isnan(self.x):
-            if warn:
-                warning_message = "NaN is not a valid x value for the timestamp " \
-                                  "marker. If you emit this timeline to an graph, " \
-                                  "it won't be drawn."
-                warnings.warn(warning_message, InvalidDataStructureWarning)
-            return False
-        return True
+        return _validate_timestamp_marker(marker=self, warn=warn)
 
 
-class TimestampMarkerCollectionData(PlottingItemData):
+class _TimestampMarkerCollectionDataMixin:
 
-    @deprecated_param_alias(x_values="x")
-    def __init__(
-            self,
-            x: Sequence[float],
-            colors: Sequence[str],
-            labels: Sequence[str],
-            parent=None,
-    ):
-        """Collection of data for timestamp markers
+    """Values and checks shared by TimestampMarkerCollectionData and TimestampMarkerBatchData"""
 
-        Emitting invalid timestamp markers to a graph will result in
-        the invalid markers **being dropped.** See
-        :func:`TimestampMarkerData.is_valid` to see in which cases a marker
-        can be invalid.
+    x: np.ndarray
+    colors: np.ndarray
+    labels: np.ndarray
 
-        Args:
-            x: list of x positions of multiple timestamp markers'
-                      vertical lines
-            colors: list of colors of multiple timestamp markers' vertical
-                    lines
-            labels: list of labels that are displayed on top of multiple
-                    timestamp markers' vertical lines
-            parent: parent item for the base class
-        """
-        super().__init__(parent=parent)
-        if not isinstance(x, np.ndarray):
-            x = np.array(x)
-        if not isinstance(colors, np.ndarray):
-            colors = np.array(colors)
-        if not isinstance(labels, np.ndarray):
-            labels = np.array(labels)
-        # Catch invalid colors and replace with the default color to prevent exceptions
-        for index, color in enumerate(colors):
-            try:
-                pg.mkColor(color)
-            except Exception:  # pylint: disable=broad-except
-                # mkColor() raises Exception every time it can not interpret the passed color
-                # In these cases we want to fall back to our default color
-                warnings.warn(f"Timestamp Marker color '{color}' is replaced with {DEFAULT_COLOR} "
-                              f"since '{color}' can not be used as a color.", WrongValueWarning)
-                colors[index] = DEFAULT_COLOR
+    def _set_values(
+            self,
+            x: Union[Sequence[float], np.ndarray],
+            colors: Union[Sequence[str], np.ndarray],
+            labels: Union[Sequence[str], np.ndarray],
+    ) -> None:
+        x_values: np.ndarray = np.asarray(x)
+        color_values: np.ndarray = np.asarray(colors)
+        label_values: np.ndarray = np.asarray(labels)
+        # Catch invalid colors and replace with the default color to prevent exceptions.
+        # Markers mostly share few colors, so each distinct color is only checked once.
+        invalid_colors = {color for color in set(color_values.tolist()) if _usable_color(color) != color}
+        if invalid_colors:
+            color_values[np.array([color in invalid_colors for color in color_values.tolist()], dtype=bool)] = DEFAULT_COLOR
         # Check length of passed sequences
-        if not x.size == colors.size == labels.size:
+        if not x_values.size == color_values.size == label_values.size:
             raise ValueError(f"The timestamp marker collection cannot be created with different length "
-                             f"parameters: ({x.size}, {colors.size}, {labels.size})")
-        self.x: np.ndarray = x
-        self.colors: np.ndarray = colors
-        self.labels: np.ndarray = labels
-        # Check validity on creation to warn user in case some timestamp markers are invalid
-        self.is_valid(warn=True)
+                             f"parameters: ({x_values.size}, {color_values.size}, {label_values.size})")
+        self.x = x_values
+        self.colors = color_values
+        self.labels = label_values
 
     def __eq__(self, other):
         if self._class__ != other.__class__:
@@ -714,13 +747,11 @@ class TimestampMarkerCollectionData(PlottingItemData):
         Returns:
             Bool Array with True, if the the marker at that position is valid
         """
-        problems: List[str] = []
-        valid_indices = np.ones(self.x.size, dtype=bool)
-        for index, (x_data, color, label) in enumerate(zip(self.x, self.colors, self.labels)):
-            if x_data is None or np.isnan(x_data):
-                problems.append(f"TimestampMarker {index}: (x={x_data}, color={color}, labels={label})")
-                valid_indices[index] = False
-        if problems and warn:
+        valid_indices = ~_nan_mask(self.x)
+        if warn and not valid_indices.all():
+            problems = [f"TimestampMarker {index}: (x={self.x[index]}, color={self.colors[index]}, "
+                        f"labels={self.labels[index]})"
+                        for index in np.flatnonzero(~valid_indices)]
             msg = "Timestamp markers with NaN as x are invalid." \
                   "This applies to the following markers: " \
                   "(" + ", ".join(problems) + ") " + \
@@ -729,6 +760,427 @@ class TimestampMarkerCollectionData(PlottingItemData):
         return valid_indices
 
 
+class TimestampMarkerCollectionData(_TimestampMarkerCollectionDataMixin, PlottingItemData):
+
+    @deprecated_param_alias(x_values="x")
+    def __init__(
+            self,
+            x: Sequence[float],
+            colors: Sequence[str],
+            labels: Sequence[str],
+            parent=None,
+    ):
+        """Collection of data for timestamp markers
+
+        Emitting invalid timestamp markers to a graph will result in
+        the invalid markers **being dropped.** See
+        :func:`TimestampMarkerData.is_valid` to see in which cases a marker
+        can be invalid.
+
+        Args:
+            x: list of x positions of multiple timestamp markers'
+                      vertical lines
+            colors: list of colors of multiple timestamp markers' vertical
+                    lines
+            labels: list of labels that are displayed on top of multiple
+                    timestamp markers' vertical lines
+            parent: parent item for the base class
+        """
+        super().__init__(parent=parent)
+        self._set_values(x=x, colors=colors, labels=labels)
+        # Check validity on creation to warn user in case some timestamp markers are invalid
+        self.is_valid(warn=True)
+
+
+# ~~~~~~~~~~~~~~~~~ Batches of single entries ~~~~~~~~~~~~~~~~~
+
+
+class PointBatchData(_CurveDataMixin, PlottingItemData):
+
+    """Batch of points arriving one after another
+
+    Emitting a batch to a live curve has the same result as emitting each
+    point on its own as :class:`PointData`, but only needs one emission. In
+    contrast to :class:`CurveData`, the points are not sorted by their x
+    values, so points with NaN as both values stay in place as gaps in the
+    curve. Invalid points are dropped, the other points of the batch are
+    still added.
+    """
+
+    def __init__(self, x: Union[Sequence[float], np.ndarray], y: Union[Sequence[float], np.ndarray], parent=None):
+        """
+        Args:
+            x: list of x values of the points in the order they arrived
+            y: list of y values of the points in the order they arrived
+            parent: Parent object for the base class
+        """
+        super().__init__(parent)
+        self._set_values(x=x, y=y)
+        self.is_valid(warn=True)
+
+
+class BarBatchData(_BarCollectionDataMixin, PlottingItemData):
+
+    """Batch of bars arriving one after another
+
+    Emitting a batch to a live bar graph has the same result as emitting
+    each bar on its own as :class:`BarData`. Invalid bars are dropped, the
+    other bars of the batch are still added.
+    """
+
+    def __init__(
+            self,
+            x: Union[Sequence[float], np.ndarray],
+            y: Union[Sequence[float], np.ndarray],
+            heights: Union[Sequence[float], np.ndarray],
+            parent=None,
+    ):
+        """
+        Args:
+            x: list of x positions that represent the center of the bar
+            y: list of y positions that represent the center of the bar
+            heights: list of bar heights
+            parent: Parent object for the base class
+        """
+        super().__init__(parent)
+        self._set_values(x=x, y=y, heights=heights)
+        self.is_valid(warn=True)
+
+
+class InjectionBarBatchData(_InjectionBarCollectionDataMixin, PlottingItemData):
+
+    """Batch of injection bars arriving one after another
+
+    Emitting a batch to a live injection bar graph has the same result as
+    emitting each bar on its own as :class:`InjectionBarData`. Invalid bars
+    are dropped, the other bars of the batch are still added.
+    """
+
+    def __init__(
+        self,
+        x: Union[Sequence[float], np.ndarray],
+        y: Union[Sequence[float], np.ndarray],
+        heights: Union[Sequence[float], np.ndarray],
+        widths: Union[Sequence[float], np.ndarray],
+        labels: Union[Sequence[str], np.ndarray],
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Args:
+            x: list of x positions of the center of each bar
+            y: list of y positions of the center of each bar
+            heights: list of lengths of the vertical lines of a bar
+            widths: list of lengths of the horizontal lines of a bar
+            labels: list of texts displayed at the top of each bar
+            parent: parent item of the base class
+        """
+        super().__init__(parent)
+        self._set_values(x=x, y=y, heights=heights, widths=widths, labels=labels)
+        self.is_valid(warn=True)
+
+
+class TimestampMarkerBatchData(_TimestampMarkerCollectionDataMixin, PlottingItemData):
+
+    """Batch of timestamp markers arriving one after another
+
+    Emitting a batch to live timestamp markers has the same result as
+    emitting each marker on its own as :class:`TimestampMarkerData`. Invalid
+    markers are dropped, the other markers of the batch are still added.
+    """
+
+    def __init__(
+            self,
+            x: Union[Sequence[float], np.ndarray],
+            colors: Union[Sequence[str], np.ndarray],
+            labels: Union[Sequence[str], np.ndarray],
+            parent=None,
+    ):
+        """
+        Args:
+            x: list of x positions of the markers' vertical lines
+            colors: list of colors of the markers' vertical lines
+            labels: list of labels that are displayed on top of the markers' vertical lines
+            parent: parent item for the base class
+        """
+        super().__init__(parent=parent)
+        self._set_values(x=x, colors=colors, labels=labels)
+        self.is_valid(warn=True)
+
+
+# ~~~~~~~~~~~~~~~~~ Lightweight value types ~~~~~~~~~~~~~~~~~
+
+
+class PlottingItemValue(metaclass=abc.ABCMeta):
+
+    """Base class for lightweight single entry data structures
+
+    Compared to their QObject based counterparts, values of these types are
+    cheap to create and to dispose of, which makes a difference if single
+    entries arrive with high rates. They carry the same values and are
+    validated the same way. Since they are no QObjects, they share one
+    overload of :attr:`UpdateSource.sig_new_data`, which is
+    ``sig_new_data[PlottingItemValue]``.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def is_valid(self, warn: bool = False) -> bool:
+        """Check if the entry with the given values is valid and will be plotted
+
+        Args:
+            warn: Should a warning be emitted if the data structure is invalid
+
+        Returns:
+            True, if the entry is valid
+        """
+        pass
+
+
+class PointValue(PlottingItemValue):
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float = np.nan, y: float = np.nan):
+        """
+        Lightweight alternative to :class:`PointData`.
+
+        Args:
+            x: x-value of the point.
+            y: y-value of the point.
+        """
+        self.x: float = x if x is not None else np.nan
+        self.y: float = y if y is not None else np.nan
+        # Check validity on creation to warn user in case the point is invalid
+        self.is_valid(warn=True)
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            self.__class__ == other.__class__
+            and self.x == other.x
+            and self.y == other.y
+        )
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}: (x={self.x}, y={self.y})"
+
+    def is_valid(self, warn: bool = False) -> bool:
+        """Check if the point is valid, see :func:`PointData.is_valid`."""
+        return _validate_point(point=self, warn=warn)
+
+    @property
+    def is_nan(self) -> bool:
+        """Either the x value or the y value is nan."""
+        return np.isnan(self.x) or np.isnan(self.y)
+
+
+class BarValue(PlottingItemValue):
+
+    __slots__ = ("height", "x", "y")
+
+    def __init__(self, height: float, x: float = np.nan, y: float = np.nan):
+        """
+        Lightweight alternative to :class:`BarData`.
+
+        Args:
+            height: height of the bar
+            x: x position that represents the center of the bar
+            y: y position that represents the center of the bar
+        """
+        self.height: float = height if height is not None else np.nan
+        self.x: float = x if x is not None else np.nan
+        # y -> nan has to be replaced with 0, otherwise bar won't be drawn
+        self.y: float = y if y is not None and not np.isnan(y) else 0.0
+        # Check validity on creation to warn user in case the bar is invalid
+        self.is_valid(warn=True)
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            self.__class__ == other.__class__
+            and self.x == other.x
+            and self.y == other.y
+            and self.height == other.height
+        )
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}: (x={self.x}, y={self.y}, height={self.height})"
+
+    def is_valid(self, warn: bool = False) -> bool:
+        """Check if the bar is valid, see :func:`BarData.is_valid`."""
+        return _validate_bar(bar=self, warn=warn)
+
+
+class InjectionBarValue(PlottingItemValue):
+
+    __slots__ = ("x", "y", "height", "width", "label")
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        height: float = np.nan,
+        width: float = np.nan,
+        label: str = "",
+    ):
+        """
+        Lightweight alternative to :class:`InjectionBarData`.
+
+        Args:
+            x: x position of the center of the bar
+            y: y position of the center of the bar
+            height: length of the vertical line of the bar
+            width: length of the vertical line of the bar
+            label: text displayed at the top of the bar
+        """
+        self.x: float = x if x is not None else np.nan
+        self.y: float = y if y is not None else np.nan
+        self.height: float = height if height is not None else np.nan
+        self.width: float = width if width is not None else np.nan
+        self.label: str = label if label is not None else ""
+        # Check validity on creation to warn user in case the injection bar is invalid
+        self.is_valid(warn=True)
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            self.__class__ == other.__class__
+            and self.x == other.x
+            and self.y == other.y
+            and self.height == other.height
+            and self.width == other.width
+            and self.label == other.label
+        )
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}: (x={self.x}, y={self.y}, " \
+            f"height={self.height}, width={self.width}, label={self.label})"
+
+    def is_valid(self, warn: bool = False) -> bool:
+        """Check if the injection bar is valid, see :func:`InjectionBarData.is_valid`."""
+        return _validate_injection_bar(injection_bar=self, warn=warn)
+
+
+class TimestampMarkerValue(PlottingItemValue):
+
+    __slots__ = ("x", "color", "label")
+
+    def __init__(self, x: float, color: str = DEFAULT_COLOR, label: str = ""):
+        """
+        Lightweight alternative to :class:`TimestampMarkerData`.
+
+        Args:
+            x: x position of the timestamp marker's vertical line
+            color: of the vertical line, accepts the same arguments as pyqtgraph's mkColor
+            label: text that is shown on the top of the line
+        """
+        self.x: float = x if x is not None else np.nan
+        self.color: str = _usable_color(color)
+        self.label: str = label if label is not None else ""
+        # Check validity on creation to warn user in case the timestamp marker is invalid
+        self.is_valid(warn=True)
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            self.__class__ == other.__class__
+            and self.x == other.x
+            and self.label == other.label
+            and self.color == other.color
+        )
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}: " \
+            f"(x={self.x}, color={self.color}, label={self.label})"
+
+    def is_valid(self, warn: bool = False) -> bool:
+        """Check if the timestamp marker is valid, see :func:`TimestampMarkerData.is_valid`."""
+        return _validate_timestamp_marker(marker=self, warn=warn)
+
+
+# ~~~~~~~~~~~~~~~~~ Validation shared by data structures and value types ~~~~~~~~~~~~~~~~~
+
+
+def _validate_point(point: Union[PointData, PointValue], warn: bool) -> bool:
+    """Validation of a single point, see :func:`PointData.is_valid`."""
+    if np.isnan(point.x) and not np.isnan(point.y):
+        if warn:
+            msg = "A point with NaN as the x value and a value other than NaN as a y-value " \
+                  f"is not valid. If you emit {point} to an curve, " \
+                  f"it won't be represented as a point in the curve."
+            warnings.warn(msg, InvalidDataStructureWarning)
+        return False
+    return True
+
+
+def _validate_bar(bar: Union[BarData, BarValue], warn: bool) -> bool:
+    """Validation of a single bar, see :func:`BarData.is_valid`."""
+    problems: List[str] = []
+    if np.isnan(bar.x):
+        problems.append("NaN as the x value is not valid")
+    if np.isnan(bar.height):
+        problems.append("NaN as the height is not valid")
+    if problems:
+        if warn:
+            warning_message = f"{bar} is invalid for the following reasons: " \
+                              "(" + ", ".join(problems) + ") " + \
+                              "If you emit this bar to bar-graph, it won't be drawn."
+            warnings.warn(warning_message, InvalidDataStructureWarning)
+        return False
+    return True
+
+
+def _validate_injection_bar(injection_bar: Union[InjectionBarData, InjectionBarValue], warn: bool) -> bool:
+    """Validation of a single injection bar, see :func:`InjectionBarData.is_valid`."""
+    problems: List[str] = []
+    if np.isnan(injection_bar.x):
+        problems.append("NaN as the x value is not valid")
+    if np.isnan(injection_bar.y):
+        problems.append("NaN as the y value is not valid")
+    if problems:
+        if warn:
+            warning_message = f"{injection_bar} is invalid for the following reasons: " \
+                              "(" + ", ".join(problems) + ") " + \
+                              "If you emit this injection bar to an graph, it won't be drawn."
+            warnings.warn(warning_message, InvalidDataStructureWarning)
+        return False
+    return True
+
+
+def _validate_timestamp_marker(marker: Union[TimestampMarkerData, TimestampMarkerValue], warn: bool) -> bool:
+    """Validation of a single timestamp marker, see :func:`TimestampMarkerData.is_valid`."""
+    if np.isnan(marker.x):
+        if warn:
+            warning_message = "NaN is not a valid x value for the timestamp " \
+                              "marker. If you emit this timeline to an graph, " \
+                              "it won't be drawn."
+            warnings.warn(warning_message, InvalidDataStructureWarning)
+        return False
+    return True
+
+
+def _nan_mask(values: np.ndarray) -> np.ndarray:
+    """Bool array with True at each position, where the value is NaN or None."""
+    if values.dtype.kind in "fiub":
+        return np.isnan(values)
+    try:
+        # Casting object arrays converts None to NaN
+        return np.isnan(values.astype(float))
+    except (TypeError, ValueError):
+        return np.array([value is None or np.isnan(value) for value in values], dtype=bool)
+
+
+def _usable_color(color: str) -> str:
+    """Replace colors that can not be interpreted by pyqtgraph with the default color."""
+    # Catch invalid colors and replace with the default color to prevent exceptions
+    try:
+        pg.mkColor(color)
+    except Exception:  # pylint: disable=broad-except
+        # mkColor() raises Exception every time it can not interpret the passed color
+        # In these cases we want to fall back to our default color
+        warnings.warn(f"Timestamp Marker color '{color}' is replaced with {DEFAULT_COLOR} "
+                      f"since '{color}' can not be used as a color.", WrongValueWarning)
+        color = DEFAULT_COLOR
+    return color if color is not None else DEFAULT_COLOR
+
+
 # ~~~~~~~~~~~~~~~~~ Data Structures for testing purposes ~~~~~~~~~~~~~~~~~
 
 
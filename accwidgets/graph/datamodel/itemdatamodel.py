@@ -2,7 +2,8 @@
 
 import abc
 import warnings
-from typing import Optional, Tuple, Union, cast
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple, Union, cast
 
 import numpy as np
 from qtpy.QtCore import QObject, Signal, Slot
@@ -12,6 +13,7 @@ from accwidgets.graph.datamodel.datamodelbuffer import (
     DEFAULT_BUFFER_SIZE,
     SortedBarGraphDataBuffer,
     SortedCurveDataBuffer,
+    UniformCurveDataBuffer,
     BaseSortedDataBuffer,
     SortedTimestampMarkerDataBuffer,
     SortedInjectionBarsDataBuffer,
@@ -26,10 +28,24 @@ from accwidgets.graph.datamodel.datastructures import (
     InjectionBarCollectionData,
     InjectionBarData,
     PointData,
+    PointBatchData,
+    UniformCurveData,
+    BarBatchData,
+    InjectionBarBatchData,
+    TimestampMarkerBatchData,
     PlottingItemData,
+    PlottingItemValue,
+    PointValue,
+    BarValue,
+    InjectionBarValue,
+    TimestampMarkerValue,
 )
 
 
+_SUBSET_CACHE_SIZE: int = 8
+"""How many of the most recently requested subsets a live data model remembers."""
+
+
 class WrongDataType(Warning):
     """
     Warning for an invalid Data Structure. PlottingItemData should emit
@@ -72,6 +88,11 @@ class AbstractBaseDataModel(QObject, metaclass=AbstractQObjectMeta):
         """
         super().__init__()
         self._data_source = data_source
+        # Connected before any item can connect, so the version is already
+        # increased, when the items are notified about the change
+        self._version: int = 0
+        self.non_fitting_data_info_printed: bool = False
+        self.sig_data_model_changed.connect(self._increase_version)
         self._connect_to_data_source()
 
     def replace_data_source(self, data_source: UpdateSource) -> None:
@@ -93,6 +114,19 @@ class AbstractBaseDataModel(QObject, metaclass=AbstractQObjectMeta):
         """Source for data updates the data-model is attached to."""
         return self._data_source
 
+    @property
+    def version(self) -> int:
+        """
+        Counter that is increased with each change to the data stored in the
+        data model. Items can compare it to the version they have drawn last,
+        to find out if they have to be redrawn.
+        """
+        return self._version
+
+    def _increase_version(self) -> None:
+        """Mark the data stored in the data model as changed."""
+        self._version += 1
+
     @property
     @abc.abstractmethod
     def full_data_buffer(self) -> Tuple[np.ndarray, ...]:
@@ -108,6 +142,7 @@ class AbstractBaseDataModel(QObject, metaclass=AbstractQObjectMeta):
         all update signals to the fitting handler slots in both ways.
         """
         self._data_source.sig_new_data.connect(self._handle_data_update_signal)
+        self._data_source.sig_new_data[PlottingItemValue].connect(self._handle_data_update_signal)
 
     def _disconnect_from_data_source(self) -> None:
         """
@@ -115,6 +150,7 @@ class AbstractBaseDataModel(QObject, metaclass=AbstractQObjectMeta):
         calling, none of both will receive any updates from the other anymore.
         """
         self._data_source.sig_new_data.disconnect(self._handle_data_update_signal)
+        self._data_source.sig_new_data[PlottingItemValue].disconnect(self._handle_data_update_signal)
 
     # ~~~~~ Mandatory to implement in non abstract derived classes ~~~~~~~~~~~~
 
@@ -128,14 +164,25 @@ class AbstractBaseDataModel(QObject, metaclass=AbstractQObjectMeta):
     @Slot(InjectionBarCollectionData)
     @Slot(TimestampMarkerData)
     @Slot(TimestampMarkerCollectionData)
-    def _handle_data_update_signal(self, data: PlottingItemData) -> None:
+    @Slot(PointBatchData)
+    @Slot(BarBatchData)
+    @Slot(InjectionBarBatchData)
+    @Slot(TimestampMarkerBatchData)
+    @Slot(UniformCurveData)
+    @Slot(PlottingItemValue)
+    def _handle_data_update_signal(self, data: Union[PlottingItemData, PlottingItemValue]) -> None:
         """Handle arriving data"""
         pass
 
 
 class AbstractLiveDataModel(AbstractBaseDataModel, metaclass=abc.ABCMeta):
 
-    def __init__(self, data_source: UpdateSource, buffer_size: int = DEFAULT_BUFFER_SIZE):
+    def __init__(
+            self,
+            data_source: UpdateSource,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            circular_buffer: bool = False,
+    ):
         """
         Abstract base class for any live plotting data models that are built on top
         of a sorted buffer that is optimized for fast storage of new arriving data.
@@ -144,11 +191,16 @@ class AbstractLiveDataModel(AbstractBaseDataModel, metaclass=abc.ABCMeta):
             data_source: source for data updates
             buffer_size: Amount of entries the buffer is holding (not equal the
                          amount of displayed entries)
+            circular_buffer: Overwrite the oldest entries in the buffer in place
+                             instead of shifting the buffer, if it is full
         """
         super().__init__(data_source=data_source)
         self._buffer_size = buffer_size
-        self._full_data_buffer: BaseSortedDataBuffer
-        self.non_fitting_data_info_printed: bool = False
+        self._circular_buffer = circular_buffer
+        self._full_data_buffer: Union[BaseSortedDataBuffer, UniformCurveDataBuffer]
+        # Items sharing this model often request the same subsets for one frame
+        self._subset_cache: "OrderedDict[Hashable, Tuple[np.ndarray, ...]]" = OrderedDict()
+        self._subset_cache_version: int = self._version
 
     def replace_data_source(self, data_source: UpdateSource, clear_buffer: bool = True):
         """
@@ -161,6 +213,7 @@ class AbstractLiveDataModel(AbstractBaseDataModel, metaclass=abc.ABCMeta):
         super().replace_data_source(data_source=data_source)
         if clear_buffer:
             self._full_data_buffer.reset()
+            self._increase_version()
 
     def subset_for_xrange(self, start: float, end: float) -> Tuple[np.ndarray, ...]:
         """ Get Subset of a specific start and end
@@ -177,7 +230,10 @@ class AbstractLiveDataModel(AbstractBaseDataModel, metaclass=abc.ABCMeta):
         Returns:
             View on a subset of the data in the given range
         """
-        return self._full_data_buffer.subset_for_primary_val_range(start=start, end=end)
+        return self._cached_subset(
+            key=(start, end),
+            compute=lambda: self._full_data_buffer.subset_for_primary_val_range(start=start, end=end),
+        )
 
     @property
     def full_data_buffer(self) -> Tuple[np.ndarray, ...]:
@@ -205,31 +261,82 @@ class AbstractLiveDataModel(AbstractBaseDataModel, metaclass=abc.ABCMeta):
     @property
     def max_primary_val(self) -> Optional[float]:
         """Biggest x value available in the buffer that is not nan"""
-        primary_values = self.full_data_buffer[0]
-        if primary_values.size == 0:
-            return None
-        i = primary_values.size - 1
-        while i >= 0 and np.isnan(primary_values[i]):
-            i -= 1
-        if np.isnan(primary_values[i]):
-            return None
-        return primary_values[i]
+        return self._full_data_buffer.last_valid_primary_value
+
+    def _cached_subset(
+            self,
+            key: Hashable,
+            compute: Callable[[], Tuple[np.ndarray, ...]],
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Return a subset computed for the same parameters before, as long as the
+        data model has not changed in the meantime. Otherwise the subset is
+        computed and remembered for following requests. Only the most recently
+        requested subsets are kept.
+
+        Args:
+            key: Parameters the subset was requested with
+            compute: Function for computing the subset, if it is not cached
+
+        Returns:
+            Subset for the passed parameters
+        """
+        if self._subset_cache_version != self._version:
+            self._subset_cache.clear()
+            self._subset_cache_version = self._version
+        try:
+            subset = self._subset_cache.pop(key)
+        except KeyError:
+            subset = compute()
+            if len(self._subset_cache) >= _SUBSET_CACHE_SIZE:
+                self._subset_cache.popitem(last=False)
+        self._subset_cache[key] = subset
+        return subset
 
 
 class LiveCurveDataModel(AbstractLiveDataModel):
 
-    def __init__(self, data_source: UpdateSource, buffer_size: int = DEFAULT_BUFFER_SIZE):
+    def __init__(
+            self,
+            data_source: UpdateSource,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            circular_buffer: bool = False,
+            level_of_detail: bool = False,
+            data_buffer: Optional[Union[SortedCurveDataBuffer, UniformCurveDataBuffer]] = None,
+    ):
         """DataModel for a live line graph
 
         Args:
             data_source: update source for data related updates
             buffer_size: Amount of entries the buffer is holding
                          (not equal the amount of displayed entries)
-        """
-        super().__init__(data_source=data_source, buffer_size=buffer_size)
-        self._full_data_buffer: SortedCurveDataBuffer = SortedCurveDataBuffer(size=buffer_size)
-
-    def subset_for_xrange(self, start: float, end: float, interpolated: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+            circular_buffer: Overwrite the oldest entries in the buffer in place
+                             instead of shifting the buffer, if it is full
+            level_of_detail: Maintain a min/max pyramid in the buffer for fast
+                             decimated subsets
+            data_buffer: Buffer the points are saved in, if not passed, a sorted
+                         buffer is created from the other arguments
+        """
+        super().__init__(
+            data_source=data_source,
+            buffer_size=buffer_size,
+            circular_buffer=circular_buffer,
+        )
+        if data_buffer is None:
+            data_buffer = SortedCurveDataBuffer(
+                size=buffer_size,
+                circular=circular_buffer,
+                level_of_detail=level_of_detail,
+            )
+        self._full_data_buffer: Union[SortedCurveDataBuffer, UniformCurveDataBuffer] = data_buffer
+
+    def subset_for_xrange(
+            self,
+            start: float,
+            end: float,
+            interpolated: bool = False,
+            max_points: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """ Get a subset of the data models data in a specific x range
 
         Since the data buffer keeps data sorted, the subset will be sorted as well.
@@ -237,31 +344,55 @@ class LiveCurveDataModel(AbstractLiveDataModel):
         **Note:** This method returns a view on the original data, if the data is not interpolated.
         If the curve is interpolated, a copy of the data is returned, which contains the two interpolated
         points at the start and end.
+        Subsets are cached until the data in the model changes, so the returned arrays
+        are shared between all callers and should not be modified.
 
         Args:
             start: No x value in the subset is smaller than start
             end: No x value in the subset is bigger than end
             interpolated: Should the subset be linearly interpolated at the start and end point?
+            max_points: If the subset would contain more points, a peak preserving
+                        decimated subset is returned instead
 
         Returns:
             Subset of the data in the given range
         """
-        return self._full_data_buffer.subset_for_primary_val_range(start, end, interpolated=interpolated)
+        return cast(Tuple[np.ndarray, np.ndarray], self._cached_subset(
+            key=(start, end, interpolated, max_points),
+            compute=lambda: self._full_data_buffer.subset_for_primary_val_range(
+                start,
+                end,
+                interpolated=interpolated,
+                max_points=max_points,
+            ),
+        ))
 
     @Slot(PointData)
     @Slot(CurveData)
-    def _handle_data_update_signal(self, data: Union[PointData, CurveData]) -> None:
+    @Slot(PointBatchData)
+    @Slot(UniformCurveData)
+    @Slot(PlottingItemValue)
+    def _handle_data_update_signal(self, data: Union[PointData, PointValue, CurveData, PointBatchData, UniformCurveData]) -> None:
         """Handle data emitted by the data source.
 
         Data that does not have the right type will just be ignored.
         This allows attaching the same source to multiple datamodels"""
-        if isinstance(data, PointData) and data.is_valid():
+        if isinstance(data, (PointData, PointValue)) and data.is_valid():
             self._full_data_buffer.add_entry(
                 x=data.x,
                 y=data.y,
             )
             self.sig_data_model_changed.emit()
-        elif isinstance(data, CurveData) and np.alltrue(data.is_valid()):
+        elif isinstance(data, PointBatchData):
+            valid = data.is_valid()
+            if valid.any():
+                self._full_data_buffer.add_list_of_entries(
+                    x=data.x[valid].astype(float),
+                    y=data.y[valid].astype(float),
+                    keep_order=True,
+                )
+                self.sig_data_model_changed.emit()
+        elif isinstance(data, (CurveData, UniformCurveData)) and np.alltrue(data.is_valid()):
             self._full_data_buffer.add_list_of_entries(
                 x=data.x,
                 y=data.y,
@@ -274,17 +405,111 @@ class LiveCurveDataModel(AbstractLiveDataModel):
                 cast(AbstractLiveDataModel, self).non_fitting_data_info_printed = True
 
 
+class LiveUniformCurveDataModel(LiveCurveDataModel):
+
+    def __init__(
+            self,
+            data_source: UpdateSource,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            dx: Optional[float] = None,
+            **_,
+    ):
+        """DataModel for a live line graph with uniformly sampled points
+
+        Points are saved in a buffer, which only keeps the y values and
+        calculates the x values from the x value of the first point and the
+        distance between the points. The buffer overwrites its oldest points
+        in place, if it is full. Data does not fit this model, if its x values
+        are not on the grid of the buffer or older than the newest point.
+
+        Args:
+            data_source: update source for data related updates
+            buffer_size: Amount of entries the buffer is holding
+                         (not equal the amount of displayed entries)
+            dx: Distance between two points, if not passed, it is taken
+                from the first arriving data
+            **_: Swallows unused keyword arguments
+        """
+        self._uniform_buffer = UniformCurveDataBuffer(size=buffer_size, dx=dx)
+        super().__init__(
+            data_source=data_source,
+            buffer_size=buffer_size,
+            circular_buffer=True,
+            data_buffer=self._uniform_buffer,
+        )
+
+    @property
+    def dx(self) -> Optional[float]:
+        """Distance between the x values of two neighbouring points"""
+        return self._uniform_buffer.dx
+
+    @Slot(PointData)
+    @Slot(CurveData)
+    @Slot(PointBatchData)
+    @Slot(UniformCurveData)
+    @Slot(PlottingItemValue)
+    def _handle_data_update_signal(self, data: Union[PointData, PointValue, CurveData, PointBatchData, UniformCurveData]) -> None:
+        """Handle data emitted by the data source.
+
+        Data that does not have the right type or does not fit on the
+        grid of the buffer will just be ignored."""
+        try:
+            if isinstance(data, (PointData, PointValue)) and data.is_valid():
+                self._full_data_buffer.add_entry(x=data.x, y=data.y)
+                self.sig_data_model_changed.emit()
+                return
+            if isinstance(data, PointBatchData):
+                valid = data.is_valid()
+                if valid.any():
+                    self._full_data_buffer.add_list_of_entries(
+                        x=data.x[valid].astype(float),
+                        y=data.y[valid].astype(float),
+                        keep_order=True,
+                    )
+                    self.sig_data_model_changed.emit()
+                    return
+            if isinstance(data, UniformCurveData) and np.alltrue(data.is_valid()):
+                self._uniform_buffer.add_uniform_entries(x0=data.x0, dx=data.dx, y=data.y)
+                self.sig_data_model_changed.emit()
+                return
+            if isinstance(data, CurveData) and np.alltrue(data.is_valid()):
+                self._full_data_buffer.add_list_of_entries(x=data.x, y=data.y)
+                self.sig_data_model_changed.emit()
+                return
+        except ValueError as error:
+            warnings.warn(f"Data {data} does not fit the grid of this {type(self).__name__}: {error}")
+            return
+        if not self.non_fitting_data_info_printed:
+            warnings.warn(f"Data {data} of type {type(data).__name__} does not fit this "
+                          f"{type(self).__name__} or is invalid and will be ignored.")
+            self.non_fitting_data_info_printed = True
+
+
 class LiveBarGraphDataModel(AbstractLiveDataModel):
 
-    def __init__(self, data_source: UpdateSource, buffer_size: int = DEFAULT_BUFFER_SIZE):
+    def __init__(
+            self,
+            data_source: UpdateSource,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            circular_buffer: bool = False,
+    ):
         """ DataModel for a live bar graph.
         Args:
             data_source: update source for data related updates
             buffer_size: Amount of entries the buffer is holding
                          (not equal the amount of displayed entries)
-        """
-        super().__init__(data_source=data_source, buffer_size=buffer_size)
-        self._full_data_buffer: SortedBarGraphDataBuffer = SortedBarGraphDataBuffer(size=buffer_size)
+            circular_buffer: Overwrite the oldest entries in the buffer in place
+                             instead of shifting the buffer, if it is full
+        """
+        super().__init__(
+            data_source=data_source,
+            buffer_size=buffer_size,
+            circular_buffer=circular_buffer,
+        )
+        self._full_data_buffer: SortedBarGraphDataBuffer = SortedBarGraphDataBuffer(
+            size=buffer_size,
+            circular=circular_buffer,
+        )
 
     def _get_min_distance_between_bars(self) -> float:
         """ Get the minimum distance between two bars
@@ -296,14 +521,26 @@ class LiveBarGraphDataModel(AbstractLiveDataModel):
 
     @Slot(BarData)
     @Slot(BarCollectionData)
-    def _handle_data_update_signal(self, data: Union[BarData, BarCollectionData]) -> None:
+    @Slot(BarBatchData)
+    @Slot(PlottingItemValue)
+    def _handle_data_update_signal(self, data: Union[BarData, BarValue, BarCollectionData, BarBatchData]) -> None:
         """Handle data emitted by the data source.
 
         Data that does not have the right type will just be ignored.
         This allows attaching the same source to multiple datamodels"""
-        if isinstance(data, BarData) and data.is_valid():
+        if isinstance(data, (BarData, BarValue)) and data.is_valid():
             self._full_data_buffer.add_entry(x=data.x, y=data.y, height=data.height)
             self.sig_data_model_changed.emit()
+        elif isinstance(data, BarBatchData):
+            valid = data.is_valid()
+            if valid.any():
+                self._full_data_buffer.add_list_of_entries(
+                    x=data.x[valid].astype(float),
+                    y=data.y[valid].astype(float),
+                    heights=data.heights[valid].astype(float),
+                    keep_order=True,
+                )
+                self.sig_data_model_changed.emit()
         elif isinstance(data, BarCollectionData) and np.alltrue(data.is_valid()):
             self._full_data_buffer.add_list_of_entries(
                 x=data.x,
@@ -320,25 +557,44 @@ class LiveBarGraphDataModel(AbstractLiveDataModel):
 
 class LiveInjectionBarDataModel(AbstractLiveDataModel):
 
-    def __init__(self, data_source: UpdateSource, buffer_size: int = DEFAULT_BUFFER_SIZE):
+    def __init__(
+            self,
+            data_source: UpdateSource,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            circular_buffer: bool = False,
+    ):
         """DataModel for a live injection bar graph
 
         Args:
             data_source: source for data updates
             buffer_size: Amount of entries the buffer is holding
                          (not equal the amount of displayed entries)
-        """
-        super().__init__(data_source=data_source, buffer_size=buffer_size)
-        self._full_data_buffer: SortedInjectionBarsDataBuffer = SortedInjectionBarsDataBuffer(size=buffer_size)
+            circular_buffer: Overwrite the oldest entries in the buffer in place
+                             instead of shifting the buffer, if it is full
+        """
+        super().__init__(
+            data_source=data_source,
+            buffer_size=buffer_size,
+            circular_buffer=circular_buffer,
+        )
+        self._full_data_buffer: SortedInjectionBarsDataBuffer = SortedInjectionBarsDataBuffer(
+            size=buffer_size,
+            circular=circular_buffer,
+        )
 
     @Slot(InjectionBarData)
     @Slot(InjectionBarData)
-    def _handle_data_update_signal(self, data: Union[InjectionBarData, InjectionBarCollectionData]) -> None:
+    @Slot(InjectionBarBatchData)
+    @Slot(PlottingItemValue)
+    def _handle_data_update_signal(
+            self,
+            data: Union[InjectionBarData, InjectionBarValue, InjectionBarCollectionData, InjectionBarBatchData],
+    ) -> None:
         """Handle data emitted by the data source.
 
         Data that does not have the right type will just be ignored.
         This allows attaching the same source to multiple datamodels"""
-        if isinstance(data, InjectionBarData) and data.is_valid():
+        if isinstance(data, (InjectionBarData, InjectionBarValue)) and data.is_valid():
             self._full_data_buffer.add_entry(
                 x=data.x,
                 y=data.y,
@@ -347,6 +603,18 @@ class LiveInjectionBarDataModel(AbstractLiveDataModel):
                 label=data.label,
             )
             self.sig_data_model_changed.emit()
+        elif isinstance(data, InjectionBarBatchData):
+            valid = data.is_valid()
+            if valid.any():
+                self._full_data_buffer.add_list_of_entries(
+                    x=data.x[valid].astype(float),
+                    y=data.y[valid].astype(float),
+                    heights=data.heights[valid].astype(float),
+                    widths=data.widths[valid].astype(float),
+                    labels=data.labels[valid],
+                    keep_order=True,
+                )
+                self.sig_data_model_changed.emit()
         elif isinstance(data, InjectionBarCollectionData) and np.alltrue(data.is_valid()):
             self._full_data_buffer.add_list_of_entries(
                 x=data.x,
@@ -365,7 +633,12 @@ class LiveInjectionBarDataModel(AbstractLiveDataModel):
 
 class LiveTimestampMarkerDataModel(AbstractLiveDataModel):
 
-    def __init__(self, data_source: UpdateSource, buffer_size: int = DEFAULT_BUFFER_SIZE):
+    def __init__(
+            self,
+            data_source: UpdateSource,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            circular_buffer: bool = False,
+    ):
         """
         DataModel for a live timestamp markers.
 
@@ -373,20 +646,49 @@ class LiveTimestampMarkerDataModel(AbstractLiveDataModel):
             data_source: source for data updates
             buffer_size: Amount of entries the buffer is holding
                          (not equal the amount of displayed entries)
-        """
-        super().__init__(data_source=data_source, buffer_size=buffer_size)
-        self._full_data_buffer: SortedTimestampMarkerDataBuffer = SortedTimestampMarkerDataBuffer(size=buffer_size)
+            circular_buffer: Overwrite the oldest entries in the buffer in place
+                             instead of shifting the buffer, if it is full
+        """
+        super().__init__(
+            data_source=data_source,
+            buffer_size=buffer_size,
+            circular_buffer=circular_buffer,
+        )
+        self._full_data_buffer: SortedTimestampMarkerDataBuffer = SortedTimestampMarkerDataBuffer(
+            size=buffer_size,
+            circular=circular_buffer,
+        )
 
     @Slot(TimestampMarkerData)
     @Slot(TimestampMarkerCollectionData)
-    def _handle_data_update_signal(self, data: Union[TimestampMarkerData, TimestampMarkerCollectionData]) -> None:
+    @Slot(TimestampMarkerBatchData)
+    @Slot(PlottingItemValue)
+    def _handle_data_update_signal(
+            self,
+            data: Union[
+                TimestampMarkerData,
+                TimestampMarkerValue,
+                TimestampMarkerCollectionData,
+                TimestampMarkerBatchData,
+            ],
+    ) -> None:
         """Handle data emitted by the data source.
 
         Data that does not have the right type will just be ignored.
         This allows attaching the same source to multiple datamodels"""
-        if isinstance(data, TimestampMarkerData) and data.is_valid():
+        if isinstance(data, (TimestampMarkerData, TimestampMarkerValue)) and data.is_valid():
             self._full_data_buffer.add_entry(x=data.x, color=data.color, label=data.label)
             self.sig_data_model_changed.emit()
+        elif isinstance(data, TimestampMarkerBatchData):
+            valid = data.is_valid()
+            if valid.any():
+                self._full_data_buffer.add_list_of_entries(
+                    x=data.x[valid].astype(float),
+                    colors=data.colors[valid],
+                    labels=data.labels[valid],
+                    keep_order=True,
+                )
+                self.sig_data_model_changed.emit()
         elif isinstance(data, TimestampMarkerCollectionData) and np.alltrue(data.is_valid()):
             self._full_data_buffer.add_list_of_entries(
                 x=data.x,
@@ -403,27 +705,71 @@ class LiveTimestampMarkerDataModel(AbstractLiveDataModel):
 
 class StaticCurveDataModel(AbstractBaseDataModel):
 
-    def __init__(self, data_source: UpdateSource, **_):
+    def __init__(self, data_source: UpdateSource, in_place: bool = False, **_):
         """
         Data model for a static curve. If new data arrives, the
         old one will be replaced entirely with the new one.
 
+        The data model keeps track of changes to the x values in
+        :attr:`x_version`, so items can skip processing them again, if
+        only the y values have changed. For :class:`UniformCurveData`, this
+        is decided without looking at the x values at all, which are then
+        only created, if the grid has changed.
+
+        In the in place mode, arriving y values are copied into one of two
+        arrays owned by the data model, which are swapped afterwards. As long
+        as the count of points does not change, no new arrays are allocated.
+        Sources can also write their y values directly into :attr:`back_buffer`
+        and emit it as y values, which saves the copy.
+
         Args:
             data_source: Source for the new arriving data
+            in_place: Copy arriving y values into preallocated arrays
             **_: Swallow unused keyword arguments
         """
         super().__init__(data_source=data_source)
+        self._in_place = in_place
         self._x_values: np.ndarray = np.array([])
         self._y_values: np.ndarray = np.array([])
+        # Array the next y values are written to in the in place mode
+        self._y_back_buffer: Optional[np.ndarray] = None
+        # First x value and distance between the x values, if they are uniform
+        self._grid: Optional[Tuple[float, float]] = None
+        self._x_version: int = 0
 
-    def _handle_data_update_signal(self, data: Union[PointData, CurveData]) -> None:
-        if isinstance(data, PointData) and data.is_valid():
-            self._x_values = np.array([data.x])
-            self._y_values = np.array([data.y])
+    @property
+    def in_place(self) -> bool:
+        """Are arriving y values copied into preallocated arrays"""
+        return self._in_place
+
+    @property
+    def x_version(self) -> int:
+        """
+        Counter that is increased each time the x values or the count of
+        points have changed. As long as it does not change, only the y
+        values of the curve were replaced.
+        """
+        return self._x_version
+
+    @property
+    def back_buffer(self) -> Optional[np.ndarray]:
+        """
+        Array the next y values will be written to in the in place mode. Sources
+        emitting this array as their y values can avoid copying the values. The
+        array is only available, after the first data with the same count of
+        points has arrived.
+        """
+        return self._y_back_buffer
+
+    def _handle_data_update_signal(self, data: Union[PointData, PointValue, CurveData, UniformCurveData]) -> None:
+        if isinstance(data, (PointData, PointValue)) and data.is_valid():
+            self._replace_data(x=np.array([data.x]), y=np.array([data.y]), grid=None)
+            self.sig_data_model_changed.emit()
+        elif isinstance(data, UniformCurveData) and np.alltrue(data.is_valid()):
+            self._replace_data(x=None, y=data.y, grid=(data.x0, data.dx), uniform_data=data)
             self.sig_data_model_changed.emit()
         elif isinstance(data, CurveData) and np.alltrue(data.is_valid()):
-            self._x_values = data.x
-            self._y_values = data.y
+            self._replace_data(x=data.x, y=data.y, grid=None)
             self.sig_data_model_changed.emit()
         else:
             if not cast(AbstractLiveDataModel, self).non_fitting_data_info_printed:
@@ -439,6 +785,44 @@ class StaticCurveDataModel(AbstractBaseDataModel):
         """
         return self._x_values, self._y_values
 
+    def _replace_data(
+            self,
+            x: Optional[np.ndarray],
+            y: np.ndarray,
+            grid: Optional[Tuple[float, float]],
+            uniform_data: Optional[UniformCurveData] = None,
+    ) -> None:
+        """
+        Replace the saved data with the passed one. The x values are only
+        replaced, if they differ from the saved ones.
+
+        Args:
+            x: New x values, None if they are described by the grid
+            y: New y values
+            grid: First x value and distance of uniform x values
+            uniform_data: Data to take the x values from, if the grid has changed
+        """
+        same_size = y.shape == self._y_values.shape
+        if grid is not None:
+            x_changed = not same_size or grid != self._grid
+        else:
+            x_changed = not same_size or not np.array_equal(x, self._x_values)
+        if x_changed:
+            # Saved x values are a copy, so changes to the source's array are noticed as well
+            self._x_values = np.array(uniform_data.x if uniform_data is not None else x, dtype=float)
+            self._x_version += 1
+        self._grid = grid
+        if not self._in_place:
+            self._y_values = y
+        elif same_size and self._y_back_buffer is not None:
+            if y is not self._y_back_buffer:
+                np.copyto(self._y_back_buffer, y)
+            self._y_values, self._y_back_buffer = self._y_back_buffer, self._y_values
+        else:
+            # The data model has to own both arrays, so the source's arrays are never written to
+            self._y_values = np.array(y, dtype=float)
+            self._y_back_buffer = np.empty_like(self._y_values)
+
 
 class StaticBarGraphDataModel(AbstractBaseDataModel):
 
@@ -456,8 +840,8 @@ class StaticBarGraphDataModel(AbstractBaseDataModel):
         self._y_values: np.ndarray = np.array([])
         self._heights: np.ndarray = np.array([])
 
-    def _handle_data_update_signal(self, data: Union[BarData, BarCollectionData]) -> None:
-        if isinstance(data, BarData) and data.is_valid():
+    def _handle_data_update_signal(self, data: Union[BarData, BarValue, BarCollectionData]) -> None:
+        if isinstance(data, (BarData, BarValue)) and data.is_valid():
             self._x_values = np.array([data.x])
             self._y_values = np.array([data.y])
             self._heights = np.array([data.height])
@@ -500,8 +884,11 @@ class StaticInjectionBarDataModel(AbstractBaseDataModel):
         self._widths: np.ndarray = np.array([])
         self._labels: np.ndarray = np.array([])
 
-    def _handle_data_update_signal(self, data: Union[BarData, BarCollectionData]) -> None:
-        if isinstance(data, InjectionBarData) and data.is_valid():
+    def _handle_data_update_signal(
+            self,
+            data: Union[InjectionBarData, InjectionBarValue, InjectionBarCollectionData],
+    ) -> None:
+        if isinstance(data, (InjectionBarData, InjectionBarValue)) and data.is_valid():
             self._x_values = np.array([data.x])
             self._y_values = np.array([data.y])
             self._heights = np.array([data.height])
@@ -546,8 +933,11 @@ class StaticTimestampMarkerDataModel(AbstractBaseDataModel):
         self._colors: np.ndarray = np.array([])
         self._labels: np.ndarray = np.array([])
 
-    def _handle_data_update_signal(self, data: Union[BarData, BarCollectionData]) -> None:
-        if isinstance(data, TimestampMarkerData) and data.is_valid():
+    def _handle_data_update_signal(
+            self,
+            data: Union[TimestampMarkerData, TimestampMarkerValue, TimestampMarkerCollectionData],
+    ) -> None:
+        if isinstance(data, (TimestampMarkerData, TimestampMarkerValue)) and data.is_valid():
             self._x_values = np.array([data.x])
             self._colors = np.array([data.color])
             self._labels = np.array([data.label])
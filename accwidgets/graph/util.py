@@ -5,7 +5,11 @@ whole project.
 
 import functools
 import warnings
-from typing import Dict, Any, Callable
+from collections import deque
+from typing import Dict, Any, Callable, Tuple, Optional, Sequence, Union
+
+import numpy as np
+from qtpy.QtGui import QFont, QFontMetricsF
 
 
 def deprecated_param_alias(**aliases: str) -> Callable:
@@ -46,3 +50,196 @@ def _rename_kwargs(func_name: str,
                           f"'{func_name}' is deprecated, use '{new}'.",
                           DeprecationWarning)
             kwargs[new] = kwargs.pop(alias)
+
+
+def match_pooled_positions(pool_x: np.ndarray, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Assign items of a pool of graphics items to the given x positions. Items
+    already placed at one of the positions keep their position, the remaining
+    positions are assigned the remaining items in order. Indices bigger than
+    the pool's size mean, that new items have to be created.
+
+    Args:
+        pool_x: Position of each item in the pool, NaN for unused items
+        x: Positions items are needed for
+
+    Returns:
+        Index of the item for each position, mask of the positions whose item
+        is already placed there and the indices of the items that are not used
+    """
+    indices = np.zeros(x.size, dtype=int)
+    found = np.zeros(x.size, dtype=bool)
+    if pool_x.size > 0:
+        order = np.argsort(pool_x, kind="stable")
+        # The n-th occurrence of a position is matched with the n-th item at this position
+        x_order = np.argsort(x, kind="stable")
+        ranks = np.empty(x.size, dtype=int)
+        ranks[x_order] = np.arange(x.size) - np.searchsorted(x[x_order], x[x_order])
+        positions: np.ndarray = np.searchsorted(pool_x[order], x) + ranks
+        candidates = order[np.minimum(positions, pool_x.size - 1)]
+        found = (positions < pool_x.size) & (pool_x[candidates] == x)
+        indices[found] = candidates[found]
+    free = np.ones(pool_x.size, dtype=bool)
+    free[indices[found]] = False
+    free = np.flatnonzero(free)
+    new_positions = np.flatnonzero(~found)
+    reused = min(new_positions.size, free.size)
+    indices[new_positions[:reused]] = free[:reused]
+    indices[new_positions[reused:]] = pool_x.size + np.arange(new_positions.size - reused)
+    return indices, found, free[reused:]
+
+
+def declutter_labels(
+        x: np.ndarray,
+        widths: np.ndarray,
+        y: Optional[np.ndarray] = None,
+        heights: Optional[np.ndarray] = None,
+        resolution: float = 1.0,
+) -> np.ndarray:
+    """
+    Select labels that can be displayed without overlapping each other. The
+    labels are visited from the biggest to the smallest x position, so labels
+    further right, f.e. newer ones on a time axis, are preferred. A label is
+    kept, if it does not collide with any label kept before.
+
+    Labels are bucketed in cells as wide as the given resolution and as high
+    as the lowest label. Cells are never wider than the narrowest label, so
+    labels in the same cell always overlap each other. Only the rightmost
+    label of each cell is visited, so the count of visited labels is limited
+    by the space the labels are spread over instead of their count.
+
+    All values have to be passed in the same unit, f.e. device pixels. If no y
+    values are passed, all labels are expected to be placed at the same height.
+
+    Args:
+        x: Horizontal centers of the labels
+        widths: Widths of the labels
+        y: Vertical centers of the labels
+        heights: Heights of the labels
+        resolution: Width of the cells labels are bucketed in, f.e. one pixel
+
+    Returns:
+        Mask of the labels that should be displayed
+    """
+    visible = np.zeros(x.size, dtype=bool)
+    if x.size == 0:
+        return visible
+    if y is None or heights is None:
+        y = np.zeros(x.size)
+        heights = np.ones(x.size)
+    left: np.ndarray = x - widths / 2
+    right: np.ndarray = x + widths / 2
+    bottom: np.ndarray = y - heights / 2
+    top: np.ndarray = y + heights / 2
+    reach = np.nanmax(widths)
+    order: np.ndarray = np.argsort(x, kind="stable")[::-1]
+    order = order[~np.isnan(x[order])]
+    # Labels without y position do not collide with any other label
+    without_y = np.isnan(y[order])
+    visible[order[without_y]] = True
+    order = order[~without_y]
+    cell_width = min(resolution, np.nanmin(widths))
+    cell_height = np.nanmin(heights)
+    if order.size > 0 and cell_width > 0 and cell_height > 0:
+        cells = np.stack((np.floor(x[order] / cell_width), np.floor(y[order] / cell_height)), axis=1)
+        _, rightmost = np.unique(cells, axis=0, return_index=True)
+        order = order[np.sort(rightmost)]
+    # Kept labels that might still collide with the following ones
+    candidates: deque = deque()
+    for index in order:
+        while candidates and left[candidates[0]] >= x[index] + reach:
+            candidates.popleft()
+        if any(
+            left[index] < right[kept] and left[kept] < right[index]
+            and bottom[index] < top[kept] and bottom[kept] < top[index]
+            for kept in candidates
+        ):
+            continue
+        visible[index] = True
+        candidates.append(index)
+    return visible
+
+
+class LabelCulling:
+
+    _MAX_CACHED_WIDTHS = 10_000
+
+    def __init__(self, font: Optional[QFont] = None, padding: float = 8.0):
+        """
+        Decides which labels of an item are displayed, so labels do not overlap
+        each other on screen. The count of displayed labels is limited by the
+        screen space and not the amount of data, see :func:`declutter_labels`.
+
+        Args:
+            font: Font the labels are displayed with, by default the
+                  application's default font
+            padding: Space in pixels added to the text's width and height, f.e.
+                     the document margin of a QGraphicsTextItem
+        """
+        self._metrics = QFontMetricsF(font or QFont())
+        # QFontMetricsF.width is deprecated since Qt 5.11
+        self._text_width: Callable[[str], float] = getattr(self._metrics, "horizontalAdvance", self._metrics.width)
+        self._padding = padding
+        self._widths: Dict[str, float] = {}
+
+    @staticmethod
+    def pixel_scale(view_box: Optional[Any]) -> Optional[Tuple[float, float]]:
+        """
+        Pixels per unit along the x and y axis of the given view box, None if
+        the item is not part of a view box or the view range is empty.
+        """
+        if view_box is None:
+            return None
+        (x_start, x_end), (y_start, y_end) = view_box.viewRange()
+        if x_end <= x_start or y_end <= y_start:
+            return None
+        return view_box.width() / (x_end - x_start), view_box.height() / (y_end - y_start)
+
+    @property
+    def height(self) -> float:
+        """Height of a single line label in pixels."""
+        return self._metrics.height() + self._padding
+
+    def widths(self, texts: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+        """
+        Widths of labels with the given texts in pixels. Widths are cached
+        per text, since labels with the same text are usually displayed
+        over and over again.
+        """
+        if len(self._widths) > LabelCulling._MAX_CACHED_WIDTHS:
+            self._widths.clear()
+        widths = np.empty(len(texts))
+        for index, text in enumerate(texts):
+            try:
+                widths[index] = self._widths[text]
+            except KeyError:
+                widths[index] = self._widths[text] = self._text_width(text) + self._padding
+        return widths
+
+    def visible(
+            self,
+            x: np.ndarray,
+            texts: Union[Sequence[str], np.ndarray],
+            y: Optional[np.ndarray] = None,
+            centered: bool = True,
+    ) -> np.ndarray:
+        """
+        Mask of labels that can be displayed without overlapping each other.
+
+        Args:
+            x: Horizontal positions of the labels in pixels
+            texts: Texts of the labels
+            y: Vertical positions of the labels in pixels, growing upwards, if
+               not passed, all labels are placed at the same height
+            centered: If True, the positions are the centers of the labels,
+                      otherwise their top left corners
+
+        Returns:
+            Mask of the labels that should be displayed
+        """
+        widths = self.widths(texts)
+        heights = None if y is None else np.full(widths.size, self.height)
+        if not centered:
+            x = x + widths / 2
+            y = None if y is None else y - self.height / 2
+        return declutter_labels(x=x, widths=widths, y=y, heights=heights)
@@ -1,10 +1,13 @@
 """Scrolling Bar Chart for live data plotting"""
 
-from typing import Type, Dict, Union, cast
+from typing import Type, Dict, Union, Deque, Optional, Tuple, cast
+from collections import deque
 from copy import copy
 
 import numpy as np
 import pyqtgraph as pg
+from qtpy.QtGui import QPainter, QPainterPath
+from qtpy.QtCore import QRectF
 
 from accwidgets.graph.datamodel.connection import UpdateSource
 from accwidgets.graph.datamodel.itemdatamodel import (
@@ -42,6 +45,12 @@ class AbstractBaseBarGraphItem(DataModelBasedItem, pg.BarGraphItem, metaclass=Ab
             **bargraphitem_kwargs: Keyword arguments for the BarGraphItem's constructor
         """
         self._fixed_bar_width = bargraphitem_kwargs.get("width", np.nan)
+        # Geometry of the displayed bars, None if the bars are drawn by the
+        # base class, f.e. because they were set through setOpts()
+        self._bars: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+        self._bar_rects: Deque[QRectF] = deque()
+        self._bars_bounding_rect: Optional[QRectF] = None
+        self._bars_shape: Optional[QPainterPath] = None
         bargraphitem_kwargs = LiveBarGraphItem._prepare_bar_graph_item_params(**bargraphitem_kwargs)
         pg.BarGraphItem.__init__(self, **bargraphitem_kwargs)
         DataModelBasedItem.__init__(
@@ -84,6 +93,123 @@ class AbstractBaseBarGraphItem(DataModelBasedItem, pg.BarGraphItem, metaclass=Ab
             **bargraphitem_kwargs,
         )
 
+    def setOpts(self, **opts) -> None:
+        """
+        Overrides base's setOpts(). Bars set through this function are drawn
+        by the base class.
+
+        Args:
+            **opts: Options of the BarGraphItem
+        """
+        self.prepareGeometryChange()
+        self._bars = None
+        self._bar_rects.clear()
+        super().setOpts(**opts)
+
+    def paint(self, p: QPainter, *args) -> None:
+        """
+        Overrides base's paint(). Bars set through :meth:`_set_bars` are
+        drawn with a single call from their cached rectangles.
+
+        Args:
+            p: QPainter that is used to paint this item
+        """
+        if not self._draws_cached_bars():
+            super().paint(p, *args)
+            return
+        pen = self.opts["pen"]
+        brush = self.opts["brush"]
+        p.setPen(pg.mkPen(pg.getConfigOption("foreground") if pen is None else pen))
+        p.setBrush(pg.mkBrush((128, 128, 128) if brush is None else brush))
+        p.drawRects(self._bar_rects)
+
+    def boundingRect(self) -> QRectF:
+        """Overrides base's boundingRect() to calculate it from the cached bars."""
+        bars = self._bars
+        if bars is None or not self._draws_cached_bars():
+            return super().boundingRect()
+        if self._bars_bounding_rect is None:
+            x, y0, height, width = bars
+            left: np.ndarray = x - width / 2
+            right: np.ndarray = x + width / 2
+            top: np.ndarray = y0
+            bottom: np.ndarray = y0 + height
+            bounds = np.array([
+                np.fmin(left, right), np.fmax(left, right),
+                np.fmin(top, bottom), np.fmax(top, bottom),
+            ])
+            bounds = bounds[:, ~np.isnan(bounds).any(axis=0)]
+            if bounds.size == 0:
+                self._bars_bounding_rect = QRectF()
+            else:
+                self._bars_bounding_rect = QRectF(
+                    bounds[0].min(),
+                    bounds[2].min(),
+                    bounds[1].max() - bounds[0].min(),
+                    bounds[3].max() - bounds[2].min(),
+                )
+        return self._bars_bounding_rect
+
+    def shape(self) -> QPainterPath:
+        """Overrides base's shape() to create it from the cached bars."""
+        if not self._draws_cached_bars():
+            return super().shape()
+        if self._bars_shape is None:
+            self._bars_shape = QPainterPath()
+            for rect in self._bar_rects:
+                self._bars_shape.addRect(rect)
+        return self._bars_shape
+
+    def _set_bars(self, x: np.ndarray, y0: np.ndarray, height: np.ndarray, width: float) -> None:
+        """
+        Display the given bars. If the new bars continue the displayed ones,
+        like in a scrolling plot, bars that left the window are dropped and only
+        the rectangles of newly arrived bars are created. Otherwise all bars are
+        created again.
+
+        Args:
+            x: Center of each bar
+            y0: Bottom of each bar
+            height: Height of each bar
+            width: Width of all bars
+        """
+        self.prepareGeometryChange()
+        widths = np.broadcast_to(np.asarray(width, dtype=float), x.shape)
+        bars = (x, y0, height, widths)
+        new_count = x.size
+        if self._bars is not None:
+            old_x = self._bars[0]
+            dropped = int(np.searchsorted(old_x, x[0], side="left")) if x.size else old_x.size
+            kept = old_x.size - dropped
+            if kept <= x.size and all(
+                _equal_or_both_nan(old[dropped:], new[:kept]) for old, new in zip(self._bars, bars)
+            ):
+                for _ in range(dropped):
+                    self._bar_rects.popleft()
+                new_count = x.size - kept
+            else:
+                self._bar_rects.clear()
+        self._bar_rects.extend(
+            QRectF(x_value - bar_width / 2, bottom, bar_width, bar_height)
+            for x_value, bottom, bar_height, bar_width in zip(
+                x[x.size - new_count:],
+                y0[x.size - new_count:],
+                height[x.size - new_count:],
+                widths[x.size - new_count:],
+            )
+        )
+        self._bars = bars
+        self._bars_bounding_rect = None
+        self._bars_shape = None
+        # Keep options in sync for cloning the item, without invalidating the cache
+        self.opts.update(x=x, y0=y0, height=height, width=width)
+        self.update()
+        self.informViewBoundsChanged()
+
+    def _draws_cached_bars(self) -> bool:
+        """Are the bars drawn from the cached rectangles instead of the base class's picture?"""
+        return self._bars is not None and self.opts["pens"] is None and self.opts["brushes"] is None
+
 
 class LiveBarGraphItem(AbstractBaseBarGraphItem):
 
@@ -177,7 +303,7 @@ class ScrollingBarGraphItem(LiveBarGraphItem):
 
     def update_item(self) -> None:
         """Update item based on the plot items time span information"""
-        if self._fixed_bar_width == np.nan:
+        if np.isnan(self._fixed_bar_width):
             smallest_distance = self._data_model.min_dx
             width = 0.9 * smallest_distance if smallest_distance != np.inf else 1.0
         else:
@@ -188,7 +314,7 @@ class ScrollingBarGraphItem(LiveBarGraphItem):
                 end=self._parent_plot_item.time_span.end,
             )
             if curve_x.size == curve_y.size and curve_x.size > 0:
-                self.setOpts(x=curve_x, y0=curve_y, height=height, width=width)
+                self._set_bars(x=curve_x, y0=curve_y, height=height, width=width)
 
 
 class StaticBarGraphItem(AbstractBaseBarGraphItem):
@@ -208,4 +334,11 @@ class StaticBarGraphItem(AbstractBaseBarGraphItem):
         if np.isnan(width):
             width = min(abs(np.ediff1d(curve_x)[1:]))
         if curve_x.size == curve_y.size and curve_x.size > 0:
-            self.setOpts(x=curve_x, y0=curve_y, height=height, width=width)
+            self._set_bars(x=curve_x, y0=curve_y, height=height, width=width)
+
+
+def _equal_or_both_nan(first: np.ndarray, second: np.ndarray) -> bool:
+    """Are both arrays equal, if NaN values are treated as equal to each other?"""
+    return first.shape == second.shape and bool(np.all(
+        (first == second) | (np.isnan(first) & np.isnan(second)),
+    ))
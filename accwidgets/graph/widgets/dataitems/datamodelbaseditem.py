@@ -2,7 +2,7 @@
 
 import abc
 import warnings
-from typing import TYPE_CHECKING, Type, cast, TypeVar, List
+from typing import TYPE_CHECKING, Type, cast, TypeVar, List, Optional, Tuple
 
 import numpy as np
 import pyqtgraph as pg
@@ -43,6 +43,9 @@ class DataModelBasedItem(metaclass=abc.ABCMeta):
         self._data_model.sig_data_model_changed.connect(self._handle_data_model_change)
         self._parent_plot_item: "ExPlotItem" = parent_plot_item
         self._layer_id: str = ""
+        # State the item was drawn with last, to skip redrawing unchanged items
+        self._dirty: bool = True
+        self._drawn_state: Optional[Tuple[float, ...]] = None
 
     @classmethod
     def get_subclass_fitting_plotting_style(
@@ -90,6 +93,51 @@ class DataModelBasedItem(metaclass=abc.ABCMeta):
         """Update item based on the plot items time span information"""
         pass
 
+    @property
+    def outdated(self) -> bool:
+        """
+        The item has to be redrawn, if it was marked as dirty, its data model has
+        changed or its visible window has moved since it was drawn last.
+        """
+        if self._dirty or self._drawn_state is None:
+            return True
+        current_state = self._draw_state()
+        return len(current_state) != len(self._drawn_state) or any(
+            # NaN timestamps in both states are seen as unchanged
+            new != old and not (np.isnan(new) and np.isnan(old))
+            for new, old in zip(current_state, self._drawn_state)
+        )
+
+    def mark_dirty(self) -> None:
+        """Force redrawing the item in the next update of its plot."""
+        self._dirty = True
+
+    def update_item_if_outdated(self) -> bool:
+        """
+        Update the item, if it is outdated, otherwise the redrawing is skipped.
+
+        Returns:
+            True, if the item was updated
+        """
+        if not self.outdated:
+            return False
+        self.update_item()
+        self._drawn_state = self._draw_state()
+        self._dirty = False
+        return True
+
+    def _draw_state(self) -> Tuple[float, ...]:
+        """
+        State the drawn representation of the item depends on. This is the
+        version of the data model and the time span of the plot, if the
+        plot has one.
+        """
+        state: Tuple[float, ...] = (self._data_model.version, )
+        if self._parent_plot_item.timing_source_compatible:
+            time_span = self._parent_plot_item.time_span
+            state += (time_span.start, time_span.end, time_span.last_timestamp)
+        return state
+
     @staticmethod
     def check_plotting_style_support(
             plot_config: ExPlotWidgetConfig,
@@ -145,7 +193,7 @@ class DataModelBasedItem(metaclass=abc.ABCMeta):
                 self._parent_plot_item.update_timestamp(possible_ts)
         elif not plot.timing_source_compatible or \
                 (plot.timing_source_attached and plot.last_timestamp != -1.0):
-            self.update_item()
+            plot.request_items_update(item=self)
 
 
 class AbstractDataModelBasedItemMeta(type(pg.GraphicsObject), type(DataModelBasedItem)):  # type: ignore
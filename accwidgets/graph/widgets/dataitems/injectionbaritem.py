@@ -1,10 +1,12 @@
 """Scrolling Bar Chart for live-data plotting"""
 
-from typing import List, Type, Union, cast
+from typing import List, Type, Union, Optional, Tuple, cast
 from copy import copy
 
 import pyqtgraph as pg
 import numpy as np
+from qtpy.QtGui import QColor, QFont
+from qtpy.QtWidgets import QGraphicsItem
 
 from accwidgets.graph.datamodel.connection import UpdateSource
 from accwidgets.graph.datamodel.itemdatamodel import (
@@ -21,7 +23,7 @@ from accwidgets.graph.widgets.dataitems.datamodelbaseditem import (
 from accwidgets.graph.widgets.plotconfiguration import (
     PlotWidgetStyle,
 )
-from accwidgets.graph.util import deprecated_param_alias
+from accwidgets.graph.util import deprecated_param_alias, match_pooled_positions, LabelCulling
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from accwidgets.graph.widgets.plotitem import ExPlotItem
@@ -56,8 +58,24 @@ class AbstractBaseInjectionBarGraphItem(DataModelBasedItem,
             data_model=data_model,
             parent_plot_item=plot_item,
         )
-        # TextItems for the labels of the injection-bars
+        # Pool of TextItems for the labels of the injection-bars, labels
+        # that are not used at the moment are hidden
         self._text_labels: List[pg.TextItem] = []
+        # Position and text displayed by each label of the pool, NaN and
+        # None for hidden labels
+        self._labels_x: np.ndarray = np.array([])
+        self._labels_y: np.ndarray = np.array([])
+        self._labels_texts: np.ndarray = np.array([], dtype=object)
+        # Color all labels are displayed in
+        self._labels_color: Optional[QColor] = None
+        # Font the labels are displayed and measured with
+        self._label_font = QFont()
+        # Labels overlapping the labels of bars further right are not displayed
+        self._label_culling = LabelCulling(font=self._label_font)
+        # Texts and y positions of all labels and the pixels per unit on the
+        # x and y axis they were culled for
+        self._label_candidates: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._label_scale: Optional[Tuple[float, float]] = None
 
     @classmethod
     def from_plot_item(
@@ -127,34 +145,77 @@ class AbstractBaseInjectionBarGraphItem(DataModelBasedItem,
             )
             self._draw_injector_bar_labels(label_texts, label_y_positions)
 
+    def viewRangeChanged(self) -> None:
+        """Update the displayed labels, if the scale of the view has changed."""
+        super().viewRangeChanged()
+        if (self._label_candidates is not None
+                and LabelCulling.pixel_scale(self.getViewBox()) != self._label_scale):
+            self._draw_injector_bar_labels(*self._label_candidates)
+
     def _draw_injector_bar_labels(self, texts: np.ndarray, y_values: np.ndarray) -> None:
         """
-        Draw a specified label at a specific position.
+        Draw a specified label at a specific position. Labels are identified by
+        the x position of their bar. Labels of bars that are already displayed
+        are only changed if their text or y position has changed, labels of bars
+        that are not displayed anymore are reused for new bars.
+
+        Labels that would overlap the labels of bars further right are not
+        displayed at all.
 
         Args:
             texts: Array of text for the labels
             y_values: y values
         """
         x_values = self.opts["x"]
-        self._clear_labels()
-        for x, y, text in zip(x_values, y_values, texts):
-            try:
-                color = pg.mkPen(self.opts.get("pen", "w") or "w").color()
-            except ValueError:
-                color = "w"
-            label = pg.TextItem(
-                text=text,
-                color=color,
+        self._label_candidates = (texts, y_values)
+        self._label_scale = LabelCulling.pixel_scale(self.getViewBox())
+        if self._label_scale is not None and x_values.size == texts.size == y_values.size:
+            x_scale, y_scale = self._label_scale
+            visible = self._label_culling.visible(
+                x=x_values * x_scale,
+                y=y_values * y_scale,
+                texts=texts,
+                centered=False,
             )
-            label.setPos(x, y)
-            self._text_labels.append(label)
-            label.setParentItem(self)
-
-    def _clear_labels(self) -> None:
-        """Remove all labels from the ViewBox."""
-        for label in self._text_labels:
-            self.getViewBox().removeItem(label)
-        self._text_labels.clear()
+            x_values, y_values, texts = x_values[visible], y_values[visible], texts[visible]
+        try:
+            color = pg.mkPen(self.opts.get("pen", "w") or "w").color()
+        except ValueError:
+            color = pg.mkColor("w")
+        if color != self._labels_color:
+            for label in self._text_labels:
+                label.setColor(color)
+            self._labels_color = color
+        label_indices, found, unused = match_pooled_positions(pool_x=self._labels_x, x=x_values)
+        kept = np.flatnonzero(found)
+        for bar in kept[self._labels_texts[label_indices[kept]] != texts[kept]]:
+            self._text_labels[label_indices[bar]].setText(texts[bar])
+        for bar in kept[self._labels_y[label_indices[kept]] != y_values[kept]]:
+            self._text_labels[label_indices[bar]].setPos(x_values[bar], y_values[bar])
+        for bar in np.flatnonzero(~found):
+            if label_indices[bar] < len(self._text_labels):
+                label = self._text_labels[label_indices[bar]]
+                label.setText(texts[bar])
+                label.show()
+            else:
+                label = pg.TextItem(
+                    text=texts[bar],
+                    color=color,
+                )
+                label.setFont(self._label_font)
+                # Only render the text again, if it changes
+                label.textItem.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+                self._text_labels.append(label)
+                label.setParentItem(self)
+            label.setPos(x_values[bar], y_values[bar])
+        for label_index in unused:
+            self._text_labels[label_index].hide()
+        self._labels_x = np.full(len(self._text_labels), np.nan)
+        self._labels_y = np.full(len(self._text_labels), np.nan)
+        self._labels_texts = np.full(len(self._text_labels), None, dtype=object)
+        self._labels_x[label_indices] = x_values
+        self._labels_y[label_indices] = y_values
+        self._labels_texts[label_indices] = texts
 
 
 class LiveInjectionBarGraphItem(AbstractBaseInjectionBarGraphItem):
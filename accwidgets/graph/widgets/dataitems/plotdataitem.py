@@ -2,15 +2,16 @@
 Module contains different curves that can be added to a PlotItem based on PyQtGraph's PlotDataItem.
 """
 
-from typing import Tuple, Dict, cast, Type, Union
+from typing import Tuple, Dict, cast, Type, Union, Optional
 from copy import copy
 
 import numpy as np
 import pyqtgraph as pg
+from qtpy.QtCore import QTimer
 
 from accwidgets.graph.datamodel.connection import UpdateSource
 from accwidgets.graph.datamodel.itemdatamodel import LiveCurveDataModel, StaticCurveDataModel
-from accwidgets.graph.datamodel.datamodelbuffer import DEFAULT_BUFFER_SIZE
+from accwidgets.graph.datamodel.datamodelbuffer import DEFAULT_BUFFER_SIZE, min_max_decimation_indices
 from accwidgets.graph.datamodel.datastructures import DEFAULT_COLOR
 from accwidgets.graph.widgets.dataitems.datamodelbaseditem import (
     DataModelBasedItem,
@@ -36,6 +37,11 @@ _PLOTDATAITEM_CURVE_PARAM_MAPPING = [
     ("stepMode", "stepMode"),
 ]
 
+# Points per horizontal pixel a static curve shows at max when decimating its data
+_DECIMATION_POINTS_PER_PIXEL: int = 2
+# Time in ms a static curve waits after a change of the view range before rendering again
+_VIEWPORT_UPDATE_INTERVAL: int = 40
+
 # params accepted by the plotdataitem and their fitting params in the scatter-plot-item
 _PLOTDATAITEM_SCATTER_PARAM_MAPPING = [
     ("symbolPen", "pen"),
@@ -412,6 +418,173 @@ class StaticPlotCurve(AbstractBasePlotCurve):
     supported_plotting_style = PlotWidgetStyle.STATIC_PLOT
     data_model_type = StaticCurveDataModel
 
+    def __init__(
+            self,
+            plot_item: "ExPlotItem",
+            data_model: AbstractBaseDataModel,
+            pen=DEFAULT_COLOR,
+            viewport_decimation: bool = False,
+            **plotdataitem_kwargs,
+    ):
+        """
+        Curve displaying the full data of its data model.
+
+        As long as only the y values of the data model change, the data model
+        keeps passing the same x array, so the x values do not have to be
+        recreated for each update.
+
+        If viewport decimation is enabled and the data contains more points
+        than the view box has horizontal pixels, only the data around the
+        visible x range is displayed, reduced to about two points per pixel
+        while keeping the minimum and maximum values. After the view range was
+        changed, the curve is rendered again if the displayed data does not
+        cover the new range anymore or the resolution does not fit anymore.
+        While dragging, this happens at most once per 40 ms.
+
+        Args:
+            plot_item: plot item the curve should fit to
+            data_model: Data Model the curve is based on
+            pen: pen the curve should be drawn with, is part of the PlotDataItem
+                 base class parameters
+            viewport_decimation: Should data with ascending x values be reduced
+                                 to the visible range and the view box's resolution,
+                                 disabled by default
+            **plotdataitem_kwargs: keyword arguments fo the base class
+        """
+        super().__init__(
+            plot_item=plot_item,
+            data_model=data_model,
+            pen=pen,
+            **plotdataitem_kwargs,
+        )
+        self._viewport_decimation = viewport_decimation
+        # Start, end and visible span of the x range the displayed data was
+        # reduced to, None if the full data is displayed
+        self._viewport_range: Optional[Tuple[float, float, float]] = None
+        # The full data could not be reduced since the view box was not known
+        self._viewport_pending = False
+        # x version and result of the last check for ascending x values
+        self._x_ascending: Tuple[Optional[int], bool] = (None, False)
+        # Model version and bounds of the full data per axis
+        self._full_data_bounds: Dict[int, Tuple[Optional[int], Tuple[Optional[float], Optional[float]]]] = {}
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.setInterval(_VIEWPORT_UPDATE_INTERVAL)
+        self._viewport_timer.timeout.connect(self._handle_viewport_timeout)
+
     def update_item(self) -> None:
         """Get the full data of the data buffer and display it."""
-        self.setData(*self._data_model.full_data_buffer)
+        x, y = self._data_model.full_data_buffer
+        x_version = getattr(self._data_model, "x_version", None)
+        subset = self._viewport_subset(x=x, y=y, x_version=x_version)
+        if subset is not None:
+            self.setData(*subset)
+        else:
+            self.setData(x, y)
+
+    def viewRangeChanged(self) -> None:
+        """Schedule rendering the data for the new view range."""
+        super().viewRangeChanged()
+        if (self._viewport_range is not None or self._viewport_pending) and not self._viewport_timer.isActive():
+            self._viewport_timer.start()
+
+    def dataBounds(
+            self,
+            ax: int,
+            frac: float = 1.0,
+            orthoRange: Optional[Tuple[float, float]] = None,
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Bounds of the displayed data. If only a reduced part of the data is
+        displayed, the complete bounds are calculated from the full data, so
+        auto ranging still shows all of it.
+        """
+        if self._viewport_range is None or frac < 1.0 or orthoRange is not None:
+            return super().dataBounds(ax, frac, orthoRange)
+        version = getattr(self._data_model, "version", None)
+        cached_version, bounds = self._full_data_bounds.get(ax, (None, (None, None)))
+        if version is None or cached_version != version:
+            values = self._data_model.full_data_buffer[0 if ax == 0 else 1]
+            values = values[np.isfinite(values)]
+            bounds = (float(values.min()), float(values.max())) if values.size else (None, None)
+            self._full_data_bounds[ax] = (version, bounds)
+        return bounds
+
+    def _viewport_subset(
+            self,
+            x: np.ndarray,
+            y: np.ndarray,
+            x_version: Optional[int],
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Data around the view box's visible x range, reduced to its horizontal
+        resolution. The x range is extended by half its span on both sides,
+        so short panning does not need rendering again.
+
+        Returns:
+            Reduced x and y values, None if the full data should be displayed
+        """
+        self._viewport_range = None
+        self._viewport_pending = False
+        if not self._viewport_decimation or not self._viewport_decimatable():
+            return None
+        view_box = self.getViewBox()
+        pixels = int(view_box.width()) if view_box is not None else 0
+        if x.size <= _DECIMATION_POINTS_PER_PIXEL * max(pixels, 1) or not self._ascending(x, x_version):
+            return None
+        if pixels <= 0:
+            self._viewport_pending = True
+            return None
+        view_start, view_end = view_box.viewRange()[0]
+        span = view_end - view_start
+        start, end = view_start - span / 2, view_end + span / 2
+        # Keep one point outside the range on both sides, so the curve reaches the view's edges
+        start_index = max(int(np.searchsorted(x, start, side="left")) - 1, 0)
+        end_index = min(int(np.searchsorted(x, end, side="right")) + 1, x.size)
+        max_points = 2 * _DECIMATION_POINTS_PER_PIXEL * pixels
+        if start_index == 0 and end_index == x.size and x.size <= max_points:
+            return None
+        self._viewport_range = (start, end, span)
+        x, y = x[start_index:end_index], y[start_index:end_index]
+        if x.size <= max_points:
+            return x, y
+        indices = min_max_decimation_indices(y=y, max_points=max_points)
+        gaps: np.ndarray = indices < 0
+        indices[gaps] = 0
+        x, y = x[indices], y[indices]
+        x[gaps] = np.nan
+        y[gaps] = np.nan
+        return x, y
+
+    def _viewport_decimatable(self) -> bool:
+        """Are the displayed x values in the same coordinates as the view range?"""
+        return (
+            not self.opts["fftMode"]
+            and not self.opts["logMode"][0]
+            and not self.opts["clipToView"]
+            and not self.opts["autoDownsample"]
+            and not self.opts["stepMode"]
+        )
+
+    def _ascending(self, x: np.ndarray, x_version: Optional[int]) -> bool:
+        """Are the x values sorted ascending without NaN values?"""
+        if x_version is not None and self._x_ascending[0] == x_version:
+            return self._x_ascending[1]
+        # Comparisons with NaN are always False
+        ascending = bool(np.all(x[1:] >= x[:-1]))
+        self._x_ascending = (x_version, ascending)
+        return ascending
+
+    def _handle_viewport_timeout(self) -> None:
+        """Render the curve again, if the displayed data does not fit the view range."""
+        view_box = self.getViewBox()
+        if view_box is None:
+            return
+        if self._viewport_range is not None:
+            view_start, view_end = view_box.viewRange()[0]
+            start, end, span = self._viewport_range
+            if start <= view_start and view_end <= end and (view_end - view_start) > span / 2:
+                return
+        elif not self._viewport_pending:
+            return
+        self.update_item()
@@ -1,9 +1,10 @@
 """Scrolling Bar Chart for live data plotting"""
 
-from typing import List, Type, Union
+from typing import List, Type, Union, Dict, Tuple, Optional, Any
 
+import numpy as np
 import pyqtgraph as pg
-from qtpy.QtGui import QPainter
+from qtpy.QtGui import QPainter, QPen, QFont
 from qtpy.QtWidgets import QGraphicsItem
 from qtpy.QtCore import QRectF
 
@@ -21,13 +22,16 @@ from accwidgets.graph.widgets.dataitems.datamodelbaseditem import (
 from accwidgets.graph.widgets.plotconfiguration import (
     PlotWidgetStyle,
 )
-from accwidgets.graph.util import deprecated_param_alias
+from accwidgets.graph.util import deprecated_param_alias, match_pooled_positions, LabelCulling
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from accwidgets.graph.widgets.plotitem import ExPlotItem
 
 """which plotting style is achieved by which class"""
 
+# Lines the pool keeps at least, before hidden lines are removed
+_MIN_POOLED_LINES = 32
+
 
 class AbstractBaseTimestampMarker(DataModelBasedItem, pg.GraphicsObject, metaclass=AbstractDataModelBasedItemMeta):
 
@@ -50,10 +54,33 @@ class AbstractBaseTimestampMarker(DataModelBasedItem, pg.GraphicsObject, metacla
             data_model=data_model,
             parent_plot_item=plot_item,
         )
+        # Pool of lines, lines that are not used at the moment are hidden
         self._line_elements: List[pg.InfiniteLine] = []
-        self.opts = {
+        # Position, color and label displayed by each line of the pool,
+        # NaN and None for hidden lines
+        self._lines_x: np.ndarray = np.array([])
+        self._lines_colors: np.ndarray = np.array([], dtype=object)
+        self._lines_labels: np.ndarray = np.array([], dtype=object)
+        # Is the label of each line of the pool displayed
+        self._lines_label_visible: np.ndarray = np.array([], dtype=bool)
+        self._pens: Dict[Tuple[str, float], QPen] = {}
+        # Font the labels are displayed and measured with
+        self._label_font = QFont()
+        # Labels overlapping the labels of markers further right are hidden
+        self._label_culling = LabelCulling(font=self._label_font)
+        # Pixels per unit on the x axis the labels were culled for
+        self._label_scale: Optional[float] = None
+        # Markers passed for drawing, whether they are displayed aggregated and
+        # the pixels per unit on the x axis the aggregation was done for
+        self._marker_data: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._markers_aggregated = False
+        self._aggregation_scale: Optional[float] = None
+        self.opts: Dict[str, Any] = {
             # pen width shared among all pens for the InfiniteLines
             "pen_width": 1,
+            # visible markers per horizontal pixel above which markers are
+            # aggregated (f.e. 0.5), None for always displaying all markers
+            "aggregation_threshold": None,
         }
 
     @classmethod
@@ -120,23 +147,206 @@ class AbstractBaseTimestampMarker(DataModelBasedItem, pg.GraphicsObject, metacla
         of the internal InfiniteLines Bounding Rectangle
 
         Returns:
-            Bounding Rectangle of the first line element
+            Bounding Rectangle of the first visible line element
         """
-        try:
-            return self._line_elements[0].boundingRect()
-        except IndexError:
+        displayed = np.flatnonzero(~np.isnan(self._lines_x))
+        if displayed.size == 0:
             return QRectF(0.0, 0.0, 0.0, 0.0)
+        return self._line_elements[displayed[0]].boundingRect()
+
+    def viewRangeChanged(self) -> None:
+        """
+        Aggregate the markers again or update the displayed labels, if the
+        visible markers or the horizontal scale of the view have changed.
+        """
+        super().viewRangeChanged()
+        scale = self._x_scale()
+        if self._marker_data is not None and (
+            self._aggregation_needed(self._marker_data[0]) != self._markers_aggregated
+            or (self._markers_aggregated and scale != self._aggregation_scale)
+        ):
+            self._draw_markers(*self._marker_data)
+        elif scale != self._label_scale:
+            self._cull_labels()
+
+    def _draw_markers(self, x: np.ndarray, colors: np.ndarray, labels: np.ndarray) -> None:
+        """
+        Display the given markers. If more markers per pixel than the configured
+        threshold are visible, markers are aggregated, see :meth:`_aggregated_markers`.
+
+        Args:
+            x: x positions of the markers
+            colors: colors of the markers
+            labels: labels of the markers
+        """
+        scale = self._x_scale()
+        self._marker_data = (x, colors, labels)
+        self._markers_aggregated = self._aggregation_needed(x)
+        self._aggregation_scale = scale
+        if self._markers_aggregated and scale is not None:
+            x, colors, labels = self._aggregated_markers(x=x, colors=colors, labels=labels, scale=scale)
+        self._draw_lines(x=x, colors=colors, labels=labels)
+
+    def _aggregation_needed(self, x: np.ndarray) -> bool:
+        """Are more markers per pixel visible than the configured threshold?"""
+        threshold = self.opts.get("aggregation_threshold")
+        view_box = self.getViewBox()
+        if not threshold or self._x_scale() is None:
+            return False
+        start, end = view_box.viewRange()[0]
+        visible = np.searchsorted(x, end, side="right") - np.searchsorted(x, start, side="left")
+        return visible > threshold * view_box.width()
+
+    def _aggregated_markers(
+            self,
+            x: np.ndarray,
+            colors: np.ndarray,
+            labels: np.ndarray,
+            scale: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Combine the markers to one marker per bucket of 1 / threshold pixels.
+        The buckets are fixed to the x axis, so buckets do not change while
+        scrolling. The combined marker is placed at the newest marker of its
+        bucket, has its color and displays the count of markers as label.
+
+        Args:
+            x: x positions of the markers, sorted ascending
+            colors: colors of the markers
+            labels: labels of the markers
+            scale: pixels per unit on the x axis
+
+        Returns:
+            x positions, colors and labels of the aggregated markers
+        """
+        buckets = np.floor(x * (scale * self.opts["aggregation_threshold"]))
+        newest = np.flatnonzero(np.append(buckets[1:] != buckets[:-1], True))
+        counts = np.diff(np.append(-1, newest))
+        labels = np.where(counts > 1, np.char.add(counts.astype(str), " markers"), labels[newest])
+        return x[newest], colors[newest], labels
+
+    def _draw_lines(self, x: np.ndarray, colors: np.ndarray, labels: np.ndarray) -> None:
+        """
+        Display lines for the given markers. Lines of markers that are already
+        displayed are kept as they are, lines of markers that are not displayed
+        anymore are reused for new ones. New lines are only created if more
+        markers are displayed than lines exist. If the pool holds more than
+        twice as many lines as markers are displayed, the surplus hidden lines
+        are removed. Labels that would overlap the labels of markers further
+        right are hidden.
+
+        Args:
+            x: x positions of the markers
+            colors: colors of the markers
+            labels: labels of the markers
+        """
+        line_indices, found, unused = match_pooled_positions(pool_x=self._lines_x, x=x)
+        kept = np.flatnonzero(found)
+        changed = kept[
+            (self._lines_colors[line_indices[kept]] != colors[kept])
+            | (self._lines_labels[line_indices[kept]] != labels[kept])
+        ]
+        for marker in changed:
+            line = self._line_elements[line_indices[marker]]
+            line.setPen(self._pen(colors[marker]))
+            line.label.setFormat(labels[marker])
+        for marker in np.flatnonzero(~found):
+            if line_indices[marker] < len(self._line_elements):
+                line = self._line_elements[line_indices[marker]]
+                # The label only updates its text if it is visible
+                line.show()
+                line.setPen(self._pen(colors[marker]))
+                line.setPos(float(x[marker]))
+                line.label.setFormat(labels[marker])
+            else:
+                self._line_elements.append(self._create_line(
+                    x_position=float(x[marker]),
+                    color=colors[marker],
+                    label=labels[marker],
+                ))
+        for line_index in unused:
+            self._line_elements[line_index].hide()
+        surplus = len(self._line_elements) - max(_MIN_POOLED_LINES, 2 * x.size)
+        if surplus > 0:
+            line_indices = self._remove_lines(line_indices=line_indices, removed=unused[-surplus:])
+        line_count = len(self._line_elements)
+        self._lines_x = np.full(line_count, np.nan)
+        self._lines_colors = np.full(line_count, None, dtype=object)
+        self._lines_labels = np.full(line_count, None, dtype=object)
+        self._lines_x[line_indices] = x
+        self._lines_colors[line_indices] = colors
+        self._lines_labels[line_indices] = labels
+        # Labels of new lines are visible
+        self._lines_label_visible = np.concatenate((
+            self._lines_label_visible,
+            np.ones(line_count - self._lines_label_visible.size, dtype=bool),
+        ))
+        self._cull_labels()
+
+    def _remove_lines(self, line_indices: np.ndarray, removed: np.ndarray) -> np.ndarray:
+        """
+        Remove hidden lines from the pool and the scene.
+
+        Args:
+            line_indices: Index of the line of each displayed marker
+            removed: Indices of the hidden lines that should be removed
 
-    def _clear_infinite_lines(self):
-        for line in self._line_elements:
-            self.getViewBox().removeItem(line)
-        self._line_elements.clear()
+        Returns:
+            Index of the line of each displayed marker in the shrunk pool
+        """
+        kept = np.ones(len(self._line_elements), dtype=bool)
+        kept[removed] = False
+        for line_index in removed:
+            line = self._line_elements[line_index]
+            scene = line.scene()
+            if scene is not None:
+                scene.removeItem(line)
+            line.setParentItem(None)
+        self._line_elements = [line for line, keep in zip(self._line_elements, kept) if keep]
+        self._lines_label_visible = self._lines_label_visible[kept]
+        new_indices: np.ndarray = np.cumsum(kept) - 1
+        return new_indices[line_indices]
+
+    def _cull_labels(self) -> None:
+        """Hide the labels that overlap the labels of markers further right."""
+        scale = self._x_scale()
+        visible = ~np.isnan(self._lines_x)
+        if scale is not None:
+            visible[visible] = self._label_culling.visible(
+                x=self._lines_x[visible] * scale,
+                texts=self._lines_labels[visible],
+            )
+        for line_index in np.flatnonzero(visible != self._lines_label_visible):
+            label = self._line_elements[line_index].label
+            if visible[line_index]:
+                label.show()
+                # Hidden labels do not update their text
+                label.valueChanged()
+            else:
+                label.hide()
+        self._lines_label_visible = visible
+        self._label_scale = scale
+
+    def _x_scale(self) -> Optional[float]:
+        """Pixels per unit on the x axis of the view box, None if not known."""
+        scale = LabelCulling.pixel_scale(self.getViewBox())
+        return None if scale is None else scale[0]
+
+    def _pen(self, color: str) -> QPen:
+        """Pen for lines with the given color, pens are shared between lines."""
+        width = float(self.opts["pen_width"])
+        key = (color, width)
+        try:
+            return self._pens[key]
+        except KeyError:
+            pen = pg.mkPen(color=color, width=width)
+            self._pens[key] = pen
+            return pen
 
-    def _add_line_at_position(self, x_position: float, color: str, label: str):
-        pen = pg.mkPen(color=color, width=self.opts.get("pen_width"))
+    def _create_line(self, x_position: float, color: str, label: str) -> pg.InfiniteLine:
         infinite_line = pg.InfiniteLine(
             pos=x_position,
-            pen=pen,
+            pen=self._pen(color),
             label=label,
             labelOpts={
                 "position": 0.95,
@@ -145,11 +355,12 @@ class AbstractBaseTimestampMarker(DataModelBasedItem, pg.GraphicsObject, metacla
             },
         )
         infinite_line.label.anchors = [(0.5, 0.5), (0.5, 0.5)]
+        infinite_line.label.setFont(self._label_font)
         # When setting a parent, the new infinite line is automatically added
         # to the parent's scene. This makes sure all created infinite lines
         # are properly removed when the parent is removed from a scene.
         infinite_line.setParentItem(self)
-        self._line_elements.append(infinite_line)
+        return infinite_line
 
 
 class LiveTimestampMarker(AbstractBaseTimestampMarker):
@@ -236,10 +447,8 @@ class ScrollingTimestampMarker(LiveTimestampMarker):
             start=self._parent_plot_item.time_span.start,
             end=self._parent_plot_item.time_span.end,
         )
-        if curve_x.size == colors.size == labels.size and curve_x.size > 0:
-            self._clear_infinite_lines()
-            for x_value, color, label in zip(curve_x, colors, labels):
-                self._add_line_at_position(x_position=x_value, color=color, label=label)
+        if curve_x.size == colors.size == labels.size:
+            self._draw_markers(x=curve_x, colors=colors, labels=labels)
 
 
 class StaticTimestampMarker(AbstractBaseTimestampMarker):
@@ -255,7 +464,5 @@ class StaticTimestampMarker(AbstractBaseTimestampMarker):
     def update_item(self) -> None:
         """Update item with the entire saved in the data model."""
         curve_x, colors, labels = self._data_model.full_data_buffer
-        if curve_x.size == colors.size == labels.size and curve_x.size > 0:
-            self._clear_infinite_lines()
-            for x_value, color, label in zip(curve_x, colors, labels):
-                self._add_line_at_position(x_position=x_value, color=color, label=label)
+        if curve_x.size == colors.size == labels.size:
+            self._draw_markers(x=curve_x, colors=colors, labels=labels)
@@ -105,6 +105,7 @@ class ExPlotWidgetConfig:
         time_span: Union[TimeSpan, float, int, None] = 60,
         plotting_style: PlotWidgetStyle = PlotWidgetStyle.SCROLLING_PLOT,
         time_progress_line: bool = False,
+        max_fps: Optional[float] = None,
     ):
         """Configuration for the PlotWidget
 
@@ -118,28 +119,37 @@ class ExPlotWidgetConfig:
             - TimeSpan = 60 seconds.
             - Plotting Style = Scrolling Plot
             - Time Progress Line = Hidden
+            - Max FPS = Unlimited
 
         The TimeSpan can be None, A Float and a TimeSpan Object. If None, all
         accumulated data in the buffer is displayed. If a Float is passed, data
         of the last n seconds is displayed. For more information about the
         TimeSpan, have a look at its documentation.
 
+        If a maximum frame rate is set, new data and timing updates do not redraw
+        the plot's items right away. Instead the plot is marked as outdated and
+        all updates are combined into at most one redraw per frame.
+
         Args:
             time_span: time span that each curve represents.
             time_progress_line: flag that represents if a vertical line should be
                 drawn at the x position of the latest known timestamp.
             plotting_style: Style in which the plot's items should handle new arriving data and how
                 they will represent them.
+            max_fps: Maximum count of times per second the plot's items are redrawn. If None,
+                the items are redrawn on each update.
         """
         self._plotting_style: PlotWidgetStyle = plotting_style
         self._time_span: TimeSpan = ExPlotWidgetConfig._to_time_span(time_span=time_span)
         self._time_progress_line: bool = time_progress_line
+        self._max_fps: Optional[float] = ExPlotWidgetConfig._to_max_fps(max_fps=max_fps)
 
     def __str__(self) -> str:
         return f"PlotWidgetStyle: ( " \
             f"time span: {self.time_span}, " \
             f"time progress line: {self.time_progress_line}, " \
             f"plotting style: {self.plotting_style}, " \
+            f"max fps: {self.max_fps})"
 
     @property
     def plotting_style(self) -> PlotWidgetStyle:
@@ -182,3 +192,19 @@ class ExPlotWidgetConfig:
     def time_progress_line(self, time_progress_line: bool) -> None:
         """Should a vertical line represent the most recent received time stamp?"""
         self._time_progress_line = time_progress_line
+
+    @property
+    def max_fps(self) -> Optional[float]:
+        """How often per second the plot's items are redrawn at max, None if unlimited."""
+        return self._max_fps
+
+    @max_fps.setter
+    def max_fps(self, max_fps: Optional[float]) -> None:
+        """How often per second the plot's items are redrawn at max, None if unlimited."""
+        self._max_fps = ExPlotWidgetConfig._to_max_fps(max_fps=max_fps)
+
+    @staticmethod
+    def _to_max_fps(max_fps: Optional[float]) -> Optional[float]:
+        if max_fps is None or np.isnan(max_fps) or np.isinf(max_fps) or max_fps <= 0:
+            return None
+        return float(max_fps)
@@ -2,6 +2,7 @@
 Base class for modified PlotItems that handle data displaying in the ExtendedPlotWidget
 """
 
+import time
 import warnings
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union, Type, cast
@@ -9,7 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union, Type, cast
 import numpy as np
 import pyqtgraph as pg
 from pyqtgraph.GraphicsScene.mouseEvents import MouseDragEvent
-from qtpy.QtCore import Signal, Slot, QRectF
+from qtpy.QtCore import Signal, Slot, QRectF, QTimer
 from qtpy.QtWidgets import QGraphicsSceneWheelEvent
 from qtpy.QtGui import QPen
 
@@ -45,7 +46,7 @@ from accwidgets.graph.widgets.plotconfiguration import (
     ExPlotWidgetConfig,
     PlotWidgetStyle,
 )
-from accwidgets.graph.datamodel.datastructures import PointData
+from accwidgets.graph.datamodel.datastructures import PlottingItemValue, PointValue
 from accwidgets.graph.widgets.plottimespan import ScrollingPlotTimeSpan, CyclicPlotTimeSpan, BasePlotTimeSpan
 
 
@@ -120,6 +121,11 @@ class ExPlotItem(pg.PlotItem):
         # This will only be used in combination with the singleCurveValueSlot
         self.single_curve_value_slot_source: Optional[UpdateSource] = None
         self.single_curve_value_slot_curve: Optional[ScrollingPlotCurve] = None
+        # Redraws are combined to one per frame, if the configuration limits the frame rate
+        self._last_items_update: float = 0.0
+        self._items_update_timer = QTimer(self)
+        self._items_update_timer.setSingleShot(True)
+        self._items_update_timer.timeout.connect(self._update_children_items_timing)
 
     # ~~~~~~~~~~~ Plotting Functions ~~~~~~~~~~~
 
@@ -431,9 +437,34 @@ class ExPlotItem(pg.PlotItem):
                     timestamp=timestamp,
                     position=self.time_span.x_pos(self.last_timestamp),
                 )
-            self._update_children_items_timing()
+            self.request_items_update()
             self._draw_style_specific_objects()
 
+    def request_items_update(self, item: Optional[DataModelBasedItem] = None) -> None:
+        """Request redrawing the plot's items
+
+        Without a frame rate limit, the items are updated right away. Otherwise
+        the plot is marked as outdated and all items are updated together, as
+        soon as the next frame is due. Further requests until then are combined
+        with this one. Only items, whose data model has changed or whose visible
+        window has moved since they were drawn last, are redrawn.
+
+        Args:
+            item: If passed, only this item has to be redrawn, otherwise all items
+        """
+        if item is not None:
+            item.mark_dirty()
+        max_fps = self._plot_config.max_fps
+        if max_fps is None:
+            if item is None:
+                self._update_children_items_timing()
+            else:
+                item.update_item_if_outdated()
+        elif not self._items_update_timer.isActive():
+            next_frame = self._last_items_update + 1.0 / max_fps
+            delay = max(next_frame - time.perf_counter(), 0.0)
+            self._items_update_timer.start(int(delay * 1000))
+
     def add_data_to_single_curve(self, data: float) -> None:
         """
         This slot exposes the possibility to draw data on a
@@ -449,8 +480,8 @@ class ExPlotItem(pg.PlotItem):
             self.single_curve_value_slot_source = UpdateSource()
         if self.single_curve_value_slot_curve is None:
             self.single_curve_value_slot_curve = self.addCurve(data_source=self.single_curve_value_slot_source)
-        new_data = PointData(x=datetime.now().timestamp(), y=data)
-        self.single_curve_value_slot_source.sig_new_data.emit(new_data)
+        new_data = PointValue(x=datetime.now().timestamp(), y=data)
+        self.single_curve_value_slot_source.sig_new_data[PlottingItemValue].emit(new_data)
 
     # ~~~~~~~~~~ Layers ~~~~~~~~~
 
@@ -1084,10 +1115,12 @@ class ExPlotItem(pg.PlotItem):
             self._style_specific_objects_already_drawn = True
 
     def _update_children_items_timing(self) -> None:
-        """Update timestamp in all items added to the plot item."""
+        """Update timestamp in all outdated items added to the plot item."""
+        self._items_update_timer.stop()
+        self._last_items_update = time.perf_counter()
         for item in self.items:
             if isinstance(item, DataModelBasedItem):
-                item.update_item()
+                item.update_item_if_outdated()
 
     def _init_relative_time_axis_start(self, timestamp: float):
         """Initialize the start time for the relative time axis.
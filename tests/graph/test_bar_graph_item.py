@@ -0,0 +1,44 @@
+import numpy as np
+from qtpy.QtGui import QImage, QPainter
+from qtpy.QtCore import QRectF
+
+from accwidgets.graph import (
+    ExPlotWidgetConfig,
+    PlotWidgetStyle,
+    StaticBarGraphItem,
+    UpdateSource,
+)
+
+from .mock_utils.widget_test_window import MinimalTestWindow
+
+
+def test_bar_graph_only_creates_new_bars(qtbot):
+    """Check that bars continuing the displayed ones reuse the displayed bars' geometry"""
+    window = MinimalTestWindow(plot_config=ExPlotWidgetConfig(plotting_style=PlotWidgetStyle.STATIC_PLOT))
+    window.show()
+    qtbot.addWidget(window)
+    item = window.plot.addBarGraph(data_source=UpdateSource())
+    assert isinstance(item, StaticBarGraphItem)
+    x = np.arange(10.0)
+    item._set_bars(x=x[:5], y0=np.zeros(5), height=x[:5], width=0.5)
+    rects = list(item._bar_rects)
+    assert rects[1] == QRectF(0.75, 0.0, 0.5, 1.0)
+    assert item.boundingRect() == QRectF(-0.25, 0.0, 4.5, 4.0)
+    item._set_bars(x=x[2:8], y0=np.zeros(6), height=x[2:8], width=0.5)
+    assert list(item._bar_rects)[:3] == rects[2:]
+    assert all(new is old for new, old in zip(list(item._bar_rects)[:3], rects[2:]))
+    assert list(item._bar_rects)[3:] == [QRectF(x - 0.25, 0.0, 0.5, x) for x in [5.0, 6.0, 7.0]]
+    assert item.boundingRect() == QRectF(1.75, 0.0, 5.5, 7.0)
+    rects = list(item._bar_rects)
+    item._set_bars(x=x[2:8], y0=np.ones(6), height=x[2:8], width=0.5)
+    assert not any(new is old for new, old in zip(item._bar_rects, rects))
+    assert item.shape().boundingRect() == QRectF(1.75, 1.0, 5.5, 7.0)
+    image = QImage(100, 100, QImage.Format_ARGB32)
+    painter = QPainter(image)
+    item.paint(painter)
+    item.setOpts(brushes=["r"] * 6)
+    assert not item._draws_cached_bars()
+    item.paint(painter)
+    painter.end()
+    # Drawn by the base class
+    assert item.picture is not None
@@ -73,11 +73,13 @@ def test_sorting_of_empty_lists():
 
 
 @pytest.mark.parametrize("length_for_buffer", [10, 14])
+@pytest.mark.parametrize("circular", [False, True])
 def test_subset_creation_with_clipping_of_data_model_without_nan_values(
         length_for_buffer,
+        circular,
 ):
     """Subset Creation with """
-    buffer = accgraph.SortedCurveDataBuffer(size=length_for_buffer)
+    buffer = accgraph.SortedCurveDataBuffer(size=length_for_buffer, circular=circular)
     buffer.add_list_of_entries(
         x=np.arange(start=0.0, stop=10.0),
         y=np.arange(start=0.0, stop=10.0),
@@ -161,11 +163,13 @@ def test_subset_creation_with_clipping_of_data_model_without_nan_values(
 
 
 @pytest.mark.parametrize("length_for_buffer", [10, 14])
+@pytest.mark.parametrize("circular", [False, True])
 def test_subset_creation_with_clipping_of_data_model_with_multiple_nan_values(
         length_for_buffer,
+        circular,
 ):
     """Check same subsets as with buffer without nans with an full buffer and an buffer with empty places left"""
-    buffer = accgraph.SortedCurveDataBuffer(size=length_for_buffer)
+    buffer = accgraph.SortedCurveDataBuffer(size=length_for_buffer, circular=circular)
     buffer.add_entry(x=np.nan, y=np.nan)
     buffer.add_list_of_entries(
         x=np.array([0.0, 1.0]), y=np.array([0.0, 1.0]),
@@ -259,6 +263,347 @@ def test_buffer_size_configurability(
     assert item._data_model._full_data_buffer._primary_values.size == 10
 
 
+@pytest.mark.parametrize("size,circular", [
+    (20, False),
+    (20, True),
+    (5, True),
+    (3, True),
+])
+@pytest.mark.parametrize("existing_entries,new_entries", [
+    ([0.0, 1.0, 2.0], [3.0, 4.0]),
+    ([0.0, 2.0, 4.0], [1.0, 3.0, 5.0]),
+    ([np.nan, 2.0, np.nan, 4.0, np.nan], [0.0, 1.0, 3.0, 3.0, 4.0, np.nan]),
+    ([1.0, 1.0, 3.0, 3.0], [1.0, 2.0, 3.0]),
+    ([np.nan, np.nan], [2.0, 1.0]),
+    ([], [1.0, np.nan, 0.0]),
+    ([np.nan, 2.0, 7.0], [0.0, 1.0]),
+])
+def test_merge_entries_equals_sorting_in_single_entries(size, circular, existing_entries, new_entries):
+    """Adding a list of entries should have the same result as adding them one by one"""
+    existing_entries = np.array(existing_entries)
+    new_entries = np.array(new_entries)
+    merged_buffer = accgraph.SortedCurveDataBuffer(size=size, circular=circular)
+    single_buffer = accgraph.SortedCurveDataBuffer(size=size, circular=circular)
+    for buffer in [merged_buffer, single_buffer]:
+        for x in existing_entries:
+            buffer.add_entry(x=x, y=x * 2)
+    merged_buffer.add_list_of_entries(x=new_entries, y=new_entries * 2)
+    for x in np.sort(new_entries):
+        single_buffer.add_entry(x=x, y=x * 2)
+    assert np.allclose(merged_buffer.as_np_array(), single_buffer.as_np_array(), equal_nan=True)
+    assert merged_buffer.min_dx == single_buffer.min_dx
+
+
+@pytest.mark.parametrize("circular", [False, True])
+@pytest.mark.parametrize("new_entries", [
+    [6.0, np.nan, 7.0, 8.0, np.nan, 8.0],
+    [np.nan, 5.0, 9.0],
+    [4.0, np.nan, 2.0, 9.0],
+    [np.nan, np.nan],
+    list(np.arange(10.0, 60.0)),
+])
+def test_add_entries_keeping_order_equals_adding_single_entries(circular, new_entries):
+    """Adding entries in order should have the same result as adding them one by one"""
+    new_entries = np.array(new_entries)
+    batch_buffer = accgraph.SortedCurveDataBuffer(size=40 if circular else 80, circular=circular)
+    single_buffer = accgraph.SortedCurveDataBuffer(size=40 if circular else 80, circular=circular)
+    for buffer in [batch_buffer, single_buffer]:
+        for x in [1.0, 3.0, np.nan, 5.0]:
+            buffer.add_entry(x=x, y=x * 2)
+    batch_buffer.add_list_of_entries(x=new_entries, y=new_entries * 2, keep_order=True)
+    for x in new_entries:
+        single_buffer.add_entry(x=x, y=x * 2)
+    assert np.allclose(batch_buffer.as_np_array(), single_buffer.as_np_array(), equal_nan=True)
+    assert batch_buffer.min_dx == single_buffer.min_dx
+    assert batch_buffer.index_of_last_valid == single_buffer.index_of_last_valid
+
+
+def test_add_entries_keeping_order_to_full_linear_buffer():
+    """Entries added in order to a full buffer should keep the newest entries and their gaps"""
+    buffer = accgraph.SortedCurveDataBuffer(size=10)
+    x = np.arange(0.0, 25.0)
+    x[[20, 23]] = np.nan
+    buffer.add_list_of_entries(x=x, y=x, keep_order=True)
+    primary_values = buffer.as_np_array()[0]
+    assert np.allclose(primary_values[-5:], [np.nan, 21.0, 22.0, np.nan, 24.0], equal_nan=True)
+    assert buffer.last_valid_primary_value == 24.0
+
+
+@pytest.mark.parametrize("circular", [False, True])
+def test_searching_in_buffer_with_nan_values(circular):
+    """Searching and the newest valid entry should skip NaN entries while entries are added and removed"""
+    np.random.seed(0)
+    buffer = accgraph.SortedCurveDataBuffer(size=40, circular=circular)
+    for iteration in range(30):
+        x = np.random.randint(0, 50, size=np.random.randint(1, 6)).astype(float)
+        if iteration % 2:
+            buffer.add_list_of_entries(x=x, y=x)
+        else:
+            for value in x:
+                buffer.add_entry(x=value, y=value)
+        buffer.add_entry(x=np.nan, y=np.nan)
+        primary_values = buffer.as_np_array()[0]
+        valid_indices = np.flatnonzero(~np.isnan(primary_values))
+        assert buffer.index_of_last_valid == valid_indices[-1]
+        assert buffer.last_valid_primary_value == primary_values[valid_indices[-1]]
+        for value in np.arange(-1.0, 52.0, 0.5):
+            for side in ["left", "right"]:
+                count = np.searchsorted(primary_values[valid_indices], value, side=side)
+                if count == 0:
+                    expected = 0
+                elif count >= valid_indices.size:
+                    expected = primary_values.size
+                else:
+                    expected = valid_indices[count]
+                assert buffer._searchsorted_in_buffer(value=value, side=side) == expected
+
+
+@pytest.mark.parametrize("circular", [False, True])
+def test_last_valid_entry(circular):
+    """Check the newest valid entry of a buffer with trailing NaNs"""
+    buffer = accgraph.SortedCurveDataBuffer(size=4, circular=circular)
+    assert buffer.index_of_last_valid == -1
+    assert buffer.last_valid_primary_value is None
+    buffer.add_entry(x=np.nan, y=np.nan)
+    assert buffer.index_of_last_valid == 0
+    assert buffer.last_valid_primary_value is None
+    buffer.add_entry(x=1.0, y=1.0)
+    buffer.add_entry(x=np.nan, y=np.nan)
+    assert buffer.index_of_last_valid == 1
+    assert buffer.last_valid_primary_value == 1.0
+    buffer.add_entry(x=0.0, y=0.0)
+    assert buffer.index_of_last_valid == 2
+    assert buffer.last_valid_primary_value == 1.0
+
+
+def test_last_valid_entry_overwritten_by_nan_entries():
+    """Check that no valid entry is reported after all valid entries were overwritten with NaNs"""
+    buffer = accgraph.SortedCurveDataBuffer(size=5, circular=True)
+    buffer.add_list_of_entries(x=np.array([112.67, 114.1, np.nan, np.nan, np.nan]), y=np.arange(5.0))
+    assert buffer.index_of_last_valid == 1
+    buffer.add_list_of_entries(x=np.array([np.nan, 86.9, np.nan, 88.36]), y=np.arange(4.0))
+    assert np.isnan(buffer.as_np_array()[0]).all()
+    assert buffer.index_of_last_valid == 0
+    assert buffer.last_valid_primary_value is None
+    buffer.add_entry(x=1.0, y=1.0)
+    assert buffer.index_of_last_valid == 4
+    assert buffer.last_valid_primary_value == 1.0
+
+
+# ~~~ Tests for circular Buffers ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_circular_buffer_overwrites_oldest_entries():
+    """Check that a full circular buffer drops the oldest entries in place"""
+    buffer = accgraph.SortedCurveDataBuffer(size=5, circular=True)
+    primary_values = buffer._primary_values
+    for x in range(8):
+        buffer.add_entry(x=float(x), y=float(x) * 2)
+    assert buffer._primary_values is primary_values
+    assert buffer.occupied_size == 5
+    assert buffer.space_left == 0
+    expected = create_expected_tuple_from_list(
+        [3.0, 4.0, 5.0, 6.0, 7.0],
+        [6.0, 8.0, 10.0, 12.0, 14.0],
+    )
+    assert np.array_equal(buffer.as_np_array(), expected)
+    assert buffer.index_of_last_valid == 4
+
+
+def test_circular_buffer_sorts_in_wrapped_entries():
+    """Check sorting in entries into a buffer whose content wraps around"""
+    buffer = accgraph.SortedCurveDataBuffer(size=5, circular=True)
+    buffer.add_list_of_entries(x=np.arange(0.0, 7.0), y=np.arange(0.0, 7.0))
+    # Entry older than all others in a full buffer is dropped right away
+    buffer.add_entry(x=1.5, y=1.5)
+    assert np.array_equal(buffer.as_np_array()[0], [2.0, 3.0, 4.0, 5.0, 6.0])
+    # Entry in between evicts the oldest one
+    buffer.add_entry(x=4.5, y=4.5)
+    assert np.array_equal(buffer.as_np_array()[0], [3.0, 4.0, 4.5, 5.0, 6.0])
+    buffer.add_entry(x=np.nan, y=np.nan)
+    buffer.add_entry(x=7.0, y=7.0)
+    assert np.allclose(buffer.as_np_array()[0], [4.5, 5.0, 6.0, np.nan, 7.0], equal_nan=True)
+    assert buffer.min_dx == 0.5
+
+
+def test_circular_buffer_subsets():
+    """Check that subsets are views as long as they do not wrap around"""
+    buffer = accgraph.SortedCurveDataBuffer(size=10, circular=True)
+    buffer.add_list_of_entries(x=np.arange(0.0, 10.0), y=np.arange(0.0, 10.0))
+    buffer.add_list_of_entries(x=np.arange(10.0, 14.0), y=np.arange(10.0, 14.0))
+    # Physically the entries 10 - 13 are stored in the front of the arrays
+    x, y = buffer.subset_for_primary_val_range(start=10.0, end=12.0)
+    assert np.array_equal(x, [10.0, 11.0, 12.0])
+    assert np.shares_memory(x, buffer._primary_values)
+    x, y = buffer.subset_for_primary_val_range(start=8.0, end=11.0)
+    assert np.array_equal(x, [8.0, 9.0, 10.0, 11.0])
+    assert not np.shares_memory(x, buffer._primary_values)
+    x, y = buffer.subset_for_primary_val_range(start=8.5, end=10.5, interpolated=True)
+    assert np.allclose((x, y), ([8.5, 9.0, 10.0, 10.5], [8.5, 9.0, 10.0, 10.5]))
+
+
+@pytest.mark.parametrize("buffer_type,secondary_values", [
+    (accgraph.SortedCurveDataBuffer, [np.arange(30.0)]),
+    (accgraph.SortedBarGraphDataBuffer, [np.arange(30.0), np.arange(30.0)]),
+    (accgraph.SortedInjectionBarsDataBuffer, [np.arange(30.0), np.arange(30.0), np.arange(30.0), np.arange(30).astype(str)]),
+    (accgraph.SortedTimestampMarkerDataBuffer, [np.arange(30).astype(str), np.arange(30).astype(str)]),
+])
+def test_circular_buffer_keeps_newest_entries(buffer_type, secondary_values):
+    """Circular buffers should contain the newest entries of all added ones"""
+    primary_values = np.arange(30.0)
+    np.random.shuffle(primary_values)
+    buffer = buffer_type(size=12, circular=True)
+    for chunk in range(0, 30, 5):
+        buffer.add_entries_to_buffer(
+            primary_values=primary_values[chunk:chunk + 5],
+            secondary_values_list=[values[primary_values[chunk:chunk + 5].astype(int)] for values in secondary_values],
+        )
+    expected_primary_values = np.sort(primary_values[:25])
+    for chunk in range(25, 30):
+        expected_primary_values = np.sort(np.append(expected_primary_values, primary_values[chunk]))
+    content = buffer.as_np_array()
+    assert np.array_equal(content[0], expected_primary_values[-12:])
+    for actual, expected in zip(content[1:], secondary_values):
+        assert np.array_equal(actual, expected[content[0].astype(int)])
+
+
+# ~~~ Tests for decimated Subsets ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@pytest.mark.parametrize("level_of_detail", [False, True])
+def test_decimated_subset_keeps_peaks(level_of_detail):
+    """Decimated subsets should keep the extremes as well as the first and last point"""
+    buffer = accgraph.SortedCurveDataBuffer(size=10000, level_of_detail=level_of_detail)
+    x = np.arange(10000.0)
+    y = np.zeros(10000)
+    y[1234] = 5.0
+    y[7777] = -3.0
+    buffer.add_list_of_entries(x=x, y=y)
+    subset_x, subset_y = buffer.subset_for_primary_val_range(start=100.0, end=9900.0, max_points=200)
+    assert subset_x.size <= 200
+    assert np.all(np.diff(subset_x) >= 0)
+    assert subset_x[0] == 100.0
+    assert subset_x[-1] == 9900.0
+    assert 5.0 in subset_y[subset_x == 1234.0]
+    assert -3.0 in subset_y[subset_x == 7777.0]
+    # Subsets fitting into max points are not decimated
+    subset = buffer.subset_for_primary_val_range(start=100.0, end=199.0, max_points=200)
+    assert np.array_equal(subset, (x[100:200], y[100:200]))
+
+
+@pytest.mark.parametrize("level_of_detail", [False, True])
+def test_decimated_subset_interpolation_and_gaps(level_of_detail):
+    """Decimated subsets should be interpolated at the boundaries and keep gaps"""
+    buffer = accgraph.SortedCurveDataBuffer(size=2000, level_of_detail=level_of_detail)
+    buffer.add_list_of_entries(x=np.arange(500.0), y=np.arange(500.0))
+    buffer.add_entry(x=np.nan, y=np.nan)
+    buffer.add_list_of_entries(x=np.arange(500.0, 1000.0), y=np.arange(500.0, 1000.0))
+    subset_x, subset_y = buffer.subset_for_primary_val_range(start=10.5, end=900.5, interpolated=True, max_points=100)
+    assert subset_x[0] == 10.5 and subset_y[0] == 10.5
+    assert subset_x[-1] == 900.5 and subset_y[-1] == 900.5
+    assert np.isnan(subset_x).sum() == 1
+
+
+@pytest.mark.parametrize("level_of_detail", [False, True])
+@pytest.mark.parametrize("start, end, max_points", [
+    (5.0, 25.0, 8),
+    (5.0, 25.0, 5),
+    (1.0, 10.0, 8),
+    (17.0, 30.0, 11),
+    (3.0, 38.0, 14),
+    (0.0, 39.0, 3),
+])
+def test_decimated_subset_of_small_ranges(level_of_detail, start, end, max_points):
+    """Decimated subsets of ranges smaller than a level's chunks should stay inside the range and max points"""
+    buffer = accgraph.SortedCurveDataBuffer(size=100, level_of_detail=level_of_detail)
+    x = np.arange(40.0)
+    buffer.add_list_of_entries(x=x, y=np.sin(x))
+    subset_x, subset_y = buffer.subset_for_primary_val_range(start=start, end=end, max_points=max_points)
+    assert not np.isnan(subset_x).any()
+    assert subset_x.size <= max(max_points, 5)
+    assert np.all(np.diff(subset_x) >= 0)
+    assert subset_x[0] == start
+    assert subset_x[-1] == end
+    assert np.array_equal(subset_y, np.sin(subset_x))
+    in_range = np.sin(np.arange(start, end + 1.0))
+    assert in_range.min() in subset_y
+    assert in_range.max() in subset_y
+
+
+@pytest.mark.parametrize("circular", [False, True])
+def test_level_of_detail_is_updated(circular):
+    """The pyramid should be up to date after entries were inserted and removed"""
+    np.random.seed(0)
+    buffer = accgraph.SortedCurveDataBuffer(size=2000, circular=circular, level_of_detail=True)
+    for iteration in range(50):
+        x = np.random.rand(100) * 20 + iteration * 10
+        buffer.add_list_of_entries(x=x, y=np.random.randn(100))
+        buffer.add_entry(x=x[0], y=10.0)
+        subset = buffer.subset_for_primary_val_range(start=iteration * 10 - 150, end=iteration * 10, max_points=50)
+        # Force recalculating the whole pyramid
+        buffer._lod_computed_until = [0] * len(buffer._lod_computed_until)
+        expected = buffer.subset_for_primary_val_range(start=iteration * 10 - 150, end=iteration * 10, max_points=50)
+        assert np.allclose(subset, expected, equal_nan=True)
+
+
+# ~~~ Tests for uniformly sampled Curves ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_uniform_buffer_fills_skipped_steps_with_gaps():
+    """Points skipping steps of the grid should leave NaN gaps"""
+    buffer = accgraph.UniformCurveDataBuffer(size=10)
+    buffer.add_entry(x=1.0, y=1.0)
+    buffer.add_entry(x=1.5, y=2.0)
+    buffer.add_list_of_entries(x=np.array([2.0, 3.0]), y=np.array([3.0, 4.0]))
+    buffer.add_uniform_entries(x0=4.0, dx=0.5, y=np.array([5.0, 6.0]))
+    assert buffer.dx == 0.5
+    x, y = buffer.as_np_array()
+    assert np.array_equal(x, [1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5])
+    assert np.allclose(y, [1.0, 2.0, 3.0, np.nan, 4.0, np.nan, 5.0, 6.0], equal_nan=True)
+    assert buffer.last_valid_primary_value == 4.5
+    with pytest.raises(ValueError):
+        buffer.add_entry(x=4.5, y=0.0)
+    with pytest.raises(ValueError):
+        buffer.add_entry(x=5.2, y=0.0)
+    with pytest.raises(ValueError):
+        buffer.add_uniform_entries(x0=5.0, dx=0.25, y=np.array([0.0]))
+
+
+def test_uniform_buffer_overwrites_oldest_entries():
+    """A full buffer should keep the newest points"""
+    buffer = accgraph.UniformCurveDataBuffer(size=5, dx=1.0)
+    buffer.add_uniform_entries(x0=0.0, dx=1.0, y=np.arange(4.0))
+    buffer.add_uniform_entries(x0=4.0, dx=1.0, y=np.arange(4.0, 7.0))
+    assert np.array_equal(buffer.as_np_array(), (np.arange(2.0, 7.0), np.arange(2.0, 7.0)))
+    buffer.add_uniform_entries(x0=20.0, dx=1.0, y=np.arange(20.0, 28.0))
+    assert np.array_equal(buffer.as_np_array(), (np.arange(23.0, 28.0), np.arange(23.0, 28.0)))
+    buffer.add_entry(x=30.0, y=30.0)
+    assert np.allclose(buffer.as_np_array(), ([26.0, 27.0, 28.0, 29.0, 30.0], [26.0, 27.0, np.nan, np.nan, 30.0]),
+                       equal_nan=True)
+
+
+def test_uniform_buffer_subsets():
+    """Subsets should equal the ones of a sorted buffer with the same points"""
+    uniform_buffer = accgraph.UniformCurveDataBuffer(size=1000)
+    sorted_buffer = accgraph.SortedCurveDataBuffer(size=1000)
+    y = np.sin(np.arange(800.0))
+    y[100] = np.nan
+    uniform_buffer.add_uniform_entries(x0=10.0, dx=0.1, y=y)
+    sorted_buffer.add_list_of_entries(x=10.0 + 0.1 * np.arange(800.0), y=y, keep_order=True)
+    for start, end in [(0.0, 5.0), (12.05, 40.0), (15.0, 50.0), (80.0, 100.0)]:
+        for interpolated in [False, True]:
+            actual = uniform_buffer.subset_for_primary_val_range(start=start, end=end, interpolated=interpolated)
+            expected = sorted_buffer.subset_for_primary_val_range(start=start, end=end, interpolated=interpolated)
+            assert np.allclose(actual, expected, equal_nan=True)
+    x0, dx, subset_y = uniform_buffer.uniform_subset_for_primary_val_range(start=12.05, end=40.0)
+    assert np.isclose(x0, 12.1) and dx == 0.1
+    assert np.allclose(subset_y, y[21:301], equal_nan=True)
+    subset_x, subset_y = uniform_buffer.subset_for_primary_val_range(start=10.0, end=90.0, max_points=100)
+    assert subset_x.size <= 100
+    assert np.nanmax(subset_y) == np.nanmax(y)
+    assert np.isnan(subset_x).sum() == 1
+
+
 # ~~~ Util functions ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
@@ -1,9 +1,16 @@
+import asyncio
+import os
+import sys
+import threading
+import time
 from freezegun import freeze_time
 from datetime import datetime
 
 import pytest
 import numpy as np
 
+from qtpy.QtCore import QObject, Signal
+
 import accwidgets.graph as accgraph
 
 
@@ -132,6 +139,18 @@ def test_curve_data_from_value(input_values,
     assert np.array_equal(actual.y, expected_y)
 
 
+@pytest.mark.parametrize("args, expected_x", [
+    (([1.0, 2.0], ), [0.0, 1.0]),
+    (([1.0, 2.0], 5.0), [5.0, 6.0]),
+    (([1.0, 2.0], 5.0, 0.5), [5.0, 5.5]),
+])
+def test_uniform_curve_data_from_value(args, expected_x):
+    actual = accgraph.PlottingItemDataFactory._to_uniform_curve(*args)
+    assert isinstance(actual, accgraph.UniformCurveData)
+    assert np.array_equal(actual.x, expected_x)
+    assert np.array_equal(actual.y, [1.0, 2.0])
+
+
 @pytest.mark.parametrize(
     "input_values,"
     "expected_x,"
@@ -195,6 +214,19 @@ def test_injection_bar_collection_data_from_value(input_values,
     assert np.array_equal(actual.labels, expected_label)
 
 
+def test_injection_bar_collection_data_from_array():
+    values = np.array([[1.0, 2.0], [3.0, 4.0]])
+    labels = np.array(["a", "b"])
+    actual = accgraph.PlottingItemDataFactory._to_injection_bar_collection(values[0], labels, values[1])
+    assert np.array_equal(actual.heights, [1.0, 2.0])
+    assert np.array_equal(actual.y, [3.0, 4.0])
+    assert np.array_equal(actual.labels, ["a", "b"])
+    actual = accgraph.PlottingItemDataFactory._to_injection_bar_collection(values)
+    assert np.array_equal(actual.heights, [1.0, 2.0])
+    assert np.array_equal(actual.y, [3.0, 4.0])
+    assert np.array_equal(actual.labels, ["", ""])
+
+
 @pytest.mark.parametrize(
     "input_values,"
     "expected_x,"
@@ -227,7 +259,357 @@ def test_timestampmarker_collection_data_from_value(input_values,
     accgraph.BarCollectionData,
     accgraph.InjectionBarCollectionData,
     accgraph.TimestampMarkerCollectionData,
+    accgraph.PointValue,
+    accgraph.BarValue,
+    accgraph.InjectionBarValue,
+    accgraph.TimestampMarkerValue,
+    accgraph.PointBatchData,
+    accgraph.BarBatchData,
+    accgraph.InjectionBarBatchData,
+    accgraph.TimestampMarkerBatchData,
+    accgraph.UniformCurveData,
 ])
 def test_default_transform_function_lookup(expected):
     actual = accgraph.PlottingItemDataFactory.get_transformation(data_type=expected)([0.0])
     assert isinstance(actual, expected)
+
+
+@pytest.mark.parametrize("data_type, data_model_type, args, expected_buffer", [
+    (accgraph.PointValue, accgraph.LiveCurveDataModel, (1.0, 2.0), ([2.0], [1.0])),
+    (accgraph.BarValue, accgraph.LiveBarGraphDataModel, (1.0, 2.0, 3.0), ([3.0], [2.0], [1.0])),
+    (accgraph.TimestampMarkerValue, accgraph.LiveTimestampMarkerDataModel, (1.0, "label", "r"), ([1.0], ["r"], ["label"])),
+])
+def test_value_types_reach_data_model(data_type, data_model_type, args, expected_buffer):
+    class Sender(QObject):
+        sig = Signal(tuple)
+
+    sender = Sender()
+    source = accgraph.SignalBoundDataSource(sig=sender.sig, data_type=data_type)
+    data_model = data_model_type(data_source=source)
+    sender.sig.emit(args)
+    for actual, expected in zip(data_model.full_data_buffer, expected_buffer):
+        assert np.array_equal(actual, expected)
+
+
+def test_coalescing_by_count():
+    class Sender(QObject):
+        sig = Signal(float, float)
+
+    sender = Sender()
+    source = accgraph.SignalBoundDataSource(sig=sender.sig, data_type=accgraph.PointValue, coalesce_count=3)
+    emitted = []
+    source.sig_new_data[accgraph.PointBatchData].connect(emitted.append)
+    data_model = accgraph.LiveCurveDataModel(data_source=source)
+    for x in range(7):
+        sender.sig.emit(float(x), float(x))
+    assert len(emitted) == 2
+    assert np.array_equal(emitted[0].x, [0.0, 1.0, 2.0])
+    assert data_model.version == 2
+    source.flush()
+    assert len(emitted) == 3
+    assert np.array_equal(data_model.full_data_buffer[0], np.arange(7.0))
+
+
+def test_coalescing_by_interval(qtbot):
+    class Sender(QObject):
+        sig = Signal(float, float, float)
+
+    sender = Sender()
+    source = accgraph.SignalBoundDataSource(sig=sender.sig, data_type=accgraph.BarData, coalesce_interval=0.05)
+    emitted = []
+    source.sig_new_data[accgraph.BarBatchData].connect(emitted.append)
+    for x in range(5):
+        sender.sig.emit(1.0, 0.0, float(x))
+    assert not emitted
+    qtbot.waitUntil(lambda: len(emitted) == 1, timeout=1000)
+    assert np.array_equal(emitted[0].x, np.arange(5.0))
+    assert np.array_equal(emitted[0].heights, np.ones(5))
+
+
+@pytest.mark.parametrize("kwargs", [{"coalesce_interval": 0.0}, {"coalesce_count": 0}])
+def test_coalescing_invalid_parameters(kwargs):
+    class Sender(QObject):
+        sig = Signal(float)
+
+    with pytest.raises(ValueError):
+        accgraph.SignalBoundDataSource(sig=Sender().sig, data_type=accgraph.PointData, **kwargs)
+
+
+class ChunkSource(accgraph.ThreadedUpdateSource):
+
+    def __init__(self, chunks, **kwargs):
+        super().__init__(frame_interval=60.0, **kwargs)
+        self.chunks = list(chunks)
+        self.acquired_all = threading.Event()
+
+    def acquire(self):
+        if self.chunks:
+            return self.chunks.pop(0)
+        self.acquired_all.set()
+        time.sleep(0.001)
+        return None
+
+
+def _chunk(start, stop):
+    x = np.arange(float(start), float(stop))
+    return x, x * 2
+
+
+@pytest.mark.parametrize("policy, expected_x, expected_dropped", [
+    (accgraph.QueueOverflowPolicy.DROP_OLDEST, np.arange(6.0, 16.0), 6),
+    (accgraph.QueueOverflowPolicy.DECIMATE, np.array([1.0, 3.0, 5.0, 7.0, 9.0, 11.0, 12.0, 13.0, 14.0, 15.0]), 6),
+])
+def test_threaded_source_overflow(policy, expected_x, expected_dropped):
+    source = ChunkSource(
+        chunks=[_chunk(0, 4), _chunk(4, 8), _chunk(8, 12), _chunk(12, 16)],
+        max_queued_samples=10,
+        overflow_policy=policy,
+    )
+    emitted = []
+    source.sig_new_data[accgraph.PointBatchData].connect(emitted.append)
+    source.start()
+    assert source.acquired_all.wait(timeout=5.0)
+    source.stop()
+    assert source.queued_samples == expected_x.size
+    assert source.dropped_samples == expected_dropped
+    source.drain()
+    assert source.queued_samples == 0
+    assert len(emitted) == 1
+    assert np.array_equal(emitted[0].x, expected_x)
+    assert np.array_equal(emitted[0].y, expected_x * 2)
+
+
+def test_threaded_source_blocks_until_drained(qtbot):
+    source = ChunkSource(
+        chunks=[_chunk(0, 4), _chunk(4, 8), _chunk(8, 12)],
+        max_queued_samples=8,
+        overflow_policy=accgraph.QueueOverflowPolicy.BLOCK,
+    )
+    data_model = accgraph.LiveCurveDataModel(data_source=source)
+    source.start()
+    qtbot.waitUntil(lambda: source.queued_samples == 8, timeout=5000)
+    assert not source.acquired_all.is_set()
+    source.drain()
+    assert source.acquired_all.wait(timeout=5.0)
+    source.drain()
+    source.stop()
+    assert source.dropped_samples == 0
+    assert np.array_equal(data_model.full_data_buffer[0], np.arange(12.0))
+
+
+def test_threaded_source_only_emits_collections():
+    with pytest.raises(TypeError):
+        accgraph.ThreadedUpdateSource(data_type=accgraph.PointData)
+
+
+def test_threaded_source_requires_acquire():
+    class NoAcquireSource(accgraph.ThreadedUpdateSource):
+        pass
+
+    with pytest.raises(TypeError):
+        NoAcquireSource()
+
+
+def test_async_source_consumes_async_generator(qtbot):
+    async def produce():
+        yield _chunk(0, 4)
+        yield accgraph.PointData(x=4.0, y=8.0)
+        yield accgraph.PointValue(x=5.0, y=10.0)
+        yield accgraph.CurveData(x=[6.0, 7.0], y=[12.0, 14.0])
+
+    source = accgraph.AsyncUpdateSource(produce(), frame_interval=60.0)
+    data_model = accgraph.LiveCurveDataModel(data_source=source)
+    source.start()
+    qtbot.waitUntil(lambda: not source.running, timeout=5000)
+    source.drain()
+    source.stop()
+    assert np.array_equal(data_model.full_data_buffer[0], np.arange(8.0))
+    assert np.array_equal(data_model.full_data_buffer[1], np.arange(8.0) * 2)
+
+
+def test_async_source_throttles_producer(qtbot):
+    produced = []
+
+    async def produce():
+        for start in range(0, 12, 4):
+            produced.append(start)
+            yield _chunk(start, start + 4)
+
+    source = accgraph.AsyncUpdateSource(produce(), max_queued_samples=8, frame_interval=60.0)
+    emitted = []
+    source.sig_new_data[accgraph.PointBatchData].connect(emitted.append)
+    source.start()
+    qtbot.waitUntil(lambda: source.queued_samples == 8, timeout=5000)
+    # The third chunk is waiting for space in the queue
+    assert source.running
+    assert source.queued_samples == 8
+    source.drain()
+    qtbot.waitUntil(lambda: not source.running, timeout=5000)
+    source.drain()
+    source.stop()
+    assert produced == [0, 4, 8]
+    assert source.dropped_samples == 0
+    assert [data.x.size for data in emitted] == [8, 4]
+    # The executor waiting for space in the queue is shut down with the loop
+    assert not any(thread.name.startswith("AsyncUpdateSourceExecutor") for thread in threading.enumerate())
+
+
+def test_async_source_stops_waiting_iterator():
+    async def produce():
+        yield _chunk(0, 2)
+        await asyncio.sleep(3600)
+        yield _chunk(2, 4)
+
+    source = accgraph.AsyncUpdateSource(produce(), frame_interval=60.0)
+    source.start()
+    source.stop(timeout=5.0)
+    assert not source.running
+
+
+def test_async_source_rejects_unfitting_items(qtbot):
+    async def produce():
+        yield accgraph.BarData(height=1.0, x=0.0)
+
+    source = accgraph.AsyncUpdateSource(produce(), data_type=accgraph.TimestampMarkerBatchData)
+    with pytest.raises(TypeError):
+        source._to_chunk(accgraph.BarData(height=1.0, x=0.0))
+
+
+@pytest.fixture
+def ring_writer():
+    pytest.importorskip("multiprocessing.shared_memory")
+    writer = accgraph.SharedMemoryRingWriter(capacity=8)
+    yield writer
+    writer.close()
+
+
+def test_shared_memory_ring_delivers_samples(qtbot, ring_writer):
+    source = accgraph.SharedMemoryRingSource(name=ring_writer.name, frame_interval=60.0)
+    data_model = accgraph.LiveCurveDataModel(data_source=source)
+    emitted = []
+    source.sig_new_data[accgraph.PointBatchData].connect(emitted.append)
+    ring_writer.write(*_chunk(0, 6))
+    source.poll()
+    assert len(emitted) == 1
+    # Samples wrapping around the end of the ring are delivered at once
+    ring_writer.write(*_chunk(6, 12))
+    source.poll()
+    assert len(emitted) == 2
+    assert np.array_equal(emitted[1].x, np.arange(6.0, 12.0))
+    source.poll()
+    assert len(emitted) == 2
+    source.close()
+    assert ring_writer.sequence == 12
+    assert source.dropped_samples == 0
+    assert np.array_equal(data_model.full_data_buffer[0], np.arange(12.0))
+    assert np.array_equal(data_model.full_data_buffer[1], np.arange(12.0) * 2)
+
+
+def test_shared_memory_ring_counts_overwritten_samples(qtbot, ring_writer):
+    ring_writer.write(*_chunk(0, 4))
+    source = accgraph.SharedMemoryRingSource(name=ring_writer.name, frame_interval=60.0)
+    data_model = accgraph.LiveCurveDataModel(data_source=source)
+    source.poll()
+    ring_writer.write(*_chunk(4, 24))
+    source.poll()
+    source.close()
+    assert source.dropped_samples == 12
+    assert np.array_equal(data_model.full_data_buffer[0], np.concatenate((np.arange(4.0), np.arange(16.0, 24.0))))
+
+
+def test_shared_memory_ring_drops_samples_overwritten_while_copying(qtbot, ring_writer):
+    source = accgraph.SharedMemoryRingSource(name=ring_writer.name, frame_interval=60.0)
+    data_model = accgraph.LiveCurveDataModel(data_source=source)
+    ring_writer.write(*_chunk(0, 8))
+    # The writer has claimed the slots of the three oldest samples, but not finished writing them
+    ring_writer._header[1] += 3
+    source.poll()
+    source.close()
+    assert source.dropped_samples == 3
+    assert np.array_equal(data_model.full_data_buffer[0], np.arange(3.0, 8.0))
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 13) or os.name != "posix",
+                    reason="Only older Python versions track attached shared memory")
+def test_shared_memory_ring_source_does_not_track_memory(monkeypatch):
+    pytest.importorskip("multiprocessing.shared_memory")
+    from multiprocessing import resource_tracker
+    calls = []
+    monkeypatch.setattr(resource_tracker, "register", lambda name, rtype: calls.append(("register", name)))
+    monkeypatch.setattr(resource_tracker, "unregister", lambda name, rtype: calls.append(("unregister", name)))
+    writer = accgraph.SharedMemoryRingWriter(capacity=8)
+    tracked_name = "/" + writer.name
+    accgraph.SharedMemoryRingSource(name=writer.name, frame_interval=60.0).close()
+    writer.close()
+    # Attaching registers the memory, which the source undoes right away. The writer
+    # registers it again before unlinking, since a source in this process removed it.
+    assert calls == [
+        ("register", tracked_name),
+        ("register", tracked_name),
+        ("unregister", tracked_name),
+        ("register", tracked_name),
+        ("unregister", tracked_name),
+    ]
+
+
+@pytest.fixture
+def recording(tmpdir):
+    path = str(tmpdir.join("recording.npy"))
+    np.save(path, np.vstack(_chunk(0, 10)))
+    return path
+
+
+def test_replay_source_replays_by_timestamp(qtbot, recording):
+    source = accgraph.ReplaySource(recording)
+    data_model = accgraph.LiveCurveDataModel(data_source=source)
+    timestamps = []
+    source.sig_new_timestamp.connect(timestamps.append)
+    source.step(until=3.5)
+    assert source.position == 4
+    source.step(until=3.9)
+    assert source.position == 4
+    source.step(until=20.0)
+    assert source.finished
+    assert timestamps == [3.5, 3.9, 20.0]
+    assert np.array_equal(data_model.full_data_buffer[0], np.arange(10.0))
+    assert np.array_equal(data_model.full_data_buffer[1], np.arange(10.0) * 2)
+
+
+def test_replay_source_as_fast_as_possible(qtbot, recording):
+    source = accgraph.ReplaySource(recording, speed=None, samples_per_frame=4)
+    emitted = []
+    timestamps = []
+    source.sig_new_data[accgraph.PointBatchData].connect(emitted.append)
+    source.sig_new_timestamp.connect(timestamps.append)
+    source.start()
+    qtbot.waitUntil(lambda: source.finished, timeout=5000)
+    assert not source.running
+    assert [data.x.size for data in emitted] == [4, 4, 2]
+    assert timestamps == [3.0, 7.0, 9.0]
+
+
+def test_replay_source_accelerated(qtbot, recording):
+    source = accgraph.ReplaySource(recording, speed=100.0, frame_interval=0.01)
+    data_model = accgraph.LiveCurveDataModel(data_source=source)
+    source.start()
+    qtbot.waitUntil(lambda: source.finished, timeout=5000)
+    assert np.array_equal(data_model.full_data_buffer[0], np.arange(10.0))
+
+
+def test_replay_source_reads_npz_archives(qtbot, tmpdir):
+    path = str(tmpdir.join("recording.npz"))
+    np.savez(path, x=np.arange(3.0), y=np.zeros(3), heights=np.ones(3))
+    source = accgraph.ReplaySource(path, data_type=accgraph.BarBatchData, speed=None)
+    data_model = accgraph.LiveBarGraphDataModel(data_source=source)
+    source.step()
+    assert source.finished
+    assert np.array_equal(data_model.full_data_buffer[2], np.ones(3))
+    with pytest.raises(ValueError):
+        accgraph.ReplaySource(path, data_type=accgraph.InjectionBarBatchData)
+
+
+def test_replay_source_rejects_unsorted_timestamps(tmpdir):
+    path = str(tmpdir.join("recording.npy"))
+    np.save(path, np.array([[1.0, 0.0], [1.0, 1.0]]))
+    with pytest.raises(ValueError):
+        accgraph.ReplaySource(path)
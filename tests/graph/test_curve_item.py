@@ -16,6 +16,10 @@ from accwidgets.graph import (
     PointData,
     CyclicPlotTimeSpan,
     InvalidDataStructureWarning,
+    StaticPlotCurve,
+    StaticCurveDataModel,
+    UniformCurveData,
+    CurveData,
 )
 
 from .mock_utils.mock_data_source import MockDataSource
@@ -677,6 +681,57 @@ def test_plotdataitem_components_visible(qtbot, params):
         assert not item.scatter.isVisible()
 
 
+@pytest.mark.parametrize("in_place", [False, True])
+def test_static_curve_only_replaces_y_values(qtbot, in_place):
+    """Check that a static curve keeps its x values, if only the y values change"""
+    window = _prepare_minimal_test_window(qtbot, plotting_style=PlotWidgetStyle.STATIC_PLOT)
+    source = UpdateSource()
+    model = StaticCurveDataModel(data_source=source, in_place=in_place)
+    item = StaticPlotCurve(plot_item=window.plot.plotItem, data_model=model)
+    window.plot.addItem(item)
+    source.sig_new_data[UniformCurveData].emit(UniformCurveData(y=[1.0, 2.0, 3.0], x0=1.0, dx=0.5))
+    x_values = item.curve.xData
+    assert np.array_equal(x_values, [1.0, 1.5, 2.0])
+    assert item.dataBounds(ax=1) == (1.0, 3.0)
+    assert item.dataBounds(ax=0) == (1.0, 2.0)
+    source.sig_new_data[UniformCurveData].emit(UniformCurveData(y=[4.0, 6.0, 5.0], x0=1.0, dx=0.5))
+    assert np.shares_memory(item.curve.xData, x_values)
+    assert np.array_equal(item.curve.yData, [4.0, 6.0, 5.0])
+    assert np.array_equal(item.getData()[1], [4.0, 6.0, 5.0])
+    assert item.dataBounds(ax=1) == (4.0, 6.0)
+    source.sig_new_data[UniformCurveData].emit(UniformCurveData(y=[1.0, 2.0], x0=0.0, dx=0.5))
+    assert np.array_equal(item.curve.xData, [0.0, 0.5])
+    assert np.array_equal(item.curve.yData, [1.0, 2.0])
+
+
+def test_static_curve_decimates_to_view_range(qtbot):
+    """Check that a static curve with a lot of points only displays the visible range reduced to its resolution"""
+    window = _prepare_minimal_test_window(qtbot, plotting_style=PlotWidgetStyle.STATIC_PLOT)
+    source = UpdateSource()
+    model = StaticCurveDataModel(data_source=source)
+    item = StaticPlotCurve(plot_item=window.plot.plotItem, data_model=model, viewport_decimation=True)
+    window.plot.addItem(item)
+    view_box = item.getViewBox()
+    view_box.setXRange(1000.0, 2000.0, padding=0.0)
+    y = np.zeros(100_000)
+    y[1500] = 5.0
+    y[1600] = np.nan
+    source.sig_new_data[CurveData].emit(CurveData(x=np.arange(100_000.0), y=y))
+    pixels = int(view_box.width())
+    assert item.xData.size <= 4 * pixels + 2
+    assert item.xData[0] <= 500.0 and item.xData[-1] >= 2500.0
+    assert np.nanmax(item.yData) == 5.0
+    assert np.isnan(item.yData).any()
+    assert item.dataBounds(ax=0) == (0.0, 99_999.0)
+    assert item.dataBounds(ax=1) == (0.0, 5.0)
+    view_box.setXRange(80_000.0, 80_010.0, padding=0.0)
+    qtbot.waitUntil(lambda: item.xData[0] <= 80_000.0 <= 80_010.0 <= item.xData[-1])
+    assert np.array_equal(item.xData, np.arange(79_994.0, 80_017.0))
+    item.setData(np.arange(10.0), np.zeros(10))
+    source.sig_new_data[CurveData].emit(CurveData(x=np.arange(10.0)[::-1], y=np.zeros(10)))
+    assert item.xData.size == 10
+
+
 # ~~~~~~~~~~~~~~ Test numpy RuntimeWarning when passing NaN to ScatterPlotItem ~~~~~~~~~~~~~~~
 
 
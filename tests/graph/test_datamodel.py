@@ -312,3 +312,161 @@ def test_get_highest_primary_value(model_type: Type[accgraph.AbstractLiveDataMod
     assert data_model.max_primary_val == 4.0
     data_source.emit_new_object(dm_util.create_fitting_object(data_model, np.nan))
     assert data_model.max_primary_val == 4.0
+
+
+def test_data_model_version_increases_with_changes():
+    """Check that each change of the data model increases its version"""
+    model = accgraph.LiveCurveDataModel(data_source=accgraph.UpdateSource())
+    assert model.version == 0
+    model.data_source.sig_new_data.emit(accgraph.PointData(0.0, 1.0))
+    assert model.version == 1
+    model.data_source.sig_new_data.emit(accgraph.CurveData([1.0, 2.0], [1.0, 2.0]))
+    assert model.version == 2
+    model.replace_data_source(accgraph.UpdateSource())
+    assert model.version == 3
+
+
+def test_subsets_are_cached_until_data_changes():
+    """Check that subsets are reused until the data model changes"""
+    model = accgraph.LiveCurveDataModel(data_source=accgraph.UpdateSource())
+    model.data_source.sig_new_data.emit(accgraph.CurveData([0.0, 1.0, 2.0], [0.0, 1.0, 2.0]))
+    subset = model.subset_for_xrange(0.5, 2.0, interpolated=True)
+    assert model.subset_for_xrange(0.5, 2.0, interpolated=True) is subset
+    assert model.subset_for_xrange(0.5, 2.0) is not subset
+    for i in range(10):
+        model.subset_for_xrange(float(i), 2.0)
+    assert model.subset_for_xrange(0.5, 2.0, interpolated=True) is not subset
+    subset = model.subset_for_xrange(0.5, 3.0)
+    model.data_source.sig_new_data.emit(accgraph.PointData(3.0, 3.0))
+    new_subset = model.subset_for_xrange(0.5, 3.0)
+    assert new_subset is not subset
+    assert np.array_equal(new_subset[0], [1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize("batch, single_entries", [
+    (accgraph.PointBatchData(x=[0.0, np.nan, 2.0, 1.0, np.nan], y=[0.0, np.nan, 2.0, 1.0, 4.0]),
+     [accgraph.PointData(0.0, 0.0), accgraph.PointData(np.nan, np.nan),
+      accgraph.PointData(2.0, 2.0), accgraph.PointData(1.0, 1.0)]),
+    (accgraph.BarBatchData(x=[0.0, 2.0, np.nan], y=[0.0, 0.0, 0.0], heights=[1.0, 2.0, 3.0]),
+     [accgraph.BarData(x=0.0, y=0.0, height=1.0), accgraph.BarData(x=2.0, y=0.0, height=2.0)]),
+    (accgraph.InjectionBarBatchData(x=[0.0, 1.0], y=[1.0, 2.0], heights=[1.0, 1.0], widths=[1.0, 1.0], labels=["a", "b"]),
+     [accgraph.InjectionBarData(x=0.0, y=1.0, height=1.0, width=1.0, label="a"),
+      accgraph.InjectionBarData(x=1.0, y=2.0, height=1.0, width=1.0, label="b")]),
+    (accgraph.TimestampMarkerBatchData(x=[1.0, 0.0], colors=["r", "g"], labels=["a", "b"]),
+     [accgraph.TimestampMarkerData(x=1.0, color="r", label="a"),
+      accgraph.TimestampMarkerData(x=0.0, color="g", label="b")]),
+])
+def test_batch_equals_single_entries(batch, single_entries):
+    """Check that a batch has the same result as emitting its valid entries one by one"""
+    data_model_type = {
+        accgraph.PointBatchData: accgraph.LiveCurveDataModel,
+        accgraph.BarBatchData: accgraph.LiveBarGraphDataModel,
+        accgraph.InjectionBarBatchData: accgraph.LiveInjectionBarDataModel,
+        accgraph.TimestampMarkerBatchData: accgraph.LiveTimestampMarkerDataModel,
+    }[type(batch)]
+    batch_model = data_model_type(data_source=accgraph.UpdateSource())
+    single_model = data_model_type(data_source=accgraph.UpdateSource())
+    batch_model.data_source.sig_new_data[type(batch)].emit(batch)
+    for entry in single_entries:
+        single_model.data_source.sig_new_data[type(entry)].emit(entry)
+    assert batch_model.version == 1
+    for batch_values, single_values in zip(batch_model.full_data_buffer, single_model.full_data_buffer):
+        if batch_values.dtype.kind == "f":
+            assert np.allclose(batch_values, single_values, equal_nan=True)
+        else:
+            assert np.array_equal(batch_values, single_values)
+
+
+@pytest.mark.parametrize("batch, data_model_type", [
+    (accgraph.PointBatchData(x=[1.0, 0.0], y=[1.0, 2.0]), accgraph.StaticCurveDataModel),
+    (accgraph.BarBatchData(x=[1.0, 0.0], y=[0.0, 0.0], heights=[1.0, 2.0]), accgraph.StaticBarGraphDataModel),
+    (accgraph.InjectionBarBatchData(x=[1.0, 0.0], y=[1.0, 2.0], heights=[1.0, 1.0], widths=[1.0, 1.0], labels=["a", "b"]),
+     accgraph.StaticInjectionBarDataModel),
+    (accgraph.TimestampMarkerBatchData(x=[1.0, 0.0], colors=["r", "g"], labels=["a", "b"]),
+     accgraph.StaticTimestampMarkerDataModel),
+])
+def test_batch_is_no_collection(batch, data_model_type):
+    """Check that batches are not taken for collections, which static data models would display sorted"""
+    assert not isinstance(batch, (accgraph.CurveData, accgraph.BarCollectionData,
+                                  accgraph.InjectionBarCollectionData, accgraph.TimestampMarkerCollectionData))
+    model = data_model_type(data_source=accgraph.UpdateSource())
+    with pytest.warns(UserWarning):
+        model.data_source.sig_new_data[type(batch)].emit(batch)
+    assert model.version == 0
+
+
+def test_uniform_curve_data_model():
+    """Check that uniformly sampled data is added to the grid of the data model"""
+    model = accgraph.LiveUniformCurveDataModel(data_source=accgraph.UpdateSource(), buffer_size=100)
+    model.data_source.sig_new_data[accgraph.UniformCurveData].emit(accgraph.UniformCurveData(y=[0.0, 1.0], x0=5.0, dx=0.5))
+    model.data_source.sig_new_data.emit(accgraph.PointData(7.0, 4.0))
+    model.data_source.sig_new_data[accgraph.PlottingItemValue].emit(accgraph.PointValue(7.5, 5.0))
+    batch = accgraph.PointBatchData(x=[8.0, np.nan, 9.0], y=[6.0, np.nan, 7.0])
+    model.data_source.sig_new_data[accgraph.PointBatchData].emit(batch)
+    assert model.dx == 0.5
+    assert model.version == 4
+    assert np.allclose(model.full_data_buffer, ([5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0, 8.5, 9.0],
+                                                [0.0, 1.0, np.nan, np.nan, 4.0, 5.0, 6.0, np.nan, 7.0]),
+                       equal_nan=True)
+    assert np.allclose(model.subset_for_xrange(5.25, 5.5, interpolated=True), ([5.25, 5.5], [0.5, 1.0]))
+    with pytest.warns(UserWarning):
+        model.data_source.sig_new_data.emit(accgraph.PointData(9.7, 6.0))
+    assert model.version == 4
+    with pytest.warns(UserWarning):
+        model.data_source.sig_new_data.emit(accgraph.CurveData([9.5, np.nan], [8.0, 9.0]))
+    assert model.version == 4
+
+
+def test_live_curve_data_model_takes_uniform_curve_data():
+    """Check that uniformly sampled data can also be emitted to a sorted live data model"""
+    model = accgraph.LiveCurveDataModel(data_source=accgraph.UpdateSource())
+    model.data_source.sig_new_data[accgraph.UniformCurveData].emit(accgraph.UniformCurveData(y=[0.0, 1.0], x0=5.0, dx=0.5))
+    assert model.version == 1
+    assert np.allclose(model.full_data_buffer, ([5.0, 5.5], [0.0, 1.0]))
+
+
+@pytest.mark.parametrize("in_place", [False, True])
+def test_static_curve_data_model_tracks_x_changes(in_place):
+    """Check that the x version only changes with the x values or the count of points"""
+    model = accgraph.StaticCurveDataModel(data_source=accgraph.UpdateSource(), in_place=in_place)
+    model.data_source.sig_new_data.emit(accgraph.CurveData([0.0, 1.0], [1.0, 2.0]))
+    assert model.x_version == 1
+    model.data_source.sig_new_data.emit(accgraph.CurveData([0.0, 1.0], [3.0, 4.0]))
+    assert model.x_version == 1
+    assert np.array_equal(model.full_data_buffer, ([0.0, 1.0], [3.0, 4.0]))
+    model.data_source.sig_new_data[accgraph.UniformCurveData].emit(accgraph.UniformCurveData([1.0, 2.0], x0=1.0))
+    assert model.x_version == 2
+    uniform_data = accgraph.UniformCurveData([5.0, 6.0], x0=1.0)
+    model.data_source.sig_new_data[accgraph.UniformCurveData].emit(uniform_data)
+    assert model.x_version == 2
+    assert uniform_data._x is None
+    assert np.array_equal(model.full_data_buffer, ([1.0, 2.0], [5.0, 6.0]))
+    model.data_source.sig_new_data[accgraph.UniformCurveData].emit(accgraph.UniformCurveData([1.0, 2.0, 3.0], x0=1.0))
+    assert model.x_version == 3
+    # Sources changing their own arrays in place
+    x = np.array([0.0, 1.0, 2.0])
+    model.data_source.sig_new_data.emit(accgraph.CurveData(x, [1.0, 2.0, 3.0]))
+    assert model.x_version == 4
+    x += 1.0
+    model.data_source.sig_new_data.emit(accgraph.CurveData(x, [1.0, 2.0, 3.0]))
+    assert model.x_version == 5
+    assert np.array_equal(model.full_data_buffer[0], [1.0, 2.0, 3.0])
+
+
+def test_static_curve_data_model_in_place_updates():
+    """Check that in place updates swap between two arrays owned by the data model"""
+    model = accgraph.StaticCurveDataModel(data_source=accgraph.UpdateSource(), in_place=True)
+    assert model.back_buffer is None
+    y = np.array([1.0, 2.0])
+    model.data_source.sig_new_data.emit(accgraph.CurveData([0.0, 1.0], y))
+    first, second = model.full_data_buffer[1], model.back_buffer
+    assert first is not y
+    model.data_source.sig_new_data.emit(accgraph.CurveData([0.0, 1.0], [3.0, 4.0]))
+    assert model.full_data_buffer[1] is second
+    assert model.back_buffer is first
+    # Sources can write into the back buffer directly
+    model.back_buffer[:] = [5.0, 6.0]
+    model.data_source.sig_new_data.emit(accgraph.CurveData([0.0, 1.0], model.back_buffer))
+    assert model.full_data_buffer[1] is first
+    assert np.array_equal(model.full_data_buffer[1], [5.0, 6.0])
+    assert np.array_equal(y, [1.0, 2.0])
@@ -44,6 +44,7 @@ class TimestampMarkerNamedTuple(NamedTuple):
 
 # ~~~~~~~~~~ Curve Data-Structures ~~~~~~~~~~
 
+@pytest.mark.parametrize("data_type", [accgraph.PointData, accgraph.PointValue])
 @pytest.mark.parametrize("combinations", [
     PointNamedTuple(0.0, 1.0),
     PointNamedTuple(np.nan, np.nan),
@@ -52,22 +53,23 @@ class TimestampMarkerNamedTuple(NamedTuple):
     PointNamedTuple(0.0, None),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_valid_point_data(recwarn, combinations: PointNamedTuple):
-    _ = accgraph.PointData(
+def test_valid_point_data(data_type, recwarn, combinations: PointNamedTuple):
+    _ = data_type(
         x=cast(float, combinations.x),
         y=cast(float, combinations.y),
     )
     assert len(recwarn) == 0
 
 
+@pytest.mark.parametrize("data_type", [accgraph.PointData, accgraph.PointValue])
 @pytest.mark.parametrize("combinations", [
     PointNamedTuple(np.nan, 0.0),
     PointNamedTuple(None, 0.0),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_invalid_point_data(combinations):
+def test_invalid_point_data(data_type, combinations):
     with pytest.warns(accgraph.InvalidDataStructureWarning):
-        _ = accgraph.PointData(
+        _ = data_type(
             x=cast(float, combinations.x),
             y=cast(float, combinations.y),
         )
@@ -113,14 +115,15 @@ def test_curve_data_one_different_length(combinations: PointNamedTuple):
 # ~~~~~~~~~~ Bargraph Data-Structures ~~~~~~~~~~
 
 
+@pytest.mark.parametrize("data_type", [accgraph.BarData, accgraph.BarValue])
 @pytest.mark.parametrize("combinations", [
     BarNamedTuple(0.0, 1.0, 2.0),
     BarNamedTuple(0.0, np.nan, 2.0),
     BarNamedTuple(0.0, None, 2.0),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_valid_bar_data(recwarn, combinations: BarNamedTuple):
-    _ = accgraph.BarData(
+def test_valid_bar_data(data_type, recwarn, combinations: BarNamedTuple):
+    _ = data_type(
         x=cast(float, combinations.x),
         y=cast(float, combinations.y),
         height=cast(float, combinations.h),
@@ -128,6 +131,7 @@ def test_valid_bar_data(recwarn, combinations: BarNamedTuple):
     assert len(recwarn) == 0
 
 
+@pytest.mark.parametrize("data_type", [accgraph.BarData, accgraph.BarValue])
 @pytest.mark.parametrize("combinations", [
     BarNamedTuple(np.nan, 1.0, 2.0),
     BarNamedTuple(None, 1.0, 2.0),
@@ -143,9 +147,9 @@ def test_valid_bar_data(recwarn, combinations: BarNamedTuple):
     BarNamedTuple(None, None, None),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_invalid_bar_data(combinations: BarNamedTuple):
+def test_invalid_bar_data(data_type, combinations: BarNamedTuple):
     with pytest.warns(accgraph.InvalidDataStructureWarning):
-        _ = accgraph.BarData(
+        _ = data_type(
             x=cast(float, combinations.x),
             y=cast(float, combinations.y),
             height=cast(float, combinations.h),
@@ -220,6 +224,7 @@ def test_bar_collection_data_one_different_length(combinations):
 
 # ~~~~~~~~~~ Injection Bar Data-Structures ~~~~~~~~~~
 
+@pytest.mark.parametrize("data_type", [accgraph.InjectionBarData, accgraph.InjectionBarValue])
 @pytest.mark.parametrize("combinations", [
     InjectionBarNamedTuple(0.0, 1.0, 2.0, 3.0, ""),
     InjectionBarNamedTuple(0.0, 1.0, np.nan, 3.0, ""),
@@ -230,8 +235,8 @@ def test_bar_collection_data_one_different_length(combinations):
     InjectionBarNamedTuple(0.0, 1.0, None, None, ""),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_valid_injection_bar_data(recwarn, combinations: InjectionBarNamedTuple):
-    _ = accgraph.InjectionBarData(
+def test_valid_injection_bar_data(data_type, recwarn, combinations: InjectionBarNamedTuple):
+    _ = data_type(
         x=cast(float, combinations.x),
         y=cast(float, combinations.y),
         height=cast(float, combinations.h),
@@ -241,6 +246,7 @@ def test_valid_injection_bar_data(recwarn, combinations: InjectionBarNamedTuple)
     assert len(recwarn) == 0
 
 
+@pytest.mark.parametrize("data_type", [accgraph.InjectionBarData, accgraph.InjectionBarValue])
 @pytest.mark.parametrize("combinations", [
     InjectionBarNamedTuple(np.nan, 1.0, 2.0, 3.0, ""),
     InjectionBarNamedTuple(None, 1.0, 2.0, 3.0, ""),
@@ -268,9 +274,9 @@ def test_valid_injection_bar_data(recwarn, combinations: InjectionBarNamedTuple)
     InjectionBarNamedTuple(None, None, None, None, ""),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_invalid_injection_bar_data(combinations: InjectionBarNamedTuple):
+def test_invalid_injection_bar_data(data_type, combinations: InjectionBarNamedTuple):
     with pytest.warns(accgraph.InvalidDataStructureWarning):
-        _ = accgraph.InjectionBarData(
+        _ = data_type(
             x=cast(float, combinations.x),
             y=cast(float, combinations.y),
             height=cast(float, combinations.h),
@@ -376,16 +382,17 @@ def test_injection_bar_collection_data_one_different_length(combinations: Inject
 
 # ~~~~~~~~~~ Timestamp Marker Data-Structures ~~~~~~~~~~
 
+@pytest.mark.parametrize("data_type", [accgraph.TimestampMarkerData, accgraph.TimestampMarkerValue])
 @pytest.mark.parametrize("combinations, expected_warnings", [
     (TimestampMarkerNamedTuple(0.0, "r", ""), []),
     (TimestampMarkerNamedTuple(0.0, None, ""), [accgraph.WrongValueWarning]),
     (TimestampMarkerNamedTuple(0.0, None, ""), [accgraph.WrongValueWarning]),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_valid_timestamp_marker_data(recwarn,
+def test_valid_timestamp_marker_data(data_type, recwarn,
                                      combinations: TimestampMarkerNamedTuple,
                                      expected_warnings):
-    _ = accgraph.TimestampMarkerData(
+    _ = data_type(
         x=cast(float, combinations.x),
         color=cast(str, combinations.c),
         label=cast(str, combinations.l),
@@ -394,6 +401,7 @@ def test_valid_timestamp_marker_data(recwarn,
         assert recwarn.pop(warning)
 
 
+@pytest.mark.parametrize("data_type", [accgraph.TimestampMarkerData, accgraph.TimestampMarkerValue])
 @pytest.mark.parametrize("combinations, expected_warnings", [
     (TimestampMarkerNamedTuple(0.0, "", "label"), [accgraph.WrongValueWarning]),
     (TimestampMarkerNamedTuple(0.0, "#XYZ", "label"), [accgraph.WrongValueWarning]),
@@ -401,10 +409,10 @@ def test_valid_timestamp_marker_data(recwarn,
     (TimestampMarkerNamedTuple(0.0, "red, comrade, use red", "label"), [accgraph.WrongValueWarning]),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_invalid_timestamp_marker_color(recwarn,
+def test_invalid_timestamp_marker_color(data_type, recwarn,
                                         combinations: TimestampMarkerNamedTuple,
                                         expected_warnings):
-    data = accgraph.TimestampMarkerData(
+    data = data_type(
         x=cast(float, combinations.x),
         color=cast(str, combinations.c),
         label=cast(str, combinations.l),
@@ -435,14 +443,28 @@ def test_invalid_timestamp_marker_collection_color(recwarn,
     assert np.array_equal(data.colors, [accgraph.DEFAULT_COLOR, accgraph.DEFAULT_COLOR, accgraph.DEFAULT_COLOR, accgraph.DEFAULT_COLOR])
 
 
+@warn_always(accgraph.WrongValueWarning)
+def test_invalid_timestamp_marker_collection_color_warns_once_per_color(recwarn):
+    """Check that each distinct invalid color is only checked and reported once"""
+    data = accgraph.TimestampMarkerCollectionData(
+        x=np.arange(4.0),
+        colors=["#XYZ", "r", "#XYZ", "#XYZ"],
+        labels=[""] * 4,
+    )
+    assert len(recwarn.list) == 1
+    assert recwarn.pop(accgraph.WrongValueWarning)
+    assert np.array_equal(data.colors, [accgraph.DEFAULT_COLOR, "r", accgraph.DEFAULT_COLOR, accgraph.DEFAULT_COLOR])
+
+
+@pytest.mark.parametrize("data_type", [accgraph.TimestampMarkerData, accgraph.TimestampMarkerValue])
 @pytest.mark.parametrize("combinations", [
     TimestampMarkerNamedTuple(np.nan, "r", ""),
     TimestampMarkerNamedTuple(None, "r", ""),
 ])
 @warn_always(accgraph.InvalidDataStructureWarning)
-def test_invalid_timestamp_marker_data(combinations: TimestampMarkerNamedTuple):
+def test_invalid_timestamp_marker_data(data_type, combinations: TimestampMarkerNamedTuple):
     with pytest.warns(accgraph.InvalidDataStructureWarning):
-        _ = accgraph.TimestampMarkerData(
+        _ = data_type(
             x=cast(float, combinations.x),
             color=cast(str, combinations.c),
             label=cast(str, combinations.l),
@@ -508,3 +530,47 @@ def test_timestamp_marker_collection_data_one_different_length(combinations: Tim
             colors=cast(List[str], combinations.c),
             labels=cast(List[str], combinations.l),
         )
+
+
+# ~~~~~~~~~~ Validation of big collections ~~~~~~~~~~
+
+
+@pytest.mark.parametrize("create_collection, expected_problem", [
+    (lambda x: accgraph.CurveData(x=x, y=np.ones(x.size)), "Point 500: (x=nan, y=1.0)"),
+    (lambda x: accgraph.BarCollectionData(x=x, y=np.ones(x.size), heights=np.ones(x.size)),
+     "Bar 500: (x=nan, y=1.0, height=1.0)"),
+    (lambda x: accgraph.InjectionBarCollectionData(x=x,
+                                                   y=np.ones(x.size),
+                                                   heights=np.ones(x.size),
+                                                   widths=np.ones(x.size),
+                                                   labels=np.full(x.size, "")),
+     "InjectionBarData 500: (x=nan, y=1.0, height=1.0, width=1.0, labels=)"),
+    (lambda x: accgraph.TimestampMarkerCollectionData(x=x,
+                                                      colors=np.full(x.size, "r"),
+                                                      labels=np.full(x.size, "")),
+     "TimestampMarker 500: (x=nan, color=r, labels=)"),
+])
+@warn_always(accgraph.InvalidDataStructureWarning)
+def test_collection_warning_lists_only_invalid_entries(recwarn, create_collection, expected_problem):
+    x = np.arange(100000.0)
+    x[[500, 99999]] = np.nan
+    collection = create_collection(x)
+    assert len(recwarn) == 1
+    message = str(recwarn.pop(accgraph.InvalidDataStructureWarning).message)
+    assert expected_problem in message
+    assert " 99999: " in message
+    assert message.count("(x=") == 2
+    assert np.array_equal(np.flatnonzero(~collection.is_valid()), [500, 99999])
+
+
+def test_uniform_curve_data():
+    curve = accgraph.UniformCurveData(y=[1.0, np.nan, 3.0], x0=2.0, dx=0.5)
+    assert curve._x is None
+    assert np.all(curve.is_valid())
+    assert curve._x is None
+    assert np.array_equal(curve.x, [2.0, 2.5, 3.0])
+    with pytest.warns(accgraph.InvalidDataStructureWarning):
+        invalid = accgraph.UniformCurveData(y=[1.0, np.nan], x0=np.nan)
+    assert np.array_equal(invalid.is_valid(), [False, True])
+    with pytest.raises(ValueError):
+        accgraph.UniformCurveData(y=[1.0], dx=0.0)
@@ -0,0 +1,62 @@
+from accwidgets.graph import (
+    ExPlotWidgetConfig,
+    PlotWidgetStyle,
+    StaticInjectionBarGraphItem,
+    InjectionBarCollectionData,
+    UpdateSource,
+)
+
+from .mock_utils.widget_test_window import MinimalTestWindow
+
+
+def test_static_injection_bar_reuses_labels(qtbot):
+    """Check that labels are only created if more bars are displayed than ever before"""
+    window = MinimalTestWindow(plot_config=ExPlotWidgetConfig(plotting_style=PlotWidgetStyle.STATIC_PLOT))
+    window.show()
+    qtbot.addWidget(window)
+    source = UpdateSource()
+    item = window.plot.addInjectionBar(data_source=source)
+    assert isinstance(item, StaticInjectionBarGraphItem)
+
+    def emit(x, y, labels):
+        source.sig_new_data[InjectionBarCollectionData].emit(
+            InjectionBarCollectionData(x=x, y=y, heights=[2.0] * len(x), widths=[0.5] * len(x), labels=labels),
+        )
+
+    emit(x=[1.0, 2.0, 3.0], y=[0.0, 0.0, 0.0], labels=["1", "2", "3"])
+    labels = list(item._text_labels)
+    assert [label.textItem.toPlainText() for label in labels] == ["1", "2", "3"]
+    emit(x=[2.0, 3.0, 4.0], y=[0.0, 1.0, 0.0], labels=["2", "c", "4"])
+    assert item._text_labels == labels
+    assert [label.textItem.toPlainText() for label in labels] == ["4", "2", "c"]
+    assert [(label.pos().x(), label.pos().y()) for label in labels] == [(4.0, 1.0), (2.0, 1.0), (3.0, 2.0)]
+    emit(x=[4.0], y=[0.0], labels=["4"])
+    assert item._text_labels == labels
+    assert [label.isVisible() for label in labels] == [True, False, False]
+    emit(x=[0.0, 1.0, 2.0, 4.0], y=[0.0] * 4, labels=["a", "b", "c", "d"])
+    assert item._text_labels[:3] == labels
+    assert len(item._text_labels) == 4
+    assert all(label.isVisible() for label in item._text_labels)
+    assert [label.textItem.toPlainText() for label in item._text_labels] == ["d", "a", "b", "c"]
+
+
+def test_injection_bar_skips_overlapping_labels(qtbot):
+    """Check that labels overlapping labels of bars further right are not created"""
+    window = MinimalTestWindow(plot_config=ExPlotWidgetConfig(plotting_style=PlotWidgetStyle.STATIC_PLOT))
+    window.show()
+    qtbot.addWidget(window)
+    source = UpdateSource()
+    item = window.plot.addInjectionBar(data_source=source)
+    view_box = item.getViewBox()
+    view_box.setRange(xRange=(0.0, 100.0), yRange=(0.0, 10.0), padding=0.0)
+    source.sig_new_data[InjectionBarCollectionData].emit(InjectionBarCollectionData(
+        x=[10.0, 10.1, 10.2, 50.0],
+        y=[0.0, 0.0, 5.0, 0.0],
+        heights=[2.0] * 4,
+        widths=[0.5] * 4,
+        labels=["a", "b", "c", "d"],
+    ))
+    assert sorted(label.textItem.toPlainText() for label in item._text_labels) == ["b", "c", "d"]
+    view_box.setRange(xRange=(10.0, 10.3), yRange=(0.0, 10.0), padding=0.0)
+    assert sorted(label.textItem.toPlainText() for label in item._text_labels) == ["a", "b", "c", "d"]
+    assert all(label.isVisible() for label in item._text_labels)
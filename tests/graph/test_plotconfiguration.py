@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from accwidgets.graph import TimeSpan
+from accwidgets.graph import TimeSpan, ExPlotWidgetConfig
 
 
 def test_time_span_default_params():
@@ -86,3 +86,20 @@ def test_time_span_both_right_negative():
     assert t.right_boundary_offset == -2.0
     assert t.finite
     assert t.size == 34.0
+
+
+@pytest.mark.parametrize("max_fps,expected", [
+    (None, None),
+    (0, None),
+    (-5.0, None),
+    (np.nan, None),
+    (np.inf, None),
+    (30, 30.0),
+    (12.5, 12.5),
+])
+def test_config_max_fps(max_fps, expected):
+    config = ExPlotWidgetConfig(max_fps=max_fps)
+    assert config.max_fps == expected
+    config = ExPlotWidgetConfig()
+    config.max_fps = max_fps
+    assert config.max_fps == expected
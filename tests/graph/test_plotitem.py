@@ -198,6 +198,82 @@ def _resume_to_orig_range(plot_item: accgraph.ExPlotItem, reset_operation: Resum
         raise ValueError(f"{reset_operation} is not a known operation for resetting the view range in the plot.")
 
 
+@pytest.mark.parametrize("max_fps", [None, 10.0])
+def test_max_fps_combines_item_updates(qtbot, max_fps):
+    """Check that a frame rate limit combines all updates until the next frame"""
+    plot_config = accgraph.ExPlotWidgetConfig(
+        plotting_style=accgraph.PlotWidgetStyle.SCROLLING_PLOT,
+        time_span=accgraph.TimeSpan(left=10.0),
+        max_fps=max_fps,
+    )
+    window = PlotWidgetTestWindow(plot_config, item_to_add=accgraph.LivePlotCurve)
+    window.show()
+    qtbot.addWidget(window)
+    curve = window.plot.plotItem.live_curves[0]
+    update_count = 0
+    original_update_item = curve.update_item
+
+    def counting_update_item():
+        nonlocal update_count
+        update_count += 1
+        original_update_item()
+
+    curve.update_item = counting_update_item
+    for timestamp in range(5):
+        window.data_source_mock.create_new_value(float(timestamp), 1.0)
+        window.time_source_mock.create_new_value(float(timestamp))
+    if max_fps is None:
+        assert update_count == 10
+    else:
+        assert update_count == 0
+        qtbot.waitUntil(lambda: update_count == 1, timeout=1000)
+        window.time_source_mock.create_new_value(5.0)
+        window.time_source_mock.create_new_value(6.0)
+        qtbot.wait(50)
+        assert update_count == 1
+        qtbot.waitUntil(lambda: update_count == 2, timeout=1000)
+        assert np.array_equal(curve._data_item_data.x, np.arange(5.0))
+
+
+@pytest.mark.parametrize("max_fps", [None, 10.0])
+def test_only_outdated_items_are_redrawn(qtbot, max_fps):
+    """Check that only items with changed data or a moved window are redrawn"""
+    plot_config = accgraph.ExPlotWidgetConfig(
+        plotting_style=accgraph.PlotWidgetStyle.SCROLLING_PLOT,
+        time_span=accgraph.TimeSpan(left=10.0),
+        max_fps=max_fps,
+    )
+    window = PlotWidgetTestWindow(plot_config, item_to_add=accgraph.LivePlotCurve)
+    window.show()
+    qtbot.addWidget(window)
+    source = accgraph.UpdateSource()
+    window.plot.addCurve(data_source=source)
+    curves = window.plot.plotItem.live_curves
+    update_counts = [0, 0]
+
+    def counting_update_item(index, original_update_item):
+        def update_item():
+            update_counts[index] += 1
+            original_update_item()
+        return update_item
+
+    for i, curve in enumerate(curves):
+        curve.update_item = counting_update_item(i, curve.update_item)
+    window.time_source_mock.create_new_value(1.0)
+    qtbot.waitUntil(lambda: update_counts == [1, 1], timeout=1000)
+    # Same timestamp -> the visible window has not moved
+    window.time_source_mock.create_new_value(1.0)
+    qtbot.wait(150)
+    assert update_counts == [1, 1]
+    source.sig_new_data.emit(accgraph.PointData(0.5, 1.0))
+    qtbot.waitUntil(lambda: update_counts == [1, 2], timeout=1000)
+    qtbot.wait(150)
+    assert update_counts == [1, 2]
+    assert np.array_equal(curves[1]._data_item_data.x, [0.5])
+    window.time_source_mock.create_new_value(2.0)
+    qtbot.waitUntil(lambda: update_counts == [2, 3], timeout=1000)
+
+
 def _prepare_cyclic_plot_test_window(qtbot, time_span: accgraph.TimeSpan, should_create_timing_source: bool = True):
     """
     Prepare a window for testing
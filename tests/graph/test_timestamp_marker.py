@@ -0,0 +1,125 @@
+import numpy as np
+
+from accwidgets.graph import (
+    ExPlotWidgetConfig,
+    PlotWidgetStyle,
+    StaticTimestampMarker,
+    TimestampMarkerCollectionData,
+    UpdateSource,
+)
+
+from .mock_utils.widget_test_window import MinimalTestWindow
+
+
+def test_static_timestamp_marker_reuses_lines(qtbot):
+    """Check that lines are only created if more markers are displayed than ever before"""
+    window = MinimalTestWindow(plot_config=ExPlotWidgetConfig(plotting_style=PlotWidgetStyle.STATIC_PLOT))
+    window.show()
+    qtbot.addWidget(window)
+    source = UpdateSource()
+    item = window.plot.addTimestampMarker(data_source=source)
+    assert isinstance(item, StaticTimestampMarker)
+    source.sig_new_data[TimestampMarkerCollectionData].emit(
+        TimestampMarkerCollectionData(x=[1.0, 2.0, 3.0], colors=["r", "g", "b"], labels=["1", "2", "3"]),
+    )
+    lines = list(item._line_elements)
+    assert [line.value() for line in lines] == [1.0, 2.0, 3.0]
+    source.sig_new_data[TimestampMarkerCollectionData].emit(
+        TimestampMarkerCollectionData(x=[2.0, 3.0, 4.0], colors=["g", "r", "w"], labels=["2", "3", "4"]),
+    )
+    assert item._line_elements == lines
+    assert [line.value() for line in lines] == [4.0, 2.0, 3.0]
+    assert [line.label.format for line in lines] == ["4", "2", "3"]
+    assert lines[0].label.textItem.toPlainText() == "4"
+    assert [line.pen.color().name() for line in lines] == ["#ffffff", "#00ff00", "#ff0000"]
+    source.sig_new_data[TimestampMarkerCollectionData].emit(
+        TimestampMarkerCollectionData(x=[4.0], colors=["w"], labels=["4"]),
+    )
+    assert item._line_elements == lines
+    assert [line.isVisible() for line in lines] == [True, False, False]
+    source.sig_new_data[TimestampMarkerCollectionData].emit(
+        TimestampMarkerCollectionData(x=[0.0, 4.0, 4.0, 5.0], colors=["w"] * 4, labels=["a", "b", "c", "d"]),
+    )
+    assert item._line_elements[:3] == lines
+    assert len(item._line_elements) == 4
+    assert all(line.isVisible() for line in item._line_elements)
+    assert sorted(line.label.textItem.toPlainText() for line in item._line_elements) == ["a", "b", "c", "d"]
+    assert sorted(line.value() for line in item._line_elements) == [0.0, 4.0, 4.0, 5.0]
+    assert np.array_equal(np.sort(item._lines_x), [0.0, 4.0, 4.0, 5.0])
+
+
+def test_timestamp_marker_hides_overlapping_labels(qtbot):
+    """Check that only labels not overlapping labels further right are displayed"""
+    window = MinimalTestWindow(plot_config=ExPlotWidgetConfig(plotting_style=PlotWidgetStyle.STATIC_PLOT))
+    window.show()
+    qtbot.addWidget(window)
+    source = UpdateSource()
+    item = window.plot.addTimestampMarker(data_source=source)
+    view_box = item.getViewBox()
+    view_box.setXRange(0.0, 100.0, padding=0.0)
+    source.sig_new_data[TimestampMarkerCollectionData].emit(
+        TimestampMarkerCollectionData(x=[10.0, 10.1, 10.2, 50.0], colors=["r"] * 4, labels=["a", "b", "c", "d"]),
+    )
+    assert [line.label.isVisible() for line in item._line_elements] == [False, False, True, True]
+    view_box.setXRange(10.0, 10.3, padding=0.0)
+    assert [line.label.isVisible() for line in item._line_elements] == [True, True, True, True]
+    assert [line.label.textItem.toPlainText() for line in item._line_elements] == ["a", "b", "c", "d"]
+
+
+def test_timestamp_marker_aggregates_dense_markers(qtbot):
+    """Check that markers are aggregated if more markers per pixel than the threshold are visible"""
+    window = MinimalTestWindow(plot_config=ExPlotWidgetConfig(plotting_style=PlotWidgetStyle.STATIC_PLOT))
+    window.show()
+    qtbot.addWidget(window)
+    source = UpdateSource()
+    item = window.plot.addTimestampMarker(data_source=source)
+    view_box = item.getViewBox()
+    pixels = view_box.width()
+    view_box.setXRange(0.0, pixels, padding=0.0)
+    x = np.arange(0.0, 2.0, 0.01)
+    x = np.concatenate((x, x + 100.0, x + 200.0))
+    data = TimestampMarkerCollectionData(x=x, colors=["r"] * x.size, labels=["m"] * x.size)
+    # Markers are not aggregated by default
+    source.sig_new_data[TimestampMarkerCollectionData].emit(data)
+    assert np.isnan(item._lines_x).sum() == 0
+    item.opts["aggregation_threshold"] = 0.5
+    source.sig_new_data[TimestampMarkerCollectionData].emit(data)
+    # 600 markers on less than 1200 pixels, one line per bucket of 2 pixels
+    displayed = np.sort(item._lines_x[~np.isnan(item._lines_x)])
+    assert np.allclose(displayed, [1.99, 101.99, 201.99])
+    labels = [line.label.format for line in item._line_elements if line.isVisible()]
+    assert labels == ["200 markers"] * 3
+    view_box.setXRange(100.0, 102.0, padding=0.0)
+    displayed = np.sort(item._lines_x[~np.isnan(item._lines_x)])
+    assert np.array_equal(displayed, x)
+    item.opts["aggregation_threshold"] = None
+    view_box.setXRange(0.0, pixels, padding=0.0)
+    assert np.isnan(item._lines_x).sum() == 0
+
+
+def test_timestamp_marker_removes_surplus_lines(qtbot):
+    """Check that hidden lines beyond twice the displayed markers are removed from the pool"""
+    window = MinimalTestWindow(plot_config=ExPlotWidgetConfig(plotting_style=PlotWidgetStyle.STATIC_PLOT))
+    window.show()
+    qtbot.addWidget(window)
+    source = UpdateSource()
+    item = window.plot.addTimestampMarker(data_source=source)
+    x = np.arange(100.0)
+    source.sig_new_data[TimestampMarkerCollectionData].emit(
+        TimestampMarkerCollectionData(x=x, colors=["r"] * x.size, labels=["m"] * x.size),
+    )
+    assert len(item._line_elements) == 100
+    removed = item._line_elements[:96]
+    source.sig_new_data[TimestampMarkerCollectionData].emit(
+        TimestampMarkerCollectionData(x=[96.0, 97.0, 98.0, 99.0], colors=["r"] * 4, labels=["m"] * 4),
+    )
+    assert len(item._line_elements) == 32
+    assert item._lines_label_visible.size == 32
+    assert all(line.scene() is None for line in removed[-68:])
+    displayed = [line for line in item._line_elements if line.isVisible()]
+    assert sorted(line.value() for line in displayed) == [96.0, 97.0, 98.0, 99.0]
+    assert np.array_equal(np.sort(item._lines_x[~np.isnan(item._lines_x)]), [96.0, 97.0, 98.0, 99.0])
+    assert not item._line_elements[0].isVisible()
+    first_displayed = item._line_elements[int(np.flatnonzero(~np.isnan(item._lines_x))[0])]
+    assert first_displayed.isVisible()
+    assert item.boundingRect() == first_displayed.boundingRect()
@@ -1,5 +1,6 @@
 import pytest
-from accwidgets.graph.util import deprecated_param_alias
+import numpy as np
+from accwidgets.graph.util import deprecated_param_alias, match_pooled_positions, declutter_labels
 
 
 @pytest.fixture
@@ -42,3 +43,50 @@ def test_fn_arg_deprecations(recwarn, args, kwargs, expected_warnings, deprecate
 def test_fn_arg_deprecation_exc(deprecated_fn):
     with pytest.raises(TypeError, match="'fn' received both 'a2' and 'b2'"):
         deprecated_fn(a1=1, a2=2, b2=2, a3=3)
+
+
+@pytest.mark.parametrize("pool_x, x, expected_indices, expected_found, expected_unused", [
+    ([], [], [], [], []),
+    ([], [1.0, 2.0], [0, 1], [False, False], []),
+    ([1.0, 2.0, 3.0], [2.0, 3.0, 4.0], [1, 2, 0], [True, True, False], []),
+    ([1.0, 2.0, 3.0], [3.0], [2], [True], [0, 1]),
+    ([np.nan, 2.0], [2.0, 2.0, 5.0], [1, 0, 2], [True, False, False], []),
+    ([2.0, 2.0, np.nan], [2.0, 2.0], [0, 1], [True, True], [2]),
+])
+def test_match_pooled_positions(pool_x, x, expected_indices, expected_found, expected_unused):
+    indices, found, unused = match_pooled_positions(pool_x=np.array(pool_x), x=np.array(x))
+    assert np.array_equal(indices, expected_indices)
+    assert np.array_equal(found, expected_found)
+    assert np.array_equal(unused, expected_unused)
+
+
+@pytest.mark.parametrize("x, widths, y, heights, expected", [
+    ([], [], None, None, []),
+    ([0.0, 5.0, 10.0], [4.0, 4.0, 4.0], None, None, [True, True, True]),
+    ([0.0, 3.0, 6.0], [4.0, 4.0, 4.0], None, None, [True, False, True]),
+    ([0.0, 3.0, 6.0], [4.0, 4.0, 8.0], None, None, [True, False, True]),
+    ([6.0, 3.0, 0.0], [4.0, 4.0, 4.0], None, None, [True, False, True]),
+    ([0.0, 1.0, np.nan], [4.0, 4.0, 4.0], None, None, [False, True, False]),
+    ([0.0, 100.0, 101.0], [200.0, 1.0, 1.0], None, None, [False, True, True]),
+    ([0.0, 3.0, 6.0], [4.0, 4.0, 4.0], [0.0, 10.0, 0.0], [2.0, 2.0, 2.0], [True, True, True]),
+    ([0.0, 3.0, 6.0], [4.0, 4.0, 4.0], [0.0, 1.0, 0.0], [2.0, 2.0, 2.0], [True, False, True]),
+    ([5.0, 5.5, 5.9], [4.0, 4.0, 4.0], None, None, [False, False, True]),
+    ([0.0, 0.5], [4.0, 4.0], [np.nan, 0.0], [2.0, 2.0], [True, True]),
+])
+def test_declutter_labels(x, widths, y, heights, expected):
+    visible = declutter_labels(
+        x=np.array(x),
+        widths=np.array(widths),
+        y=None if y is None else np.array(y),
+        heights=None if heights is None else np.array(heights),
+    )
+    assert np.array_equal(visible, expected)
+
+
+def test_declutter_dense_labels():
+    """Check that dense labels, which are bucketed per pixel, are still spread over the available space"""
+    x = np.linspace(0.0, 99.99, 10_000)
+    visible = declutter_labels(x=x, widths=np.full(x.size, 10.0))
+    assert visible[-1]
+    assert np.count_nonzero(visible) == 10
+    assert np.all(np.diff(x[visible]) >= 10.0 - 1e-9)